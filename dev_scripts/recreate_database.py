@@ -14,14 +14,15 @@ import os
 import sys
 import argparse
 import psycopg2
-from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT
-from dotenv import load_dotenv
+
+from src.config import load_env
+from src.utils import schema_path, iter_statements, execute_statements
 
 
 def main():
     """Recreate api_auth_admin database tables"""
     # Load environment variables from .env file
-    load_dotenv()
+    load_env()
 
     parser = argparse.ArgumentParser(description='Recreate API_AUTH_ADMIN database tables')
     parser.add_argument('--test-db', action='store_true',
@@ -66,32 +67,31 @@ def main():
             user=api_auth_admin_user,
             password=api_auth_admin_password
         )
-        conn.set_isolation_level(ISOLATION_LEVEL_AUTOCOMMIT)
+        conn.autocommit = True
 
         with conn.cursor() as cursor:
-            # Drop all tables in correct order (respecting foreign keys)
+            # Drop all tables in a single statement (CASCADE handles foreign keys)
+            # and ensure the schema's extension in the same round-trip
             print("\nDropping existing tables...")
-            cursor.execute("DROP TABLE IF EXISTS client_permissions CASCADE")
+            cursor.execute("""
+                DROP TABLE IF EXISTS client_permissions, clients, routes CASCADE;
+                CREATE EXTENSION IF NOT EXISTS pgcrypto
+            """)
             print("✓ Dropped client_permissions")
-            cursor.execute("DROP TABLE IF EXISTS clients CASCADE")
             print("✓ Dropped clients")
-            cursor.execute("DROP TABLE IF EXISTS routes CASCADE")
             print("✓ Dropped routes")
 
             # Get schema file path
-            repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-            schema_path = os.path.join(repo_root, 'src', 'database', 'schema.sql')
-            if not os.path.exists(schema_path):
-                print(f"Error: schema file not found at {schema_path}")
+            try:
+                path = schema_path()
+            except FileNotFoundError as e:
+                print(f"Error: {e}")
                 sys.exit(1)
 
-            # Read and apply schema
-            with open(schema_path, 'r', encoding='utf-8') as f:
-                schema_sql = f.read()
-
+            # Stream and apply schema one statement at a time
             print("\nApplying updated schema...")
-            cursor.execute("CREATE EXTENSION IF NOT EXISTS pgcrypto")
-            cursor.execute(schema_sql)
+            with open(path, 'r', encoding='utf-8') as f:
+                execute_statements(cursor, iter_statements(f))
             print("✓ Schema applied")
 
             # Verify tables were created
@@ -116,6 +116,8 @@ def main():
 
     except psycopg2.Error as e:
         print(f"Error: {e}")
+        if e.cursor is not None and e.cursor.query:
+            print(f"Failed statement:\n{e.cursor.query.decode('utf-8')}")
         sys.exit(1)
     except Exception as e:
         print(f"Unexpected error: {e}")
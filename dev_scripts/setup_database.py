@@ -13,14 +13,16 @@ import os
 import sys
 import argparse
 import psycopg2
-from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT
-from dotenv import load_dotenv
+from psycopg2 import sql
+
+from src.config import load_env
+from src.utils import schema_path, iter_statements, execute_statements
 
 
 def main():
     """Setup api_auth_admin database and user"""
     # Load environment variables from .env file
-    load_dotenv()
+    load_env()
 
     parser = argparse.ArgumentParser(description='Setup API_AUTH_ADMIN database')
     parser.add_argument('--test-db', action='store_true',
@@ -60,21 +62,46 @@ def main():
             user=pg_user,
             password=pg_password
         )
-        conn.set_isolation_level(ISOLATION_LEVEL_AUTOCOMMIT)
+        conn.autocommit = True
 
         with conn.cursor() as cursor:
-            cursor.execute("SELECT 1 FROM pg_roles WHERE rolname = %s", (api_auth_admin_user,))
-            if not cursor.fetchone():
-                print(f"Creating user '{api_auth_admin_user}'...")
-                cursor.execute(f"CREATE USER {api_auth_admin_user} WITH PASSWORD %s", (api_auth_admin_password,))
+            # Create the user server-side if missing and probe for the database
+            # in one round-trip. Only the last statement's rows come back, so
+            # the DO block records whether it created the user in a session
+            # setting that the final SELECT returns. CREATE DATABASE cannot run
+            # inside a DO block.
+            cursor.execute(sql.SQL("""
+                DO $setup$
+                BEGIN
+                    IF NOT EXISTS (SELECT 1 FROM pg_roles WHERE rolname = {user}) THEN
+                        EXECUTE format('CREATE USER %I WITH PASSWORD %L', {user}, {password});
+                        PERFORM set_config('api_gatekeeper.user_created', 'true', false);
+                    ELSE
+                        PERFORM set_config('api_gatekeeper.user_created', 'false', false);
+                    END IF;
+                END
+                $setup$;
+                SELECT
+                    current_setting('api_gatekeeper.user_created')::boolean,
+                    EXISTS (SELECT 1 FROM pg_database WHERE datname = {database})
+            """).format(
+                user=sql.Literal(api_auth_admin_user),
+                password=sql.Literal(api_auth_admin_password),
+                database=sql.Literal(api_auth_admin_db)
+            ))
+            user_created, db_exists = cursor.fetchone()
+
+            if user_created:
                 print(f"✓ User '{api_auth_admin_user}' created")
             else:
                 print(f"✓ User '{api_auth_admin_user}' already exists")
 
-            cursor.execute("SELECT 1 FROM pg_database WHERE datname = %s", (api_auth_admin_db,))
-            if not cursor.fetchone():
+            if not db_exists:
                 print(f"Creating database '{api_auth_admin_db}'...")
-                cursor.execute(f"CREATE DATABASE {api_auth_admin_db} OWNER {api_auth_admin_user}")
+                cursor.execute(sql.SQL("CREATE DATABASE {} OWNER {}").format(
+                    sql.Identifier(api_auth_admin_db),
+                    sql.Identifier(api_auth_admin_user)
+                ))
                 print(f"✓ Database '{api_auth_admin_db}' created")
             else:
                 print(f"✓ Database '{api_auth_admin_db}' already exists")
@@ -93,22 +120,20 @@ def main():
             user=api_auth_admin_user,
             password=api_auth_admin_password
         )
-        api_auth_admin_conn.set_isolation_level(ISOLATION_LEVEL_AUTOCOMMIT)
+        api_auth_admin_conn.autocommit = True
 
-        repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        schema_path = os.path.join(repo_root, 'src', 'database', 'schema.sql')
-        if not os.path.exists(schema_path):
-            print(f"Error: schema file not found at {schema_path}")
+        try:
+            path = schema_path()
+        except FileNotFoundError as e:
+            print(f"Error: {e}")
             sys.exit(1)
 
-        with open(schema_path, 'r', encoding='utf-8') as f:
-            schema_sql = f.read()
-
         with api_auth_admin_conn.cursor() as cursor:
             print("Ensuring required extensions...")
             cursor.execute("CREATE EXTENSION IF NOT EXISTS pgcrypto")
-            print(f"Applying schema from {schema_path}...")
-            cursor.execute(schema_sql)
+            print(f"Applying schema from {path}...")
+            with open(path, 'r', encoding='utf-8') as f:
+                execute_statements(cursor, iter_statements(f))
             print("✓ Schema applied")
 
         api_auth_admin_conn.close()
@@ -119,6 +144,8 @@ def main():
 
     except psycopg2.Error as e:
         print(f"Error: {e}")
+        if e.cursor is not None and e.cursor.query:
+            print(f"Failed statement:\n{e.cursor.query.decode('utf-8')}")
         sys.exit(1)
     except Exception as e:
         print(f"Unexpected error: {e}")
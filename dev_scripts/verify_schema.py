@@ -2,50 +2,54 @@
 """
 Quick script to verify database schema.
 """
-import sys
-sys.path.insert(0, '/Users/jason/Sync/code/Personal/api-gatekeeper')
-
 from src.utils import get_db_connection
 
+# Tables whose columns are listed, with their display titles
+COLUMN_TABLES = {
+    'clients': 'Clients',
+    'client_permissions': 'Client Permissions',
+}
+
 db = get_db_connection(verbose=False)
 
 with db.get_cursor(commit=False) as cursor:
-    # Get all tables
+    # Fetch the table list and column details in one round-trip, reading
+    # pg_catalog directly rather than the much slower information_schema views
     cursor.execute("""
-        SELECT tablename
+        SELECT 'table' AS kind, tablename AS table_name, 0 AS position,
+               NULL AS column_name, NULL AS data_type, NULL::boolean AS not_null
         FROM pg_tables
         WHERE schemaname = 'public'
-        ORDER BY tablename
-    """)
-    tables = cursor.fetchall()
+        UNION ALL
+        SELECT 'column', c.relname, a.attnum,
+               a.attname, format_type(a.atttypid, a.atttypmod), a.attnotnull
+        FROM pg_attribute a
+        JOIN pg_class c ON c.oid = a.attrelid
+        JOIN pg_namespace n ON n.oid = c.relnamespace
+        WHERE n.nspname = 'public'
+        AND c.relname = ANY(%s)
+        AND a.attnum > 0
+        AND NOT a.attisdropped
+        ORDER BY table_name, position
+    """, (list(COLUMN_TABLES),))
+
+    tables = []
+    columns = {table_name: [] for table_name in COLUMN_TABLES}
+    for kind, table_name, _, column_name, data_type, not_null in cursor.fetchall():
+        if kind == 'table':
+            tables.append(table_name)
+        else:
+            columns[table_name].append((column_name, data_type, not_null))
 
     print("Tables in database:")
     for table in tables:
-        print(f"  - {table[0]}")
+        print(f"  - {table}")
 
-    # Get column info for clients table
-    cursor.execute("""
-        SELECT column_name, data_type, is_nullable
-        FROM information_schema.columns
-        WHERE table_name = 'clients'
-        ORDER BY ordinal_position
-    """)
-    print("\nClients table columns:")
-    for col in cursor.fetchall():
-        nullable = "NULL" if col[2] == 'YES' else "NOT NULL"
-        print(f"  - {col[0]} ({col[1]}) {nullable}")
-
-    # Get column info for client_permissions table
-    cursor.execute("""
-        SELECT column_name, data_type, is_nullable
-        FROM information_schema.columns
-        WHERE table_name = 'client_permissions'
-        ORDER BY ordinal_position
-    """)
-    print("\nClient Permissions table columns:")
-    for col in cursor.fetchall():
-        nullable = "NULL" if col[2] == 'YES' else "NOT NULL"
-        print(f"  - {col[0]} ({col[1]}) {nullable}")
+    for table_name, title in COLUMN_TABLES.items():
+        print(f"\n{title} table columns:")
+        for column_name, data_type, not_null in columns[table_name]:
+            nullable = "NOT NULL" if not_null else "NULL"
+            print(f"  - {column_name} ({data_type}) {nullable}")
 
 db.close()
 print("\n✓ Schema verification complete")
@@ -7,74 +7,46 @@ Usage:
 """
 
 import sys
+import base64
 import secrets
-from dotenv import load_dotenv
 
-from src.utils import get_db_connection
-from src.models.client import Client, ClientStatus
+from src.config import load_env
+from src.prompts import get_input, get_yes_no, get_choice
 
+# Random bytes per generated credential (matches secrets.token_urlsafe(32))
+TOKEN_BYTES = 32
 
-def get_input(prompt: str, default: str = None) -> str:
-    """Get user input with optional default value."""
-    if default:
-        prompt = f"{prompt} [{default}]: "
-    else:
-        prompt = f"{prompt}: "
 
-    value = input(prompt).strip()
-    if not value and default:
-        return default
-    return value
+def generate_tokens(count: int) -> list:
+    """
+    Generate secure random URL-safe tokens from a single entropy read.
 
+    Args:
+        count: Number of tokens to generate
 
-def get_yes_no(prompt: str, default: bool = False) -> bool:
-    """Get yes/no input from user."""
-    default_str = "Y/n" if default else "y/N"
-    response = input(f"{prompt} [{default_str}]: ").strip().lower()
-
-    if not response:
-        return default
-    return response in ['y', 'yes']
-
-
-def get_choice(prompt: str, choices: list, default: str = None) -> str:
-    """Get a choice from a list of options."""
-    print(f"\n{prompt}")
-    for i, choice in enumerate(choices, 1):
-        print(f"  {i}. {choice}")
-
-    while True:
-        if default:
-            response = input(f"Enter choice (1-{len(choices)}) [{default}]: ").strip()
-        else:
-            response = input(f"Enter choice (1-{len(choices)}): ").strip()
-
-        if not response and default:
-            return default
-
-        try:
-            idx = int(response) - 1
-            if 0 <= idx < len(choices):
-                return choices[idx]
-        except ValueError:
-            pass
-
-        print(f"Invalid choice. Please enter a number between 1 and {len(choices)}")
+    Returns:
+        List of tokens in the same format as secrets.token_urlsafe(TOKEN_BYTES)
+    """
+    raw = secrets.token_bytes(TOKEN_BYTES * count)
+    return [
+        base64.urlsafe_b64encode(raw[i:i + TOKEN_BYTES]).rstrip(b'=').decode('ascii')
+        for i in range(0, len(raw), TOKEN_BYTES)
+    ]
 
 
 def generate_api_key() -> str:
     """Generate a secure random API key."""
-    return secrets.token_urlsafe(32)
+    return secrets.token_urlsafe(TOKEN_BYTES)
 
 
 def generate_shared_secret() -> str:
     """Generate a secure random shared secret."""
-    return secrets.token_urlsafe(32)
+    return secrets.token_urlsafe(TOKEN_BYTES)
 
 
 def main():
     """Main function to create a client."""
-    load_dotenv()
+    load_env()
 
     print("=" * 60)
     print("Create New API Client")
@@ -102,9 +74,11 @@ def main():
         print("\nError: Client must have at least one credential type")
         sys.exit(1)
 
-    # Generate credentials
+    # Collect custom credentials; the rest are generated together below
     api_key = None
     shared_secret = None
+    generate_key = False
+    generate_secret = False
 
     if use_api_key:
         if get_yes_no("\nProvide custom API key?", default=False):
@@ -113,8 +87,7 @@ def main():
                 print("Error: API key cannot be empty if provided")
                 sys.exit(1)
         else:
-            api_key = generate_api_key()
-            print(f"Generated API key: {api_key}")
+            generate_key = True
 
     if use_shared_secret:
         if get_yes_no("\nProvide custom shared secret?", default=False):
@@ -123,8 +96,20 @@ def main():
                 print("Error: Shared secret cannot be empty if provided")
                 sys.exit(1)
         else:
-            shared_secret = generate_shared_secret()
-            print(f"Generated shared secret: {shared_secret}")
+            generate_secret = True
+
+    # Generate credentials
+    if generate_key and generate_secret:
+        api_key, shared_secret = generate_tokens(2)
+    elif generate_key:
+        api_key = generate_api_key()
+    elif generate_secret:
+        shared_secret = generate_shared_secret()
+
+    if generate_key:
+        print(f"Generated API key: {api_key}")
+    if generate_secret:
+        print(f"Generated shared secret: {shared_secret}")
 
     # Get client status
     print("\n" + "=" * 60)
@@ -135,6 +120,12 @@ def main():
         ["active", "suspended", "revoked"],
         default="active"
     )
+
+    # Imported here so the prompts above appear without waiting on the
+    # database driver and models to load
+    from src.utils import get_db_connection
+    from src.models.client import Client, ClientStatus
+
     status = ClientStatus(status_str)
 
     # Create client
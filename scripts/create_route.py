@@ -7,59 +7,18 @@ Usage:
 """
 
 import sys
-from dotenv import load_dotenv
 
-from src.utils import get_db_connection
+from src.config import load_env
+from src.prompts import get_input, get_yes_no, get_choice
 from src.models.route import Route, HttpMethod
 from src.models.method_auth import MethodAuth, AuthType
 
 
-def get_input(prompt: str, default: str = None) -> str:
-    """Get user input with optional default value."""
-    if default:
-        prompt = f"{prompt} [{default}]: "
-    else:
-        prompt = f"{prompt}: "
+# HTTP methods keyed by name, in enum order, for mapping prompts back to members
+_METHOD_BY_VALUE = {m.value: m for m in HttpMethod}
 
-    value = input(prompt).strip()
-    if not value and default:
-        return default
-    return value
-
-
-def get_yes_no(prompt: str, default: bool = False) -> bool:
-    """Get yes/no input from user."""
-    default_str = "Y/n" if default else "y/N"
-    response = input(f"{prompt} [{default_str}]: ").strip().lower()
-
-    if not response:
-        return default
-    return response in ['y', 'yes']
-
-
-def get_choice(prompt: str, choices: list, default: str = None) -> str:
-    """Get a choice from a list of options."""
-    print(f"\n{prompt}")
-    for i, choice in enumerate(choices, 1):
-        print(f"  {i}. {choice}")
-
-    while True:
-        if default:
-            response = input(f"Enter choice (1-{len(choices)}) [{default}]: ").strip()
-        else:
-            response = input(f"Enter choice (1-{len(choices)}): ").strip()
-
-        if not response and default:
-            return default
-
-        try:
-            idx = int(response) - 1
-            if 0 <= idx < len(choices):
-                return choices[idx]
-        except ValueError:
-            pass
-
-        print(f"Invalid choice. Please enter a number between 1 and {len(choices)}")
+# HTTP method names offered for configuration, in enum order
+AVAILABLE_METHODS = list(_METHOD_BY_VALUE)
 
 
 def configure_method_auth() -> MethodAuth:
@@ -80,7 +39,8 @@ def configure_method_auth() -> MethodAuth:
 
 def main():
     """Main function to create a route interactively."""
-    load_dotenv()
+    load_env()
+    from src.utils import get_db_connection
 
     print("=" * 60)
     print("Create New Route")
@@ -122,17 +82,16 @@ def main():
     print("HTTP Method Configuration")
     print("=" * 60)
 
-    available_methods = [m.value for m in HttpMethod]
     methods = {}
 
     print("\nConfigure authentication for each HTTP method.")
     print("Press Enter to skip a method.\n")
 
-    for method_name in available_methods:
+    for method_name in AVAILABLE_METHODS:
         if get_yes_no(f"Configure {method_name}?", default=(method_name in ['GET', 'POST'])):
             print(f"\n  Configuring {method_name}:")
             method_auth = configure_method_auth()
-            methods[HttpMethod(method_name)] = method_auth
+            methods[_METHOD_BY_VALUE[method_name]] = method_auth
 
             if method_auth.auth_required:
                 print(f"  ✓ {method_name} requires {method_auth.auth_type.value} authentication")
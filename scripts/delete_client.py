@@ -8,12 +8,14 @@ Usage:
 """
 
 import sys
-from dotenv import load_dotenv
+import argparse
 
-from src.utils import get_db_connection
+from src.config import load_env
+from src.prompts import narrow_by_prefix
+from src.models.route import format_methods
 
 
-def confirm_deletion(client) -> bool:
+def confirm_deletion(client, db) -> bool:
     """Ask user to confirm deletion."""
     print("\n" + "=" * 80)
     print("WARNING: You are about to delete this client")
@@ -21,35 +23,33 @@ def confirm_deletion(client) -> bool:
     print(f"Client ID: {client.client_id}")
     print(f"Name: {client.client_name}")
     if client.api_key:
-        print(f"API Key: {client.api_key[:8]}...")
+        print(f"API Key: {client.api_key_short}")
     if client.shared_secret:
-        print(f"Shared Secret: {client.shared_secret[:8]}...")
+        print(f"Shared Secret: {client.shared_secret_short}")
     print(f"Status: {client.status.value}")
 
     # Check if client has permissions
-    db = get_db_connection(verbose=False)
-    try:
-        permissions = db.load_permissions_by_client(client.client_id)
-        if permissions:
-            print(f"\n⚠ This client has {len(permissions)} permission(s) that will also be deleted.")
-            print("Associated routes:")
-            for perm in permissions:
-                route = db.load_route_by_id(perm.route_id)
-                if route:
-                    methods_str = ", ".join([m.value for m in perm.allowed_methods])
-                    print(f"  - {route.route_pattern} ({methods_str})")
-    finally:
-        db.close()
+    permissions = db.load_permissions_by_client(client.client_id)
+    if permissions:
+        routes_by_id = {
+            route.route_id: route
+            for route in db.load_routes_by_ids({perm.route_id for perm in permissions})
+        }
+        print(f"\n⚠ This client has {len(permissions)} permission(s) that will also be deleted.")
+        print("Associated routes:")
+        for perm in permissions:
+            route = routes_by_id.get(perm.route_id)
+            if route:
+                methods_str = format_methods(perm.allowed_methods)
+                print(f"  - {route.route_pattern} ({methods_str})")
 
     print("\n" + "=" * 80)
     response = input("Type 'delete' to confirm deletion: ").strip()
     return response == 'delete'
 
 
-def delete_client_by_id(client_id: str) -> bool:
+def delete_client_by_id(db, client_id: str) -> bool:
     """Delete a client by its ID."""
-    db = get_db_connection(verbose=False)
-
     try:
         # Load client to show info
         client = db.load_client_by_id(client_id)
@@ -59,7 +59,7 @@ def delete_client_by_id(client_id: str) -> bool:
             return False
 
         # Confirm deletion
-        if not confirm_deletion(client):
+        if not confirm_deletion(client, db):
             print("Deletion cancelled.")
             return False
 
@@ -76,14 +76,10 @@ def delete_client_by_id(client_id: str) -> bool:
     except Exception as e:
         print(f"\n✗ Error deleting client: {e}")
         return False
-    finally:
-        db.close()
 
 
-def interactive_delete():
+def interactive_delete(db):
     """Interactive mode to select and delete a client."""
-    db = get_db_connection(verbose=False)
-
     try:
         clients = db.load_all_clients()
 
@@ -91,16 +87,18 @@ def interactive_delete():
             print("No clients found.")
             return
 
+        clients = narrow_by_prefix(clients, lambda c: c.client_name, "clients")
+
         print("\n" + "=" * 80)
         print("Select a client to delete")
         print("=" * 80)
 
+        lines = []
         for i, client in enumerate(clients, 1):
-            api_key_display = f"{client.api_key[:8]}..." if client.api_key else "None"
-            secret_display = f"{client.shared_secret[:8]}..." if client.shared_secret else "None"
-            print(f"{i:2}. {client.client_name:<30} (API: {api_key_display}, Secret: {secret_display}, {client.status.value})")
-
-        print(f" 0. Cancel")
+            lines.append(f"{i:2}. {client.client_name:<30} (API: {client.api_key_short}, Secret: {client.shared_secret_short}, {client.status.value})")
+        lines.append(" 0. Cancel")
+        sys.stdout.write("\n".join(lines))
+        sys.stdout.write("\n")
 
         while True:
             try:
@@ -113,7 +111,7 @@ def interactive_delete():
 
                 if 1 <= idx <= len(clients):
                     selected_client = clients[idx - 1]
-                    delete_client_by_id(selected_client.client_id)
+                    delete_client_by_id(db, selected_client.client_id)
                     return
 
                 print(f"Invalid choice. Please enter a number between 0 and {len(clients)}")
@@ -122,21 +120,24 @@ def interactive_delete():
 
     except Exception as e:
         print(f"\n✗ Error: {e}")
-    finally:
-        db.close()
 
 
 def main():
     """Main function."""
-    load_dotenv()
-
-    if len(sys.argv) > 1:
-        # Client ID provided as argument
-        client_id = sys.argv[1]
-        delete_client_by_id(client_id)
-    else:
-        # Interactive mode
-        interactive_delete()
+    parser = argparse.ArgumentParser(description='Delete a client')
+    parser.add_argument('client_id', nargs='?',
+                        help='Client to delete (omit to choose interactively)')
+    args = parser.parse_args()
+
+    load_env()
+    from src.utils import db_session
+
+    with db_session(verbose=False) as db:
+        if args.client_id:
+            delete_client_by_id(db, args.client_id)
+        else:
+            # Interactive mode
+            interactive_delete(db)
 
 
 if __name__ == "__main__":
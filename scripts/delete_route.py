@@ -7,32 +7,25 @@ Usage:
 """
 
 import sys
-from dotenv import load_dotenv
+import argparse
 
-from src.utils import get_db_connection
-
-
-def get_yes_no(prompt: str, default: bool = False) -> bool:
-    """Get yes/no input from user."""
-    default_str = "Y/n" if default else "y/N"
-    response = input(f"{prompt} [{default_str}]: ").strip().lower()
-
-    if not response:
-        return default
-    return response in ['y', 'yes']
+from src.config import load_env
+from src.prompts import get_yes_no
 
 
 def main():
     """Main function to delete a route by UUID."""
-    load_dotenv()
+    parser = argparse.ArgumentParser(
+        description='Delete a route by UUID',
+        epilog='Example: python scripts/delete_route.py 86264801-5249-4839-bd45-c26679d12765'
+    )
+    parser.add_argument('route_id', help='UUID of the route to delete')
+    args = parser.parse_args()
 
-    if len(sys.argv) != 2:
-        print("Usage: python scripts/delete_route.py <route_id>")
-        print("\nExample:")
-        print("  python scripts/delete_route.py 86264801-5249-4839-bd45-c26679d12765")
-        sys.exit(1)
+    load_env()
+    from src.utils import get_db_connection
 
-    route_id = sys.argv[1]
+    route_id = args.route_id
 
     print("=" * 80)
     print("Delete Route")
@@ -8,11 +8,12 @@ Usage:
 """
 
 import sys
-from dotenv import load_dotenv
+import argparse
 
-from src.utils import get_db_connection
+from src.config import load_env
+from src.prompts import get_yes_no, narrow_by_prefix
 from src.models.client_permission import ClientPermission
-from src.models.route import HttpMethod
+from src.models.route import format_methods
 
 
 def get_choice(prompt: str, choices: list) -> int:
@@ -21,25 +22,14 @@ def get_choice(prompt: str, choices: list) -> int:
         try:
             choice = input(f"{prompt} (0 to cancel): ").strip()
             idx = int(choice)
-            if idx == 0:
-                return 0
-            if 1 <= idx <= len(choices):
+            # 0 cancels, so it is returned along with the valid selections
+            if 0 <= idx <= len(choices):
                 return idx
             print(f"Invalid choice. Please enter a number between 0 and {len(choices)}")
         except ValueError:
             print("Invalid input. Please enter a number.")
 
 
-def get_yes_no(prompt: str, default: bool = False) -> bool:
-    """Get yes/no input from user."""
-    default_str = "Y/n" if default else "y/N"
-    response = input(f"{prompt} [{default_str}]: ").strip().lower()
-
-    if not response:
-        return default
-    return response in ['y', 'yes']
-
-
 def select_client(db) -> str:
     """Interactive client selection."""
     clients = db.load_all_clients()
@@ -49,16 +39,21 @@ def select_client(db) -> str:
         print("  python scripts/create_client.py")
         return None
 
+    clients = narrow_by_prefix(clients, lambda c: c.client_name, "clients")
+
     print("\n" + "=" * 80)
     print("Select a client")
     print("=" * 80)
 
+    lines = []
     for i, client in enumerate(clients, 1):
         status_indicator = "✓" if client.is_active() else "✗"
-        api_key_display = f"API:{client.api_key[:8]}..." if client.api_key else ""
-        secret_display = f"HMAC:{client.shared_secret[:8]}..." if client.shared_secret else ""
+        api_key_display = f"API:{client.api_key_short}" if client.api_key else ""
+        secret_display = f"HMAC:{client.shared_secret_short}" if client.shared_secret else ""
         creds = ", ".join(filter(None, [api_key_display, secret_display]))
-        print(f"{i:2}. {status_indicator} {client.client_name:<30} ({creds})")
+        lines.append(f"{i:2}. {status_indicator} {client.client_name:<30} ({creds})")
+    sys.stdout.write("\n".join(lines))
+    sys.stdout.write("\n")
 
     choice = get_choice(f"\nSelect client (1-{len(clients)})", clients)
     if choice == 0:
@@ -76,13 +71,17 @@ def select_route(db) -> str:
         print("  python scripts/create_route.py")
         return None
 
+    routes = narrow_by_prefix(routes, lambda r: r.route_pattern, "routes")
+
     print("\n" + "=" * 80)
     print("Select a route")
     print("=" * 80)
 
+    lines = []
     for i, route in enumerate(routes, 1):
-        methods_str = ", ".join([m.value for m in route.methods.keys()])
-        print(f"{i:2}. {route.route_pattern:<30} [{route.service_name}] Methods: {methods_str}")
+        lines.append(f"{i:2}. {route.route_pattern:<30} [{route.service_name}] Methods: {route.methods_str}")
+    sys.stdout.write("\n".join(lines))
+    sys.stdout.write("\n")
 
     choice = get_choice(f"\nSelect route (1-{len(routes)})", routes)
     if choice == 0:
@@ -93,30 +92,31 @@ def select_route(db) -> str:
 
 def select_methods(route) -> list:
     """Interactive method selection."""
-    available_methods = list(route.methods.keys())
+    # One pass over the route's methods, reused for display and prompting
+    entries = [
+        (method, "public" if not method_auth.auth_required else f"requires {method_auth.auth_type.value}")
+        for method, method_auth in route.methods.items()
+    ]
 
     print("\n" + "=" * 80)
     print(f"Select HTTP methods to allow for {route.route_pattern}")
     print("=" * 80)
 
-    for method, method_auth in route.methods.items():
-        auth_info = "public" if not method_auth.auth_required else f"requires {method_auth.auth_type.value}"
+    for method, auth_info in entries:
         print(f"  {method.value:<8} ({auth_info})")
 
     print("\nWhich methods should the client be allowed to use?")
 
     selected_methods = []
-    for method in available_methods:
+    for method, _ in entries:
         if get_yes_no(f"  Allow {method.value}?", default=True):
             selected_methods.append(method)
 
     return selected_methods
 
 
-def grant_permission_interactive():
+def grant_permission_interactive(db):
     """Interactive mode to grant a permission."""
-    db = get_db_connection()
-
     try:
         print("=" * 80)
         print("Grant Client Permission to Route")
@@ -142,7 +142,7 @@ def grant_permission_interactive():
         existing_perm = db.load_permission_by_client_and_route(client_id, route_id)
         if existing_perm:
             print(f"\n⚠ Permission already exists for this client/route combination.")
-            methods_str = ", ".join([m.value for m in existing_perm.allowed_methods])
+            methods_str = format_methods(existing_perm.allowed_methods)
             print(f"Current allowed methods: {methods_str}")
             if not get_yes_no("\nUpdate the permission?", default=True):
                 print("Cancelled.")
@@ -161,7 +161,7 @@ def grant_permission_interactive():
         print("=" * 80)
         print(f"Client: {client.client_name}")
         print(f"Route: {route.route_pattern} ({route.service_name})")
-        methods_str = ", ".join([m.value for m in selected_methods])
+        methods_str = format_methods(selected_methods)
         print(f"Allowed methods: {methods_str}")
 
         if not get_yes_no("\nGrant this permission?", default=True):
@@ -192,14 +192,10 @@ def grant_permission_interactive():
         print(f"\n✗ Error granting permission: {e}")
         import traceback
         traceback.print_exc()
-    finally:
-        db.close()
 
 
-def grant_permission_direct(client_id: str, route_id: str):
+def grant_permission_direct(db, client_id: str, route_id: str):
     """Grant permission with provided client and route IDs."""
-    db = get_db_connection()
-
     try:
         # Verify client exists
         client = db.load_client_by_id(client_id)
@@ -217,7 +213,7 @@ def grant_permission_direct(client_id: str, route_id: str):
         existing_perm = db.load_permission_by_client_and_route(client_id, route_id)
         if existing_perm:
             print(f"⚠ Permission already exists")
-            methods_str = ", ".join([m.value for m in existing_perm.allowed_methods])
+            methods_str = format_methods(existing_perm.allowed_methods)
             print(f"Current allowed methods: {methods_str}")
             if not get_yes_no("Update the permission?", default=False):
                 return
@@ -237,33 +233,34 @@ def grant_permission_direct(client_id: str, route_id: str):
         )
 
         permission_id = db.save_permission(permission)
-        methods_str = ", ".join([m.value for m in selected_methods])
+        methods_str = format_methods(selected_methods)
 
         print(f"\n✓ Permission granted: {client.client_name} → {route.route_pattern} [{methods_str}]")
 
     except Exception as e:
         print(f"\n✗ Error granting permission: {e}")
-    finally:
-        db.close()
 
 
 def main():
     """Main function."""
-    load_dotenv()
-
-    if len(sys.argv) == 3:
-        # Client ID and Route ID provided
-        client_id = sys.argv[1]
-        route_id = sys.argv[2]
-        grant_permission_direct(client_id, route_id)
-    elif len(sys.argv) == 1:
-        # Interactive mode
-        grant_permission_interactive()
-    else:
-        print("Usage:")
-        print("  python scripts/grant_permission.py                    # Interactive mode")
-        print("  python scripts/grant_permission.py <client_id> <route_id>  # Direct mode")
-        sys.exit(1)
+    parser = argparse.ArgumentParser(description='Grant a client permission to access a route')
+    parser.add_argument('client_id', nargs='?', help='Client to grant (omit both IDs for interactive mode)')
+    parser.add_argument('route_id', nargs='?', help='Route to grant access to')
+    args = parser.parse_args()
+
+    if args.client_id and not args.route_id:
+        parser.error("route_id is required when client_id is given")
+
+    load_env()
+    from src.utils import db_session
+
+    with db_session() as db:
+        if args.client_id:
+            # Client ID and Route ID provided
+            grant_permission_direct(db, args.client_id, args.route_id)
+        else:
+            # Interactive mode
+            grant_permission_interactive(db)
 
 
 if __name__ == "__main__":
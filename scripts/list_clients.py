@@ -6,23 +6,21 @@ Usage:
   python scripts/list_clients.py
 """
 
-from dotenv import load_dotenv
-from src.utils import get_db_connection
+import sys
 
+from src.config import load_env
 
-def format_credential(value: str, show_full: bool = False) -> str:
-    """Format a credential for display (truncated or full)."""
-    if not value:
-        return "None"
-    if show_full:
-        return value
-    # Show first 8 chars + ... for security
-    return f"{value[:8]}..." if len(value) > 8 else value
+# Column layout of the client table
+ROW_FORMAT = "{cid:<38} {name:<25} {key:<15} {sec:<15} {status:<10}"
+HEADER = ROW_FORMAT.format_map(
+    {'cid': 'Client ID', 'name': 'Name', 'key': 'API Key', 'sec': 'Secret', 'status': 'Status'}
+)
 
 
 def main():
     """Main function to list all clients."""
-    load_dotenv()
+    load_env()
+    from src.utils import get_db_connection
 
     print("=" * 100)
     print("API Clients")
@@ -41,19 +39,24 @@ def main():
 
         print(f"\nTotal clients: {len(clients)}\n")
 
-        # Print header
-        print(f"{'Client ID':<38} {'Name':<25} {'API Key':<15} {'Secret':<15} {'Status':<10}")
-        print("-" * 100)
-
-        # Print each client
+        # Build the header and one line per client, then write them at once
+        lines = [
+            HEADER,
+            "-" * 100,
+        ]
         for client in clients:
-            client_id_short = str(client.client_id)
             name_truncated = (client.client_name[:22] + "...") if len(client.client_name) > 25 else client.client_name
-            api_key_display = format_credential(client.api_key)
-            secret_display = format_credential(client.shared_secret)
-            status_display = client.status.value
 
-            print(f"{client_id_short:<38} {name_truncated:<25} {api_key_display:<15} {secret_display:<15} {status_display:<10}")
+            lines.append(ROW_FORMAT.format_map({
+                'cid': str(client.client_id),
+                'name': name_truncated,
+                'key': client.api_key_short,
+                'sec': client.shared_secret_short,
+                'status': client.status.value,
+            }))
+
+        sys.stdout.write("\n".join(lines))
+        sys.stdout.write("\n")
 
         print("\n" + "=" * 100)
         print("Legend:")
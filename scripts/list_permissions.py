@@ -8,10 +8,11 @@ Usage:
   python scripts/list_permissions.py --route <id>       # List permissions for a route
 """
 
-import sys
-from dotenv import load_dotenv
+import argparse
+from collections import defaultdict
 
-from src.utils import get_db_connection
+from src.config import load_env
+from src.models.route import format_methods
 
 
 def list_all_permissions(db):
@@ -26,15 +27,23 @@ def list_all_permissions(db):
     print("All Client Permissions")
     print("=" * 100)
 
+    # Fetch everything up front and join in memory instead of querying per client
+    routes_by_id = {route.route_id: route for route in db.load_all_routes()}
+    permissions_by_client = defaultdict(list)
+    for perm in db.load_all_permissions():
+        permissions_by_client[perm.client_id].append(perm)
+
     total_permissions = 0
+    clients_with_permissions = 0
 
     for client in clients:
-        permissions = db.load_permissions_by_client(client.client_id)
+        permissions = permissions_by_client[client.client_id]
 
         if not permissions:
             continue
 
         total_permissions += len(permissions)
+        clients_with_permissions += 1
 
         # Client header
         status_indicator = "✓" if client.is_active() else "✗"
@@ -43,9 +52,9 @@ def list_all_permissions(db):
 
         # List permissions
         for perm in permissions:
-            route = db.load_route_by_id(perm.route_id)
+            route = routes_by_id.get(perm.route_id)
             if route:
-                methods_str = ", ".join([m.value for m in perm.allowed_methods])
+                methods_str = format_methods(perm.allowed_methods)
                 print(f"  → {route.route_pattern:<35} [{route.service_name:<20}] {methods_str}")
 
     if total_permissions == 0:
@@ -53,8 +62,8 @@ def list_all_permissions(db):
         print("\nTo grant permissions:")
         print("  python scripts/grant_permission.py")
     else:
-        print(f"\n{'=' * 100}")
-        print(f"Total: {total_permissions} permission(s) across {len([c for c in clients if db.load_permissions_by_client(c.client_id)])} client(s)")
+        print("\n" + "=" * 100)
+        print(f"Total: {total_permissions} permission(s) across {clients_with_permissions} client(s)")
 
 
 def list_permissions_by_client(db, client_id: str):
@@ -65,7 +74,7 @@ def list_permissions_by_client(db, client_id: str):
         print(f"✗ Client not found: {client_id}")
         return
 
-    permissions = db.load_permissions_by_client(client_id)
+    permissions = db.load_permissions_with_routes(client_id)
 
     print("\n" + "=" * 100)
     print(f"Permissions for Client: {client.client_name}")
@@ -74,9 +83,9 @@ def list_permissions_by_client(db, client_id: str):
     print(f"Status: {client.status.value}")
 
     if client.api_key:
-        print(f"API Key: {client.api_key[:8]}...")
+        print(f"API Key: {client.api_key_short}")
     if client.shared_secret:
-        print(f"Shared Secret: {client.shared_secret[:8]}...")
+        print(f"Shared Secret: {client.shared_secret_short}")
 
     if not permissions:
         print("\n⚠ This client has no permissions.")
@@ -89,11 +98,9 @@ def list_permissions_by_client(db, client_id: str):
     print(f"{'Route Pattern':<35} {'Service':<25} {'Allowed Methods':<30} {'Permission ID'}")
     print("-" * 100)
 
-    for perm in permissions:
-        route = db.load_route_by_id(perm.route_id)
-        if route:
-            methods_str = ", ".join([m.value for m in perm.allowed_methods])
-            print(f"{route.route_pattern:<35} {route.service_name:<25} {methods_str:<30} {perm.permission_id}")
+    for perm, route in permissions:
+        methods_str = format_methods(perm.allowed_methods)
+        print(f"{route.route_pattern:<35} {route.service_name:<25} {methods_str:<30} {perm.permission_id}")
 
     print("=" * 100)
 
@@ -106,7 +113,7 @@ def list_permissions_by_route(db, route_id: str):
         print(f"✗ Route not found: {route_id}")
         return
 
-    permissions = db.load_permissions_by_route(route_id)
+    permissions = db.load_permissions_with_clients(route_id)
 
     print("\n" + "=" * 100)
     print(f"Permissions for Route: {route.route_pattern}")
@@ -133,55 +140,40 @@ def list_permissions_by_route(db, route_id: str):
     print(f"{'Client Name':<30} {'Allowed Methods':<25} {'Status':<10} {'Permission ID'}")
     print("-" * 100)
 
-    for perm in permissions:
-        client = db.load_client_by_id(perm.client_id)
-        if client:
-            methods_str = ", ".join([m.value for m in perm.allowed_methods])
-            status_indicator = "✓" if client.is_active() else "✗"
-            print(f"{client.client_name:<30} {methods_str:<25} {status_indicator} {client.status.value:<9} {perm.permission_id}")
+    for perm, client in permissions:
+        methods_str = format_methods(perm.allowed_methods)
+        status_indicator = "✓" if client.is_active() else "✗"
+        print(f"{client.client_name:<30} {methods_str:<25} {status_indicator} {client.status.value:<9} {perm.permission_id}")
 
     print("=" * 100)
 
 
 def main():
     """Main function."""
-    load_dotenv()
-
-    db = get_db_connection(verbose=False)
-
-    try:
-        if len(sys.argv) == 1:
-            # No arguments - list all permissions
-            list_all_permissions(db)
-
-        elif len(sys.argv) == 3:
-            flag = sys.argv[1]
-            entity_id = sys.argv[2]
-
-            if flag == "--client":
-                list_permissions_by_client(db, entity_id)
-            elif flag == "--route":
-                list_permissions_by_route(db, entity_id)
+    parser = argparse.ArgumentParser(description='List client permissions')
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument('--client', metavar='CLIENT_ID',
+                       help='List permissions for a client')
+    group.add_argument('--route', metavar='ROUTE_ID',
+                       help='List permissions for a route')
+    args = parser.parse_args()
+
+    load_env()
+    from src.utils import db_session
+
+    with db_session(verbose=False) as db:
+        try:
+            if args.client:
+                list_permissions_by_client(db, args.client)
+            elif args.route:
+                list_permissions_by_route(db, args.route)
             else:
-                print(f"Unknown flag: {flag}")
-                print("\nUsage:")
-                print("  python scripts/list_permissions.py                    # List all")
-                print("  python scripts/list_permissions.py --client <id>      # By client")
-                print("  python scripts/list_permissions.py --route <id>       # By route")
-                sys.exit(1)
-        else:
-            print("Usage:")
-            print("  python scripts/list_permissions.py                    # List all")
-            print("  python scripts/list_permissions.py --client <id>      # By client")
-            print("  python scripts/list_permissions.py --route <id>       # By route")
-            sys.exit(1)
-
-    except Exception as e:
-        print(f"\n✗ Error: {e}")
-        import traceback
-        traceback.print_exc()
-    finally:
-        db.close()
+                list_all_permissions(db)
+
+        except Exception as e:
+            print(f"\n✗ Error: {e}")
+            import traceback
+            traceback.print_exc()
 
 
 if __name__ == "__main__":
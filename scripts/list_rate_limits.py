@@ -6,13 +6,19 @@ Usage:
   python scripts/list_rate_limits.py
 """
 
-from dotenv import load_dotenv
-from src.utils import get_db_connection
+import sys
+
+from src.config import load_env
+
+# Column layout of the rate limit table
+ROW_FORMAT = "{cid:<38} {name:<25} {limit:<20}"
+HEADER = ROW_FORMAT.format_map({'cid': 'Client ID', 'name': 'Client Name', 'limit': 'Limit (req/24h)'})
 
 
 def main():
     """Main function to list all rate limits."""
-    load_dotenv()
+    load_env()
+    from src.utils import get_db_connection
 
     print("=" * 100)
     print("Client Rate Limits")
@@ -27,14 +33,19 @@ def main():
             print("\nNo clients found.")
             return
 
-        print(f"\n{'Client ID':<38} {'Client Name':<25} {'Limit (req/24h)':<20}")
-        print("-" * 100)
+        # One query for every limit instead of one per client
+        limits = {rl.client_id: rl for rl in db.load_all_rate_limits()}
 
+        # Build the header and one line per client, then write them at once
+        lines = [
+            "\n" + HEADER,
+            "-" * 100,
+        ]
         limited_count = 0
         unlimited_count = 0
 
         for client in clients:
-            rate_limit = db.load_rate_limit_by_client(client.client_id)
+            rate_limit = limits.get(client.client_id)
             name_truncated = (client.client_name[:22] + "...") if len(client.client_name) > 25 else client.client_name
 
             if rate_limit:
@@ -44,7 +55,14 @@ def main():
                 limit_display = "unlimited"
                 unlimited_count += 1
 
-            print(f"{client.client_id:<38} {name_truncated:<25} {limit_display:<20}")
+            lines.append(ROW_FORMAT.format_map({
+                'cid': client.client_id,
+                'name': name_truncated,
+                'limit': limit_display,
+            }))
+
+        sys.stdout.write("\n".join(lines))
+        sys.stdout.write("\n")
 
         print("\n" + "=" * 100)
         print(f"Summary: {limited_count} with limits, {unlimited_count} unlimited")
@@ -6,14 +6,18 @@ Usage:
   python scripts/list_routes.py
 """
 
-from dotenv import load_dotenv
+import sys
 
-from src.utils import get_db_connection
+from src.config import load_env
+
+# Layout of one method line in a route's block
+METHOD_FORMAT = "     {method:<8} → {auth}"
 
 
 def main():
     """Main function to list all routes."""
-    load_dotenv()
+    load_env()
+    from src.utils import get_db_connection
 
     print("=" * 80)
     print("All Routes")
@@ -33,21 +37,26 @@ def main():
 
     print(f"Found {len(routes)} route(s):\n")
 
+    # Build every route's block, then write them at once
+    lines = []
     for i, route in enumerate(routes, 1):
-        print(f"{i}. Route ID: {route.route_id}")
-        print(f"   Pattern:  {route.route_pattern}")
-        print(f"   Domain:   {route.domain}")
-        print(f"   Service:  {route.service_name}")
-        print(f"   Methods:")
+        lines.append(f"{i}. Route ID: {route.route_id}")
+        lines.append(f"   Pattern:  {route.route_pattern}")
+        lines.append(f"   Domain:   {route.domain}")
+        lines.append(f"   Service:  {route.service_name}")
+        lines.append("   Methods:")
 
         for method, auth in route.methods.items():
             if auth.auth_required:
                 auth_desc = f"{auth.auth_type.value} authentication required"
             else:
                 auth_desc = "public (no auth)"
-            print(f"     {method.value:8} → {auth_desc}")
+            lines.append(METHOD_FORMAT.format_map({'method': method.value, 'auth': auth_desc}))
+
+        lines.append("")
 
-        print()
+    sys.stdout.write("\n".join(lines))
+    sys.stdout.write("\n")
 
     db.close()
 
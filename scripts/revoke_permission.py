@@ -9,9 +9,10 @@ Usage:
 """
 
 import sys
-from dotenv import load_dotenv
+from collections import defaultdict
 
-from src.utils import get_db_connection
+from src.config import load_env
+from src.models.route import format_methods
 
 
 def confirm_revocation(permission, client, route) -> bool:
@@ -22,7 +23,7 @@ def confirm_revocation(permission, client, route) -> bool:
     print(f"Permission ID: {permission.permission_id}")
     print(f"Client: {client.client_name} ({client.client_id})")
     print(f"Route: {route.route_pattern} ({route.service_name})")
-    methods_str = ", ".join([m.value for m in permission.allowed_methods])
+    methods_str = format_methods(permission.allowed_methods)
     print(f"Allowed methods: {methods_str}")
     print("\n" + "=" * 80)
 
@@ -32,6 +33,7 @@ def confirm_revocation(permission, client, route) -> bool:
 
 def revoke_by_permission_id(permission_id: str):
     """Revoke a permission by its ID."""
+    from src.utils import get_db_connection
     db = get_db_connection(verbose=False)
 
     try:
@@ -59,7 +61,7 @@ def revoke_by_permission_id(permission_id: str):
         success = db.delete_permission(permission_id)
 
         if success:
-            methods_str = ", ".join([m.value for m in permission.allowed_methods])
+            methods_str = format_methods(permission.allowed_methods)
             print(f"\n✓ Permission revoked: {client.client_name} → {route.route_pattern} [{methods_str}]")
             return True
         else:
@@ -75,6 +77,7 @@ def revoke_by_permission_id(permission_id: str):
 
 def revoke_by_client_and_route(client_id: str, route_id: str):
     """Revoke a permission by client and route IDs."""
+    from src.utils import get_db_connection
     db = get_db_connection(verbose=False)
 
     try:
@@ -102,7 +105,7 @@ def revoke_by_client_and_route(client_id: str, route_id: str):
         success = db.delete_permission_by_client_and_route(client_id, route_id)
 
         if success:
-            methods_str = ", ".join([m.value for m in permission.allowed_methods])
+            methods_str = format_methods(permission.allowed_methods)
             print(f"\n✓ Permission revoked: {client.client_name} → {route.route_pattern} [{methods_str}]")
             return True
         else:
@@ -118,17 +121,22 @@ def revoke_by_client_and_route(client_id: str, route_id: str):
 
 def revoke_interactive():
     """Interactive mode to select and revoke a permission."""
+    from src.utils import get_db_connection
     db = get_db_connection(verbose=False)
 
     try:
-        # Get all clients with permissions
+        # Fetch everything up front and join in memory instead of querying per client
         clients = db.load_all_clients()
-        clients_with_perms = []
+        routes_by_id = {route.route_id: route for route in db.load_all_routes()}
+        permissions_by_client = defaultdict(list)
+        for perm in db.load_all_permissions():
+            permissions_by_client[perm.client_id].append(perm)
 
-        for client in clients:
-            perms = db.load_permissions_by_client(client.client_id)
-            if perms:
-                clients_with_perms.append((client, perms))
+        clients_with_perms = [
+            (client, permissions_by_client[client.client_id])
+            for client in clients
+            if client.client_id in permissions_by_client
+        ]
 
         if not clients_with_perms:
             print("No permissions found.")
@@ -147,9 +155,9 @@ def revoke_interactive():
             print(f"\n{status_indicator} {client.client_name}")
 
             for perm in perms:
-                route = db.load_route_by_id(perm.route_id)
+                route = routes_by_id.get(perm.route_id)
                 if route:
-                    methods_str = ", ".join([m.value for m in perm.allowed_methods])
+                    methods_str = format_methods(perm.allowed_methods)
                     print(f"  {idx:2}. → {route.route_pattern:<30} [{methods_str}]")
                     all_permissions.append((perm, client, route))
                     idx += 1
@@ -173,7 +181,7 @@ def revoke_interactive():
                     if confirm_revocation(permission, client, route):
                         success = db.delete_permission(permission.permission_id)
                         if success:
-                            methods_str = ", ".join([m.value for m in permission.allowed_methods])
+                            methods_str = format_methods(permission.allowed_methods)
                             print(f"\n✓ Permission revoked: {client.client_name} → {route.route_pattern} [{methods_str}]")
                         else:
                             print(f"\n✗ Failed to revoke permission")
@@ -196,7 +204,7 @@ def revoke_interactive():
 
 def main():
     """Main function."""
-    load_dotenv()
+    load_env()
 
     if len(sys.argv) == 1:
         # Interactive mode
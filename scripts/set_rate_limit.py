@@ -6,14 +6,14 @@ Usage:
   python scripts/set_rate_limit.py
 """
 
-from dotenv import load_dotenv
-from src.utils import get_db_connection
+from src.config import load_env
 from src.models.rate_limit import RateLimit
 
 
 def main():
     """Main function to set rate limit for a client."""
-    load_dotenv()
+    load_env()
+    from src.utils import get_db_connection
 
     print("=" * 80)
     print("Set Rate Limit for Client")
@@ -28,9 +28,12 @@ def main():
             print("  python scripts/create_client.py")
             return
 
+        # One query for every limit instead of one per client
+        limits = {rl.client_id: rl for rl in db.load_all_rate_limits()}
+
         print(f"\nAvailable clients ({len(clients)}):\n")
         for client in clients:
-            current_limit = db.load_rate_limit_by_client(client.client_id)
+            current_limit = limits.get(client.client_id)
             limit_display = str(current_limit.requests_per_day) if current_limit else "unlimited"
             print(f"  {client.client_id} - {client.client_name} ({limit_display} req/24h)")
 
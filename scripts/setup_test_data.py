@@ -9,7 +9,6 @@ Creates:
 - Test clients with credentials
 - Appropriate permissions
 """
-from src.utils import get_db_connection
 from src.models.route import Route, HttpMethod
 from src.models.method_auth import MethodAuth, AuthType
 from src.models.client import Client, ClientStatus
@@ -21,12 +20,14 @@ def main():
     print("=" * 60)
     print()
 
+    from src.utils import get_db_connection
+
     # Connect to database
     db = get_db_connection()
     print("✓ Connected to database\n")
 
-    # 1. Create public route (no authentication required)
-    print("Creating public route: GET /api/public...")
+    # Build every route, client and permission, then save each kind with one
+    # multi-row INSERT; the whole setup is committed as a single transaction
     public_route = Route.create_new(
         route_pattern='/api/public',
         domain='*',
@@ -35,12 +36,6 @@ def main():
             HttpMethod.GET: MethodAuth(auth_required=False)
         }
     )
-    db.save_route(public_route)
-    print(f"  ✓ Route ID: {public_route.route_id}")
-    print()
-
-    # 2. Create API key protected route
-    print("Creating API key protected route: GET,POST /api/protected...")
     api_key_route = Route.create_new(
         route_pattern='/api/protected',
         domain='*',
@@ -50,12 +45,6 @@ def main():
             HttpMethod.POST: MethodAuth(auth_required=True, auth_type=AuthType.API_KEY)
         }
     )
-    db.save_route(api_key_route)
-    print(f"  ✓ Route ID: {api_key_route.route_id}")
-    print()
-
-    # 3. Create HMAC protected route
-    print("Creating HMAC protected route: POST /api/secure...")
     hmac_route = Route.create_new(
         route_pattern='/api/secure',
         domain='*',
@@ -64,53 +53,54 @@ def main():
             HttpMethod.POST: MethodAuth(auth_required=True, auth_type=AuthType.HMAC)
         }
     )
-    db.save_route(hmac_route)
-    print(f"  ✓ Route ID: {hmac_route.route_id}")
-    print()
-
-    # 4. Create client with API key
-    print("Creating API key client...")
     api_client = Client.create_new(
         client_name='Test API Key Client',
         api_key='test-api-key-12345',
         status=ClientStatus.ACTIVE
     )
-    db.save_client(api_client)
-    print(f"  ✓ Client ID: {api_client.client_id}")
-    print(f"  ✓ API Key: {api_client.api_key}")
-    print()
-
-    # 5. Grant API key client permission to protected route
-    print("Granting permissions to API key client...")
-    api_permission = ClientPermission.create_new(
-        client_id=api_client.client_id,
-        route_id=api_key_route.route_id,
-        allowed_methods=[HttpMethod.GET, HttpMethod.POST]
-    )
-    db.save_permission(api_permission)
-    print(f"  ✓ Permission ID: {api_permission.permission_id}")
-    print()
-
-    # 6. Create client with shared secret for HMAC
-    print("Creating HMAC client...")
     hmac_client = Client.create_new(
         client_name='Test HMAC Client',
         shared_secret='hmac-shared-secret-xyz',
         status=ClientStatus.ACTIVE
     )
-    db.save_client(hmac_client)
+
+    with db.transaction():
+        # 1-3. Create public, API key protected and HMAC protected routes
+        db.save_routes_bulk([public_route, api_key_route, hmac_route])
+
+        # 4, 6. Create API key and HMAC clients
+        db.save_clients_bulk([api_client, hmac_client])
+
+        # 5, 7. Grant each client permission to its protected route
+        api_permission = ClientPermission.create_new(
+            client_id=api_client.client_id,
+            route_id=api_key_route.route_id,
+            allowed_methods=[HttpMethod.GET, HttpMethod.POST]
+        )
+        hmac_permission = ClientPermission.create_new(
+            client_id=hmac_client.client_id,
+            route_id=hmac_route.route_id,
+            allowed_methods=[HttpMethod.POST]
+        )
+        db.save_permissions_bulk([api_permission, hmac_permission])
+
+    print("Created public route: GET /api/public")
+    print(f"  ✓ Route ID: {public_route.route_id}")
+    print()
+    print("Created API key protected route: GET,POST /api/protected")
+    print(f"  ✓ Route ID: {api_key_route.route_id}")
+    print()
+    print("Created HMAC protected route: POST /api/secure")
+    print(f"  ✓ Route ID: {hmac_route.route_id}")
+    print()
+    print("Created API key client")
+    print(f"  ✓ Client ID: {api_client.client_id}")
+    print(f"  ✓ API Key: {api_client.api_key}")
+    print(f"  ✓ Permission ID: {api_permission.permission_id}")
+    print()
+    print("Created HMAC client")
     print(f"  ✓ Client ID: {hmac_client.client_id}")
     print(f"  ✓ Shared Secret: {hmac_client.shared_secret}")
-    print()
-
-    # 7. Grant HMAC client permission to secure route
-    print("Granting permissions to HMAC client...")
-    hmac_permission = ClientPermission.create_new(
-        client_id=hmac_client.client_id,
-        route_id=hmac_route.route_id,
-        allowed_methods=[HttpMethod.POST]
-    )
-    db.save_permission(hmac_permission)
     print(f"  ✓ Permission ID: {hmac_permission.permission_id}")
     print()
 
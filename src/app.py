@@ -4,34 +4,17 @@ Flask application for nginx auth_request integration.
 This service provides authorization endpoints that nginx calls via auth_request
 directive to determine if API requests should be allowed or denied.
 """
-import os
 import logging
 from typing import Optional
 from flask import Flask
-from dotenv import load_dotenv
-
-# Load environment variables from .env file FIRST
-load_dotenv()
-
-# Configure Loki logging with mazza-base
-# Must be done before any other imports that might log
-from mazza_base import configure_logging
-
-debug_mode = os.environ.get('DEBUG_LOCAL', 'true').lower() == 'true'
-log_level = os.environ.get('LOG_LEVEL', 'INFO')
-configure_logging(
-    application_tag='api-gatekeeper',
-    debug_local=debug_mode,
-    local_level=log_level
-)
-
-import redis
+from src.config import Settings, setup_logging
+from byteforge_hmac import DictNonceStorage
 from src.auth import Authorizer, HMACHandler, RedisNonceStorage
 from src.utils import get_db_connection
 from src.database.driver import AuthServiceDB
 from src.blueprints import authz_bp, health_bp, metrics_bp
-from src.rate_limiter import RateLimiter, RedisBackend
-from pythonjsonlogger import jsonlogger
+from src.json_provider import OrjsonProvider
+from src.rate_limiter import BACKENDS, RateLimiter
 
 logger = logging.getLogger(__name__)
 
@@ -39,49 +22,61 @@ logger = logging.getLogger(__name__)
 _NOT_PROVIDED = object()
 
 
-def _create_redis_client():
+def _create_redis_client(settings: Settings):
     """
     Create Redis client if configured.
 
     If REDIS_HOST is not configured, returns None.
     If REDIS_HOST is configured but connection fails, the application will exit.
 
+    Args:
+        settings: Service settings
+
     Returns:
         Redis client instance or None if not configured
     """
-    redis_host = os.environ.get('REDIS_HOST')
-
-    if not redis_host:
+    if not settings.redis_host:
         return None
 
-    redis_port = int(os.environ.get('REDIS_PORT', 6379))
-    redis_password = os.environ.get('REDIS_PASSWORD')
-    redis_db = int(os.environ.get('REDIS_DB', 0))
-
-    redis_client = redis.Redis(
-        host=redis_host,
-        port=redis_port,
-        password=redis_password,
-        db=redis_db,
-        decode_responses=True
+    # Imported here so deployments without Redis never load the client library
+    import redis
+
+    # Bounded pool: callers wait for a free connection instead of opening
+    # more, idle connections are kept alive and health-checked, and a
+    # stalled server fails the command instead of hanging the request
+    pool = redis.BlockingConnectionPool(
+        host=settings.redis_host,
+        port=settings.redis_port,
+        password=settings.redis_password,
+        db=settings.redis_db,
+        decode_responses=True,
+        max_connections=settings.redis_pool_size,
+        timeout=5,
+        socket_keepalive=True,
+        socket_connect_timeout=2,
+        socket_timeout=2,
+        health_check_interval=30
     )
+    redis_client = redis.Redis(connection_pool=pool)
     redis_client.ping()
 
     logger.info("Redis connection established", extra={
-        'redis_host': redis_host,
-        'redis_port': redis_port
+        'redis_host': settings.redis_host,
+        'redis_port': settings.redis_port,
+        'redis_pool_size': settings.redis_pool_size
     })
 
     return redis_client
 
 
-def _create_rate_limiter(db, redis_client):
+def _create_rate_limiter(db, redis_client, settings: Settings):
     """
     Create rate limiter with Redis backend.
 
     Args:
         db: Database driver instance
         redis_client: Redis client instance or None
+        settings: Service settings (selects the rate limit algorithm)
 
     Returns:
         RateLimiter instance or None if Redis not available
@@ -90,22 +85,31 @@ def _create_rate_limiter(db, redis_client):
         logger.info("Rate limiting disabled (Redis not configured)")
         return None
 
-    backend = RedisBackend(redis_client)
-    logger.info("Rate limiter initialized with Redis backend")
+    algorithm = settings.rate_limit_algorithm
+    if algorithm not in BACKENDS:
+        raise ValueError(
+            f"Invalid RATE_LIMIT_ALGORITHM '{algorithm}', expected one of: {', '.join(BACKENDS)}"
+        )
+
+    backend = BACKENDS[algorithm](redis_client)
+    logger.info("Rate limiter initialized with Redis backend", extra={
+        'rate_limit_algorithm': algorithm
+    })
 
     return RateLimiter(db, backend)
 
 
-def _create_hmac_handler(db, redis_client):
+def _create_hmac_handler(db, redis_client, settings: Settings):
     """
     Create HMAC handler with appropriate nonce storage.
 
     Uses Redis for nonce storage in production (multi-instance safe).
-    Falls back to in-memory dict for local development.
+    Falls back to in-memory storage for local development.
 
     Args:
         db: Database driver instance
         redis_client: Redis client instance or None
+        settings: Service settings (for the client lookup cache TTL)
 
     Returns:
         HMACHandler instance
@@ -114,47 +118,40 @@ def _create_hmac_handler(db, redis_client):
         nonce_storage = RedisNonceStorage(redis_client)
         logger.info("HMAC handler initialized with Redis nonce storage (replay protection enabled)")
     else:
-        nonce_storage = {}
+        nonce_storage = DictNonceStorage()
         logger.warning("HMAC handler using in-memory nonce storage (not safe for multi-instance)")
 
-    return HMACHandler(db, nonce_storage=nonce_storage)
-
-# Configure JSON formatter for structured logging
-# This ensures extra fields are included in log output
-def _configure_json_formatter():
-    """Add JSON formatter to root logger to capture extra fields."""
-    formatter = jsonlogger.JsonFormatter(
-        '%(asctime)s %(name)s %(levelname)s %(message)s',
-        timestamp=True
-    )
-
-    # Apply JSON formatter to all existing handlers
-    for handler in logging.root.handlers:
-        handler.setFormatter(formatter)
-
-# Apply JSON formatting (works with both local and Loki modes)
-_configure_json_formatter()
+    return HMACHandler(db, nonce_storage=nonce_storage, cache_ttl=settings.auth_cache_ttl)
 
 
 def create_app(
     db: Optional[AuthServiceDB] = None,
     redis_client=_NOT_PROVIDED,
     rate_limiter=_NOT_PROVIDED,
-    hmac_handler=_NOT_PROVIDED
+    hmac_handler=_NOT_PROVIDED,
+    settings: Optional[Settings] = None
 ) -> Flask:
     """
     Create and configure Flask application.
 
+    Reads settings from the environment (and .env file) unless given.
+    Logging is not configured here; entry points call setup_logging() first.
+
     Args:
         db: Optional database instance (for testing). If None, creates new connection.
         redis_client: Redis client. If not provided, creates based on env. Pass None to disable.
         rate_limiter: Rate limiter instance. If not provided, creates based on env. Pass None to disable.
         hmac_handler: HMAC handler instance. If not provided, creates based on env.
+        settings: Service settings. If None, reads them from the environment.
 
     Returns:
         Configured Flask application
     """
+    if settings is None:
+        settings = Settings.from_env()
+
     app = Flask(__name__)
+    app.json = OrjsonProvider(app)
 
     # Initialize database connection
     if db is None:
@@ -162,24 +159,32 @@ def create_app(
 
     # Initialize Redis client if not explicitly provided
     if redis_client is _NOT_PROVIDED:
-        redis_client = _create_redis_client()
+        redis_client = _create_redis_client(settings)
 
     # Initialize rate limiter if not explicitly provided
     if rate_limiter is _NOT_PROVIDED:
-        rate_limiter = _create_rate_limiter(db, redis_client)
+        rate_limiter = _create_rate_limiter(db, redis_client, settings)
 
     # Initialize HMAC handler with Redis nonce storage if not explicitly provided
     if hmac_handler is _NOT_PROVIDED:
-        hmac_handler = _create_hmac_handler(db, redis_client)
+        hmac_handler = _create_hmac_handler(db, redis_client, settings)
 
     # Create authorizer with all components
-    authorizer = Authorizer(db, hmac_handler=hmac_handler, rate_limiter=rate_limiter)
+    authorizer = Authorizer(
+        db,
+        hmac_handler=hmac_handler,
+        rate_limiter=rate_limiter,
+        cache_ttl=settings.auth_cache_ttl
+    )
 
     # Store in app config for access in route handlers
+    app.config['SETTINGS'] = settings
     app.config['DB'] = db
+    app.config['DB_POOL'] = db.pool
     app.config['AUTHORIZER'] = authorizer
     app.config['RATE_LIMITER'] = rate_limiter
     app.config['REDIS_CLIENT'] = redis_client
+    app.config['REDIS_POOL'] = redis_client.connection_pool if redis_client else None
 
     # Register blueprints
     app.register_blueprint(authz_bp)
@@ -189,12 +194,25 @@ def create_app(
     return app
 
 
-# Create default app instance for direct execution
-app = create_app()
+def __getattr__(name: str):
+    """
+    Keep the old "gunicorn src.app:app" target working.
+
+    The app is no longer built at import, so the first access to src.app.app
+    builds it through src.wsgi and logs that the target has moved.
+    """
+    if name == 'app':
+        from src.wsgi import app
+        logger.warning("src.app:app is deprecated; serve src.wsgi:app instead")
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 if __name__ == '__main__':
-    port = int(os.environ.get('PORT', 7843))
+    setup_logging()
+    settings = Settings.from_env()
+    app = create_app(settings=settings)
+    port = settings.port
     if logger:
         logger.info("Starting API Gatekeeper", extra={
             'port': port,
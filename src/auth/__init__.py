@@ -3,6 +3,7 @@ Authentication and authorization components.
 """
 from .models import AuthResult
 from .authorizer import Authorizer
+from .route_matcher import RouteMatcher
 from .hmac_handler import HMACHandler, DatabaseSecretProvider
 from .api_key_handler import APIKeyHandler
 from .request_signer import RequestSigner
@@ -11,6 +12,7 @@ from .nonce_storage import RedisNonceStorage
 __all__ = [
     'AuthResult',
     'Authorizer',
+    'RouteMatcher',
     'HMACHandler',
     'DatabaseSecretProvider',
     'APIKeyHandler',
@@ -1,7 +1,9 @@
 """
 API key authentication handler.
 """
-from typing import Optional
+from typing import Mapping, Optional
+
+from werkzeug.datastructures import Headers
 
 
 class APIKeyHandler:
@@ -27,8 +29,22 @@ class APIKeyHandler:
         """
         self.header_name = header_name
         self.query_param_name = query_param_name
+        self._header_name_lower = header_name.lower()
+        self._query_param_name_lower = query_param_name.lower()
+
+    def _get_header(self, headers: Mapping[str, str]) -> Optional[str]:
+        """Look up the configured header, ignoring the case of its name."""
+        value = headers.get(self.header_name)
+        if value is not None or isinstance(headers, Headers):
+            # Werkzeug headers are already case-insensitive
+            return value
+
+        for key, value in headers.items():
+            if key.lower() == self._header_name_lower:
+                return value
+        return None
 
-    def extract_from_header(self, headers: dict) -> Optional[str]:
+    def extract_from_header(self, headers: Mapping[str, str]) -> Optional[str]:
         """
         Extract API key from Authorization header.
 
@@ -38,36 +54,45 @@ class APIKeyHandler:
         - "<api_key>" (raw key)
 
         Args:
-            headers: Dictionary of HTTP headers (case-insensitive keys)
+            headers: HTTP headers (request.headers or a dict; names are
+                matched case-insensitively)
 
         Returns:
             API key if found, None otherwise
         """
-        # Get authorization header (case-insensitive)
-        auth_header = None
-        for key, value in headers.items():
-            if key.lower() == self.header_name.lower():
-                auth_header = value
-                break
+        return self.extract_from_header_value(self._get_header(headers))
+
+    def extract_from_header_value(self, auth_header: Optional[str]) -> Optional[str]:
+        """
+        Extract API key from an already-read Authorization header value.
 
+        Accepts the same formats as extract_from_header.
+
+        Args:
+            auth_header: Header value, or None if the header is absent
+
+        Returns:
+            API key if found, None otherwise
+        """
         if not auth_header:
             return None
 
         auth_header = auth_header.strip()
 
-        # Check for "Bearer <key>" format
-        if auth_header.lower().startswith('bearer '):
-            return auth_header[7:].strip()
+        # Only the scheme word is lower-cased, never the whole credential
+        scheme, separator, credentials = auth_header.partition(' ')
+        if separator:
+            scheme = scheme.lower()
 
-        # Check for "ApiKey <key>" format
-        if auth_header.lower().startswith('apikey '):
-            return auth_header[7:].strip()
+            # "Bearer <key>" and "ApiKey <key>" formats
+            if scheme == 'bearer' or scheme == 'apikey':
+                return credentials.strip()
 
-        # Assume it's a raw API key (no prefix)
-        # But skip if it looks like HMAC format
-        if auth_header.lower().startswith('hmac '):
-            return None
+            # HMAC credentials are not API keys
+            if scheme == 'hmac':
+                return None
 
+        # Assume it's a raw API key (no prefix)
         return auth_header
 
     def extract_from_query(self, query_params: dict) -> Optional[str]:
@@ -83,31 +108,45 @@ class APIKeyHandler:
         if not query_params:
             return None
 
-        # Case-insensitive lookup
-        for key, value in query_params.items():
-            if key.lower() == self.query_param_name.lower():
-                if isinstance(value, list):
-                    # Handle multiple values (take first)
-                    return value[0] if value else None
-                return value
+        # Exact name first; scan for other casings (e.g. "API_KEY") only on a miss
+        value = query_params.get(self.query_param_name)
+        if value is None:
+            for key, candidate in query_params.items():
+                if key.lower() == self._query_param_name_lower:
+                    value = candidate
+                    break
 
-        return None
+        if isinstance(value, list):
+            # Handle multiple values (take first)
+            return value[0] if value else None
+        return value
 
-    def extract(self, headers: dict, query_params: Optional[dict] = None) -> Optional[str]:
+    def extract(
+        self,
+        headers: Mapping[str, str],
+        query_params: Optional[dict] = None,
+        auth_header: Optional[str] = None
+    ) -> Optional[str]:
         """
         Extract API key from headers or query parameters.
 
         Priority: Header takes precedence over query parameter.
 
         Args:
-            headers: Dictionary of HTTP headers
+            headers: HTTP headers
             query_params: Optional dictionary of query parameters
+            auth_header: Authorization header value, if the caller has already
+                read it; saves a second header lookup when this handler reads
+                the Authorization header
 
         Returns:
             API key if found, None otherwise
         """
         # Try header first
-        api_key = self.extract_from_header(headers)
+        if auth_header is not None and self._header_name_lower == 'authorization':
+            api_key = self.extract_from_header_value(auth_header)
+        else:
+            api_key = self.extract_from_header(headers)
         if api_key:
             return api_key
 
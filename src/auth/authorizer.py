@@ -1,13 +1,19 @@
 """
 Authorization engine for API Gatekeeper.
 """
-from typing import Optional, List, Dict
+from typing import Any, Callable, Optional, List, Dict, Mapping, Tuple, Union
 from src.database.driver import AuthServiceDB
 from src.models.route import Route, HttpMethod
 from src.models.client import Client
 from .models import AuthResult
 from .hmac_handler import HMACHandler
 from .api_key_handler import APIKeyHandler
+from .lookup_cache import LookupCache
+from .route_matcher import RouteMatcher
+
+# Marker for "permission not loaded during authentication", since None
+# means the client has no permission for the route
+_NOT_LOADED = object()
 
 
 class Authorizer:
@@ -28,7 +34,8 @@ class Authorizer:
         db: AuthServiceDB,
         hmac_handler: Optional[HMACHandler] = None,
         api_key_handler: Optional[APIKeyHandler] = None,
-        rate_limiter = None
+        rate_limiter = None,
+        cache_ttl: float = 0
     ):
         """
         Initialize the authorizer.
@@ -38,19 +45,34 @@ class Authorizer:
             hmac_handler: Optional HMAC authentication handler (created if not provided)
             api_key_handler: Optional API key handler (created if not provided)
             rate_limiter: Optional rate limiter for enforcing request limits
+            cache_ttl: Seconds to cache route, API key and permission lookups
+                       in memory (default: 0, caching disabled)
         """
         self.db = db
         self.hmac_handler = hmac_handler or HMACHandler(db)
         self.api_key_handler = api_key_handler or APIKeyHandler()
         self.rate_limiter = rate_limiter
+        self._cache = LookupCache(cache_ttl) if cache_ttl > 0 else None
+
+    def _lookup(self, key: tuple, loader):
+        """Run a database lookup through the lookup cache, if enabled."""
+        if self._cache is None:
+            return loader()
+        return self._cache.get_or_load(key, loader)
+
+    def clear_cache(self) -> None:
+        """Drop all cached lookups so the next requests read the database."""
+        if self._cache is not None:
+            self._cache.clear()
+        self.hmac_handler.clear_cache()
 
     def authorize_request(
         self,
         path: str,
         method: HttpMethod,
         domain: Optional[str] = None,
-        headers: Optional[Dict[str, str]] = None,
-        body: str = '',
+        headers: Optional[Mapping[str, str]] = None,
+        body: Union[str, Callable[[], str]] = '',
         query_params: Optional[Dict[str, str]] = None
     ) -> AuthResult:
         """
@@ -60,8 +82,9 @@ class Authorizer:
             path: Request path (e.g., '/api/users/123')
             method: HTTP method
             domain: Domain for route matching (optional, e.g., 'api.example.com')
-            headers: HTTP headers dict (for extracting auth credentials)
-            body: Request body (for HMAC signature validation)
+            headers: HTTP headers, e.g. request.headers (for extracting auth credentials)
+            body: Request body (for HMAC signature validation), or a zero-argument
+                function returning it, called only if HMAC credentials are presented
             query_params: Query parameters (for API key extraction)
 
         Returns:
@@ -69,20 +92,15 @@ class Authorizer:
         """
         if headers is None:
             headers = {}
-        if query_params is None:
-            query_params = {}
-        # Step 1: Match routes
-        matching_routes = self._match_routes(path, domain)
+        # Steps 1-2: Match routes and select the best one (exact over wildcard)
+        route = self._find_route(path, domain)
 
-        if not matching_routes:
+        if route is None:
             return AuthResult(
                 allowed=False,
                 reason="no_route_match"
             )
 
-        # Step 2: Select best matching route (exact over wildcard)
-        route = self._select_best_route(matching_routes, path)
-
         # Step 3: Check if authentication is required for this method
         method_auth = route.get_auth_requirements(method)
 
@@ -103,7 +121,9 @@ class Authorizer:
             )
 
         # Step 4: Authentication required - validate credentials
-        client = self._authenticate_client(headers, path, method.value, body, query_params)
+        client, permission = self._authenticate_client(
+            headers, path, method.value, body, query_params, route.route_id
+        )
 
         if not client:
             return AuthResult(
@@ -123,7 +143,7 @@ class Authorizer:
             )
 
         # Step 6: Check permissions
-        permission_result = self._check_permission(client, route, method)
+        permission_result = self._check_permission(client, route, method, permission)
 
         if not permission_result.allowed:
             return permission_result
@@ -142,9 +162,9 @@ class Authorizer:
 
         return permission_result
 
-    def _match_routes(self, path: str, domain: Optional[str] = None) -> List[Route]:
+    def _find_route(self, path: str, domain: Optional[str] = None) -> Optional[Route]:
         """
-        Find all routes that match the given path and domain.
+        Find the route that governs a request.
 
         Matches both exact routes and wildcard routes.
         Matches exact domains, wildcard domains (*.example.com), and any domain (*).
@@ -154,9 +174,20 @@ class Authorizer:
             domain: Domain for route matching (optional)
 
         Returns:
-            List of matching routes sorted by specificity (may be empty)
+            Best matching route, or None if no route matches
         """
-        return self.db.find_matching_routes(path, domain)
+        if self._cache is None:
+            routes = self.db.find_matching_routes(path, domain)
+            return self._select_best_route(routes, path) if routes else None
+
+        # With caching enabled, one route index is built per TTL and shared
+        # by every request; it selects the best route in a single walk of
+        # the path instead of scanning and sorting all routes
+        matcher = self._cache.get_or_load(
+            ('route_matcher',),
+            lambda: RouteMatcher(self.db.load_all_routes())
+        )
+        return matcher.best(path, domain)
 
     def _select_best_route(self, routes: List[Route], path: str) -> Route:
         """
@@ -176,35 +207,28 @@ class Authorizer:
         if len(routes) == 1:
             return routes[0]
 
-        # Separate exact and wildcard matches
-        exact_matches = [r for r in routes if not r.route_pattern.endswith('/*')]
-        wildcard_matches = [r for r in routes if r.route_pattern.endswith('/*')]
-
-        # Exact match takes priority
-        if exact_matches:
-            if len(exact_matches) > 1:
-                # Should not happen with unique patterns, but handle gracefully
-                # Return first one
-                return exact_matches[0]
-            return exact_matches[0]
-
-        # Multiple wildcard matches - choose longest prefix (most specific)
-        if wildcard_matches:
-            # Sort by pattern length descending (longer = more specific)
-            wildcard_matches.sort(key=lambda r: len(r.route_pattern), reverse=True)
-            return wildcard_matches[0]
+        # One pass: the first exact match wins outright; otherwise keep the
+        # first of the longest wildcard patterns (most specific)
+        best_wildcard = None
+        best_wildcard_len = -1
+        for route in routes:
+            pattern = route.route_pattern
+            if not pattern.endswith('/*'):
+                return route
+            if len(pattern) > best_wildcard_len:
+                best_wildcard, best_wildcard_len = route, len(pattern)
 
-        # Fallback (shouldn't reach here)
-        return routes[0]
+        return best_wildcard
 
     def _authenticate_client(
         self,
-        headers: Dict[str, str],
+        headers: Mapping[str, str],
         path: str,
         method: str,
-        body: str,
-        query_params: Dict[str, str]
-    ) -> Optional[Client]:
+        body: Union[str, Callable[[], str]],
+        query_params: Optional[Dict[str, str]],
+        route_id: str
+    ) -> Tuple[Optional[Client], Any]:
         """
         Authenticate a client using credentials from request.
 
@@ -212,19 +236,30 @@ class Authorizer:
         1. HMAC signature (from Authorization header)
         2. API key (from Authorization header or query params)
 
+        An API key client is loaded together with its permission for the
+        route, so the permission check needs no further database query.
+
         Args:
             headers: HTTP headers
             path: Request path
             method: HTTP method string
-            body: Request body
-            query_params: Query parameters
+            body: Request body, or a function returning it
+            query_params: Query parameters, or None if the request had none
+            route_id: ID of the matched route
 
         Returns:
-            Client if authenticated, None otherwise
+            (client, permission) pair; client is None if authentication
+            failed, and permission is _NOT_LOADED unless it was loaded
+            with the client
         """
+        # Read once; the API key path reuses the value if HMAC does not apply
+        auth_header = headers.get('Authorization')
+
         # Try HMAC authentication first (more secure)
-        auth_header = headers.get('Authorization', '')
         if auth_header and auth_header.startswith('HMAC '):
+            # Only HMAC signs the body, so it is read here and nowhere else
+            if callable(body):
+                body = body()
             client = self.hmac_handler.authenticate(
                 auth_header=auth_header,
                 method=method,
@@ -232,22 +267,26 @@ class Authorizer:
                 body=body
             )
             if client:
-                return client
+                return client, _NOT_LOADED
 
         # Try API key authentication
-        api_key = self.api_key_handler.extract(headers, query_params)
+        api_key = self.api_key_handler.extract(headers, query_params, auth_header)
         if api_key:
-            client = self.db.load_client_by_api_key(api_key)
+            client, permission = self._lookup(
+                ('api_key', api_key, route_id),
+                lambda: self.db.load_client_with_permission_by_api_key(api_key, route_id)
+            )
             if client:
-                return client
+                return client, permission
 
-        return None
+        return None, _NOT_LOADED
 
     def _check_permission(
         self,
         client: Client,
         route: Route,
-        method: HttpMethod
+        method: HttpMethod,
+        permission: Any = _NOT_LOADED
     ) -> AuthResult:
         """
         Check if a client has permission to access a route with a specific method.
@@ -256,15 +295,21 @@ class Authorizer:
             client: Authenticated client
             route: Matched route
             method: HTTP method
+            permission: The client's permission for the route if already
+                loaded (None if it has none); loaded here otherwise
 
         Returns:
             AuthResult with permission decision
         """
         # Load permission for this client and route
-        permission = self.db.load_permission_by_client_and_route(
-            client.client_id,
-            route.route_id
-        )
+        if permission is _NOT_LOADED:
+            permission = self._lookup(
+                ('permission', client.client_id, route.route_id),
+                lambda: self.db.load_permission_by_client_and_route(
+                    client.client_id,
+                    route.route_id
+                )
+            )
 
         if not permission:
             return AuthResult(
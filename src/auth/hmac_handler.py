@@ -1,15 +1,45 @@
 """
 HMAC authentication handler using byteforge-hmac library.
 """
-from typing import Optional, Dict
+import re
+from typing import Optional
 from byteforge_hmac import (
+    AuthRequest,
     HMACAuthenticator,
     AuthHeaderParser,
-    SecretProvider
+    SecretProvider,
+    NonceStorage,
+    DictNonceStorage
 )
 
 from src.database.driver import AuthServiceDB
 from src.models.client import Client
+from .lookup_cache import LookupCache
+
+# Header in the exact field order RequestSigner and byteforge-hmac clients
+# produce; values exclude ',' and '"' so a match parses as AuthHeaderParser would
+_CANONICAL_HEADER = re.compile(
+    r'HMAC client_id="([^",]*)",timestamp="([^",]*)",nonce="([^",]*)",signature="([^",]*)"'
+)
+
+
+def _parse_auth_header(auth_header: str) -> Optional[AuthRequest]:
+    """
+    Parse an HMAC Authorization header.
+
+    Canonical headers are matched with one precompiled regex; any other
+    shape (reordered fields, extra whitespace) goes to AuthHeaderParser.
+
+    Args:
+        auth_header: Authorization header value
+
+    Returns:
+        AuthRequest if the header is well-formed, None otherwise
+    """
+    match = _CANONICAL_HEADER.fullmatch(auth_header)
+    if match:
+        return AuthRequest(*match.groups())
+    return AuthHeaderParser.parse(auth_header)
 
 
 class DatabaseSecretProvider(SecretProvider):
@@ -19,14 +49,36 @@ class DatabaseSecretProvider(SecretProvider):
     Integrates byteforge-hmac with our database layer.
     """
 
-    def __init__(self, db: AuthServiceDB):
+    def __init__(self, db: AuthServiceDB, cache_ttl: float = 0):
         """
         Initialize the secret provider.
 
         Args:
             db: Database driver instance
+            cache_ttl: Seconds to cache client lookups in memory
+                       (default: 0, caching disabled)
         """
         self.db = db
+        self._cache = LookupCache(cache_ttl) if cache_ttl > 0 else None
+
+    def load_client(self, client_id: str) -> Optional[Client]:
+        """
+        Load a client by ID through the lookup cache, if enabled.
+
+        Args:
+            client_id: Client identifier
+
+        Returns:
+            Client object if found, None otherwise
+        """
+        if self._cache is None:
+            return self.db.load_client_by_id(client_id)
+        return self._cache.get_or_load(client_id, lambda: self.db.load_client_by_id(client_id))
+
+    def clear_cache(self) -> None:
+        """Drop all cached clients so the next requests read the database."""
+        if self._cache is not None:
+            self._cache.clear()
 
     def get_secret(self, client_id: str) -> Optional[str]:
         """
@@ -38,7 +90,7 @@ class DatabaseSecretProvider(SecretProvider):
         Returns:
             Shared secret if client exists and has one, None otherwise
         """
-        client = self.db.load_client_by_id(client_id)
+        client = self.load_client(client_id)
         if client and client.shared_secret:
             return client.shared_secret
         return None
@@ -59,7 +111,8 @@ class HMACHandler:
         self,
         db: AuthServiceDB,
         timestamp_tolerance: int = 300,
-        nonce_storage: Optional[Dict[str, int]] = None
+        nonce_storage: Optional[NonceStorage] = None,
+        cache_ttl: float = 0
     ):
         """
         Initialize the HMAC handler.
@@ -67,15 +120,18 @@ class HMACHandler:
         Args:
             db: Database driver instance
             timestamp_tolerance: How many seconds old/future timestamps are accepted (default: 5 minutes)
-            nonce_storage: Optional dictionary for nonce replay protection.
+            nonce_storage: Optional nonce store for replay protection
+                          (default: in-process DictNonceStorage).
                           For production with multiple servers, use Redis.
+            cache_ttl: Seconds to cache client secrets in memory
+                       (default: 0, caching disabled)
         """
         self.db = db
-        self.secret_provider = DatabaseSecretProvider(db)
+        self.secret_provider = DatabaseSecretProvider(db, cache_ttl)
         self.authenticator = HMACAuthenticator(
             secret_provider=self.secret_provider,
             timestamp_tolerance=timestamp_tolerance,
-            nonce_storage=nonce_storage if nonce_storage is not None else {}
+            nonce_storage=nonce_storage if nonce_storage is not None else DictNonceStorage()
         )
 
     def authenticate(
@@ -108,7 +164,7 @@ class HMACHandler:
 
         try:
             # Parse the authorization header
-            auth_request = AuthHeaderParser.parse(auth_header)
+            auth_request = _parse_auth_header(auth_header)
             if not auth_request:
                 return None
 
@@ -123,14 +179,18 @@ class HMACHandler:
             if not is_valid:
                 return None
 
-            # Authentication succeeded - load and return the client
-            client = self.db.load_client_by_id(auth_request.client_id)
+            # Authentication succeeded - return the client the secret came from
+            client = self.secret_provider.load_client(auth_request.client_id)
             return client
 
         except Exception:
             # Authentication failed (invalid format, expired timestamp, replay, etc.)
             return None
 
+    def clear_cache(self) -> None:
+        """Drop cached client secrets so the next requests read the database."""
+        self.secret_provider.clear_cache()
+
     def get_client_id_from_header(self, auth_header: str) -> Optional[str]:
         """
         Extract client ID from authorization header without validating signature.
@@ -147,7 +207,7 @@ class HMACHandler:
             return None
 
         try:
-            auth_request = AuthHeaderParser.parse(auth_header)
+            auth_request = _parse_auth_header(auth_header)
             if auth_request:
                 return auth_request.client_id
         except Exception:
@@ -0,0 +1,90 @@
+"""
+In-process TTL cache for authorization lookups.
+
+Caches the database lookups made on every authz request (the route index,
+API key to client, client/route permission) so repeated requests for the
+same route and client are answered from memory. Entries expire after a
+short TTL; changes made through the admin scripts take effect once the
+cached entry expires.
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+# Default maximum number of cached lookups
+DEFAULT_MAX_SIZE = 10000
+
+# Marker for "no cached value", since None is a valid cached result
+_MISSING = object()
+
+
+class LookupCache:
+    """
+    Thread-safe, size-bounded cache whose entries expire after a fixed TTL.
+
+    When full, the least recently used entry is evicted.
+    """
+
+    def __init__(
+        self,
+        ttl: float,
+        max_size: int = DEFAULT_MAX_SIZE,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            ttl: Seconds a cached value stays valid
+            max_size: Maximum number of cached entries (default: 10000)
+            clock: Monotonic time source (overridable for tests)
+        """
+        self._ttl = ttl
+        self._max_size = max_size
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """
+        Return the cached value for key, calling loader on a miss or expiry.
+
+        The loader runs outside the lock, so concurrent misses for the same
+        key may each call it; the last result wins.
+
+        Args:
+            key: Hashable cache key
+            loader: Zero-argument function producing the value
+
+        Returns:
+            The cached or freshly loaded value
+        """
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key, _MISSING)
+            if entry is not _MISSING:
+                expires_at, value = entry
+                if expires_at > now:
+                    self._entries.move_to_end(key)
+                    return value
+                del self._entries[key]
+
+        value = loader()
+
+        with self._lock:
+            self._entries[key] = (now + self._ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+        return value
+
+    def clear(self) -> None:
+        """Remove all cached entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
@@ -5,7 +5,7 @@ from typing import Optional
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class AuthResult:
     """
     Result of an authorization check.
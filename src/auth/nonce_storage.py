@@ -19,8 +19,9 @@ class RedisNonceStorage:
     Redis-backed nonce storage with dict-like interface.
 
     Stores nonces with automatic expiration to prevent unbounded growth.
-    Implements __contains__ and __setitem__ for compatibility with
-    byteforge-hmac's HMACAuthenticator.
+    Implements put_if_absent, which byteforge-hmac's HMACAuthenticator uses
+    to check and record a nonce in a single atomic Redis command. The
+    dict-like methods remain for inspection and older callers.
     """
 
     def __init__(self, redis_client, ttl: int = DEFAULT_NONCE_TTL, key_prefix: str = "hmac_nonce"):
@@ -40,6 +41,24 @@ class RedisNonceStorage:
         """Generate Redis key for a nonce."""
         return f"{self._key_prefix}:{nonce}"
 
+    def put_if_absent(self, nonce: str, timestamp: int, ttl_seconds: int) -> bool:
+        """
+        Store a nonce only if it has not been seen, in one round trip.
+
+        Uses SET NX EX, so the check and the store are atomic across every
+        worker sharing this Redis instance.
+
+        Args:
+            nonce: The nonce to store
+            timestamp: The timestamp associated with the nonce
+            ttl_seconds: Seconds the nonce must be remembered for
+
+        Returns:
+            True if the nonce was stored (new), False if it already existed (replay)
+        """
+        key = self._get_key(nonce)
+        return bool(self._redis.set(key, str(timestamp), nx=True, ex=ttl_seconds))
+
     def __contains__(self, nonce: str) -> bool:
         """
         Check if a nonce has been used.
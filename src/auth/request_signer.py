@@ -1,8 +1,8 @@
 """
 Request signing utility for HMAC authentication (testing and client-side usage).
 """
+import os
 import time
-import uuid
 import hmac
 import hashlib
 from typing import Optional
@@ -21,7 +21,7 @@ class RequestSigner:
 
     Signature format matches byteforge-hmac:
     Message: {METHOD}\n{PATH}\n{TIMESTAMP}\n{NONCE}\n{BODY}
-    Header: HMAC client_id="id",timestamp="epoch",nonce="uuid",signature="hex"
+    Header: HMAC client_id="id",timestamp="epoch",nonce="hex",signature="hex"
     """
 
     def __init__(self, client_id: str, secret_key: str):
@@ -34,6 +34,9 @@ class RequestSigner:
         """
         self.client_id = client_id
         self.secret_key = secret_key
+        # Keyed once here; copying it per request skips re-deriving the
+        # inner and outer pads from the key on every signature
+        self._hmac_template = hmac.new(secret_key.encode('utf-8'), digestmod=hashlib.sha256)
 
     def sign_request(
         self,
@@ -54,26 +57,19 @@ class RequestSigner:
         """
         # Generate timestamp and nonce
         timestamp = str(int(time.time()))
-        nonce = str(uuid.uuid4())
+        # The nonce is opaque to the server, so 128 random bits are used
+        # directly rather than building and formatting a UUID
+        nonce = os.urandom(16).hex()
 
         # Construct message to sign: {METHOD}\n{PATH}\n{TIMESTAMP}\n{NONCE}\n{BODY}
-        message_parts = [
-            method.upper(),
-            path,
-            timestamp,
-            nonce,
-            body if body else ''
-        ]
-        message = '\n'.join(message_parts)
+        message = f"{method.upper()}\n{path}\n{timestamp}\n{nonce}\n{body or ''}"
 
         # Compute HMAC-SHA256 signature
-        signature = hmac.new(
-            self.secret_key.encode('utf-8'),
-            message.encode('utf-8'),
-            hashlib.sha256
-        ).hexdigest()
+        mac = self._hmac_template.copy()
+        mac.update(message.encode('utf-8'))
+        signature = mac.hexdigest()
 
-        # Format: HMAC client_id="id",timestamp="epoch",nonce="uuid",signature="hex"
+        # Format: HMAC client_id="id",timestamp="epoch",nonce="hex",signature="hex"
         auth_header = f'HMAC client_id="{self.client_id}",timestamp="{timestamp}",nonce="{nonce}",signature="{signature}"'
 
         return auth_header
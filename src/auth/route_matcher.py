@@ -0,0 +1,139 @@
+"""
+Precomputed route index for matching request paths without scanning every route.
+"""
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from src.models.route import Route
+
+# Key under which a wildcard trie node stores the routes ending at it
+_ROUTES = None
+
+
+class RouteMatcher:
+    """
+    Index of routes built once and reused across requests.
+
+    Exact patterns are kept in a dict keyed by path. Wildcard patterns are
+    stored in a character trie of their prefixes, so finding every wildcard
+    whose prefix starts the path is a single walk along the path.
+
+    Matching gives the same results, in the same order, as
+    AuthServiceDB.find_matching_routes over the same routes.
+    """
+
+    def __init__(self, routes: Iterable[Route]):
+        """
+        Build the index.
+
+        Args:
+            routes: Routes to index, in the order ties should be returned
+        """
+        self._exact: Dict[str, List[Tuple[int, Route]]] = {}
+        self._wildcards: dict = {}
+
+        for order, route in enumerate(routes):
+            pattern = route.route_pattern
+            if pattern.endswith('/*'):
+                node = self._wildcards
+                for char in pattern[:-2]:
+                    node = node.setdefault(char, {})
+                node.setdefault(_ROUTES, []).append((order, route))
+            else:
+                self._exact.setdefault(pattern, []).append((order, route))
+
+    def match(self, path: str, domain: Optional[str] = None) -> List[Route]:
+        """
+        Find all routes that match a path and domain.
+
+        Args:
+            path: URL path to match
+            domain: Domain to match (optional, case-insensitive)
+
+        Returns:
+            List of matching routes sorted by specificity (most specific first)
+        """
+        candidates = list(self._exact.get(path, ()))
+
+        node = self._wildcards
+        candidates.extend(node.get(_ROUTES, ()))
+        for char in path:
+            node = node.get(char)
+            if node is None:
+                break
+            candidates.extend(node.get(_ROUTES, ()))
+
+        domain_lower = domain.lower() if domain else ''
+        matched = [
+            (self._specificity(route, domain_lower), order, route)
+            for order, route in candidates
+            if route.matches_domain(domain)
+        ]
+        matched.sort(key=lambda item: item[:2])
+        return [route for _, _, route in matched]
+
+    def best(self, path: str, domain: Optional[str] = None) -> Optional[Route]:
+        """
+        Find the single route a request is authorized against.
+
+        Exact patterns win over wildcards and longer wildcard prefixes over
+        shorter ones; ties go to the most specific domain, then index order.
+        Gives the same route as Authorizer._select_best_route applied to
+        match(), without building or sorting the list of matches.
+
+        Args:
+            path: URL path to match
+            domain: Domain to match (optional, case-insensitive)
+
+        Returns:
+            Best matching route, or None if no route matches
+        """
+        domain_lower = domain.lower() if domain else ''
+
+        route = self._most_specific(self._exact.get(path, ()), domain, domain_lower)
+        if route is not None:
+            return route
+
+        # The deepest trie node with a matching route has the longest prefix
+        node = self._wildcards
+        best = self._most_specific(node.get(_ROUTES, ()), domain, domain_lower)
+        for char in path:
+            node = node.get(char)
+            if node is None:
+                break
+            if _ROUTES in node:
+                route = self._most_specific(node[_ROUTES], domain, domain_lower)
+                if route is not None:
+                    best = route
+        return best
+
+    def _most_specific(
+        self,
+        entries: Iterable[Tuple[int, Route]],
+        domain: Optional[str],
+        domain_lower: str
+    ) -> Optional[Route]:
+        """Most specific domain match among routes sharing one pattern, if any."""
+        best = None
+        best_key = None
+        for order, route in entries:
+            if route.matches_domain(domain):
+                key = (self._specificity(route, domain_lower), order)
+                if best_key is None or key < best_key:
+                    best, best_key = route, key
+        return best
+
+    @staticmethod
+    def _specificity(route: Route, domain_lower: str) -> tuple:
+        """Sort key for a matching route (lower is more specific)."""
+        # Domain specificity: exact (0) > wildcard subdomain (1) > any (*) (2)
+        if route.domain.lower() == domain_lower:
+            domain_score = 0
+        elif route.domain.startswith('*.'):
+            domain_score = 1
+        else:
+            domain_score = 2
+
+        # Path specificity: exact (0) > wildcard (1)
+        path_score = 1 if route.route_pattern.endswith('/*') else 0
+
+        return (domain_score, path_score)
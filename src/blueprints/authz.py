@@ -5,18 +5,25 @@ Handles nginx auth_request integration for API authorization.
 """
 import time
 import logging
+from functools import partial
+from urllib.parse import parse_qsl
 from flask import Blueprint, request, make_response, current_app
 from src.models.route import HttpMethod
 from src.monitoring import (
-    AUTH_REQUESTS_TOTAL,
-    AUTH_DURATION_SECONDS,
-    AUTH_ERRORS_TOTAL
+    AUTH_ERRORS_TOTAL,
+    UNMATCHED_ROUTE,
+    auth_request_metrics
 )
 
 logger = logging.getLogger(__name__)
 
 authz_bp = Blueprint('authz', __name__)
 
+# Method names as nginx sends them (and lower case) to HttpMethod, so the
+# usual spellings resolve with one dict lookup
+_METHODS = {method.name: method for method in HttpMethod}
+_METHODS.update({name.lower(): method for name, method in _METHODS.items()})
+
 
 @authz_bp.route('/authz', methods=['GET', 'POST', 'PUT', 'DELETE', 'PATCH', 'HEAD', 'OPTIONS'])
 def authorize():
@@ -37,7 +44,8 @@ def authorize():
             - Body contains denial reason
         500 Internal Server Error: System error
     """
-    start_time = time.time()
+    # Monotonic clock: durations are unaffected by wall-clock adjustments
+    start_ns = time.monotonic_ns()
 
     try:
         # Extract nginx forwarded headers
@@ -60,30 +68,21 @@ def authorize():
             # Remove port number if present (e.g., example.com:8080 -> example.com)
             domain = original_host.split(':')[0] if ':' in original_host else original_host
 
-        # Parse query parameters from URI
-        query_params = {}
-        if '?' in original_uri:
-            path, query_string = original_uri.split('?', 1)
-            # Simple query param parsing (nginx may provide this differently)
-            for param in query_string.split('&'):
-                if '=' in param:
-                    key, value = param.split('=', 1)
-                    query_params[key] = value
-        else:
-            path = original_uri
+        # Split off and decode query parameters (last value wins for repeated
+        # names). The path is left exactly as nginx sent it, and most URIs
+        # have no query string, so that case allocates nothing further.
+        path, _, query_string = original_uri.partition('?')
+        query_params = dict(parse_qsl(query_string, keep_blank_values=True)) if query_string else None
 
         # Convert method string to HttpMethod enum
-        try:
-            method = HttpMethod[original_method.upper()]
-        except KeyError:
+        method = _METHODS.get(original_method) or _METHODS.get(original_method.upper())
+        if method is None:
             logger.warning(f"Invalid HTTP method: {original_method}")
             return make_response(f'Invalid method: {original_method}', 400)
 
-        # Get request body for HMAC validation
-        body = request.get_data(as_text=True) if request.method in ['POST', 'PUT', 'PATCH'] else ''
-
-        # Convert headers to dict (case-insensitive dict-like object)
-        headers = dict(request.headers)
+        # Request body for HMAC validation, read only if HMAC credentials are presented;
+        # it is read once, so the raw bytes are not kept alongside the decoded text
+        body = partial(request.get_data, cache=False, as_text=True) if request.method in ('POST', 'PUT', 'PATCH') else ''
 
         # Authorize the request
         authorizer = current_app.config['AUTHORIZER']
@@ -91,40 +90,39 @@ def authorize():
             path=path,
             method=method,
             domain=domain,
-            headers=headers,
+            headers=request.headers,
             body=body,
-            query_params=query_params if query_params else None
+            query_params=query_params
         )
 
-        # Calculate duration
-        duration = time.time() - start_time
+        # Calculate duration (seconds for metrics, 0.01 ms resolution for logs)
+        elapsed_ns = time.monotonic_ns() - start_ns
+        duration = elapsed_ns / 1e9
+        duration_ms = elapsed_ns // 10_000 / 100
 
-        if result.allowed:
-            # Update metrics
-            AUTH_REQUESTS_TOTAL.labels(
-                result='allowed',
-                route_pattern=result.matched_route_id or path,
-                method=original_method
-            ).inc()
-
-            AUTH_DURATION_SECONDS.labels(
-                route_pattern=result.matched_route_id or path,
-                method=original_method
-            ).observe(duration)
+        # Update metrics
+        allowed_total, denied_total, duration_seconds = auth_request_metrics(
+            result.matched_route_id or UNMATCHED_ROUTE,
+            method.value
+        )
+        (allowed_total if result.allowed else denied_total).inc()
+        duration_seconds.observe(duration)
 
-            # Structured logging
-            logger.info("Authorization result", extra={
-                'client_ip': client_ip,
-                'client_id': result.client_id or 'public',
-                'client_name': result.client_name,
-                'route': path,
-                'domain': domain,
-                'route_id': result.matched_route_id,
-                'method': original_method,
-                'allowed': True,
-                'reason': result.reason,
-                'duration_ms': round(duration * 1000, 2)
-            })
+        if result.allowed:
+            # Structured logging (skip building the record when INFO is filtered out)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Authorization result", extra={
+                    'client_ip': client_ip,
+                    'client_id': result.client_id or 'public',
+                    'client_name': result.client_name,
+                    'route': path,
+                    'domain': domain,
+                    'route_id': result.matched_route_id,
+                    'method': original_method,
+                    'allowed': True,
+                    'reason': result.reason,
+                    'duration_ms': duration_ms
+                })
 
             response = make_response('', 200)
 
@@ -138,18 +136,6 @@ def authorize():
 
             return response
         else:
-            # Update metrics
-            AUTH_REQUESTS_TOTAL.labels(
-                result='denied',
-                route_pattern=result.matched_route_id or path,
-                method=original_method
-            ).inc()
-
-            AUTH_DURATION_SECONDS.labels(
-                route_pattern=result.matched_route_id or path,
-                method=original_method
-            ).observe(duration)
-
             # Structured logging
             logger.warning("Authorization denied", extra={
                 'client_ip': client_ip,
@@ -161,7 +147,7 @@ def authorize():
                 'method': original_method,
                 'allowed': False,
                 'reason': result.reason,
-                'duration_ms': round(duration * 1000, 2)
+                'duration_ms': duration_ms
             })
 
             # Return 429 for rate limit exceeded, 403 for other denials
@@ -169,7 +155,7 @@ def authorize():
             return make_response(result.reason, status_code)
 
     except Exception as e:
-        duration = time.time() - start_time
+        duration_ms = (time.monotonic_ns() - start_ns) // 10_000 / 100
 
         # Track error
         AUTH_ERRORS_TOTAL.labels(error_type=type(e).__name__).inc()
@@ -184,7 +170,7 @@ def authorize():
             'method': request.headers.get('X-Original-Method', 'unknown'),
             'error_type': type(e).__name__,
             'error_message': str(e),
-            'duration_ms': round(duration * 1000, 2)
+            'duration_ms': duration_ms
         }, exc_info=True)
 
         return make_response('Internal server error', 500)
@@ -42,12 +42,11 @@ def health_check():
     try:
         # Test database connection
         db = current_app.config['DB']
-        routes = db.load_all_routes()
-        clients = db.load_all_clients()
+        route_count, client_count = db.count_routes_and_clients()
 
         response_data['database'] = 'connected'
-        response_data['routes_configured'] = len(routes)
-        response_data['clients_configured'] = len(clients)
+        response_data['routes_configured'] = route_count
+        response_data['clients_configured'] = client_count
 
     except Exception as e:
         logger.error("Health check failed - database error", extra={
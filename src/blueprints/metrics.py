@@ -3,11 +3,16 @@ Prometheus metrics endpoint blueprint.
 
 Exposes metrics for monitoring and alerting.
 """
-from flask import Blueprint, Response
+import gzip
+
+from flask import Blueprint, Response, request
 from src.monitoring import get_metrics
 
 metrics_bp = Blueprint('metrics', __name__)
 
+# Fastest gzip level; exposition text compresses well even at level 1
+GZIP_LEVEL = 1
+
 
 @metrics_bp.route('/metrics', methods=['GET'])
 def prometheus_metrics():
@@ -20,8 +25,19 @@ def prometheus_metrics():
     - auth_errors_total: Total errors by type
     - db_connection_pool_connections: Database connection pool status
 
+    The body is gzip-compressed when the scraper accepts it (Prometheus
+    does by default).
+
     Returns:
         200 OK: Metrics in Prometheus exposition format
     """
     metrics_data, content_type = get_metrics()
-    return Response(metrics_data, mimetype=content_type)
+
+    if request.accept_encodings['gzip']:
+        response = Response(gzip.compress(metrics_data, GZIP_LEVEL), content_type=content_type)
+        response.headers['Content-Encoding'] = 'gzip'
+    else:
+        response = Response(metrics_data, content_type=content_type)
+
+    response.vary.add('Accept-Encoding')
+    return response
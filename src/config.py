@@ -0,0 +1,107 @@
+"""
+Environment and logging configuration for the API Gatekeeper service and scripts.
+"""
+import functools
+import logging
+import os
+from dataclasses import dataclass, field
+from typing import Optional
+
+# Result of the first load_env() call; None until the .env file has been parsed
+_env_loaded: Optional[bool] = None
+
+
+def load_env() -> bool:
+    """
+    Load environment variables from the .env file once per process.
+
+    Subsequent calls return the cached result without touching the file
+    system, so modules and scripts can call this freely at startup.
+
+    Returns:
+        True if a .env file was found and loaded, False otherwise
+    """
+    global _env_loaded
+    # Compare against None so a missing or empty .env is not re-parsed
+    if _env_loaded is None:
+        from dotenv import load_dotenv
+        _env_loaded = load_dotenv()
+    return _env_loaded
+
+
+@dataclass(frozen=True)
+class Settings:
+    """
+    Service settings, read from the environment once when the app is created.
+
+    Environment variables:
+        REDIS_HOST: Redis server; rate limiting and shared nonces are disabled if unset
+        REDIS_PORT: Redis port (default: 6379)
+        REDIS_PASSWORD: Redis password (optional)
+        REDIS_DB: Redis database number (default: 0)
+        REDIS_POOL_SIZE: Maximum Redis connections per worker (default: 32)
+        RATE_LIMIT_ALGORITHM: 'fixed' or 'sliding' (default: fixed)
+        AUTH_CACHE_TTL: Seconds to cache authorization lookups (default: 0, disabled)
+        PORT: Port for the development server (default: 7843)
+    """
+    redis_host: Optional[str] = None
+    redis_port: int = 6379
+    # Kept out of repr so settings can be logged safely
+    redis_password: Optional[str] = field(default=None, repr=False)
+    redis_db: int = 0
+    redis_pool_size: int = 32
+    rate_limit_algorithm: str = 'fixed'
+    auth_cache_ttl: float = 0.0
+    port: int = 7843
+
+    @classmethod
+    def from_env(cls) -> 'Settings':
+        """
+        Build settings from environment variables (after loading .env).
+
+        Returns:
+            Settings instance
+        """
+        load_env()
+        env = os.environ
+        return cls(
+            redis_host=env.get('REDIS_HOST') or None,
+            redis_port=int(env.get('REDIS_PORT', cls.redis_port)),
+            redis_password=env.get('REDIS_PASSWORD'),
+            redis_db=int(env.get('REDIS_DB', cls.redis_db)),
+            redis_pool_size=int(env.get('REDIS_POOL_SIZE', cls.redis_pool_size)),
+            rate_limit_algorithm=env.get('RATE_LIMIT_ALGORITHM', cls.rate_limit_algorithm).lower(),
+            auth_cache_ttl=float(env.get('AUTH_CACHE_TTL', cls.auth_cache_ttl)),
+            port=int(env.get('PORT', cls.port))
+        )
+
+
+@functools.cache
+def setup_logging() -> None:
+    """
+    Configure service logging once per process.
+
+    Sets up console or Loki logging through mazza-base and applies a JSON
+    formatter to the root handlers so extra fields are included in output.
+    Cached here rather than run at app module import, so loading the app
+    module under more than one name does not configure logging twice.
+
+    Environment variables:
+        DEBUG_LOCAL: 'true' for console logs, 'false' for Loki (default: true)
+        LOG_LEVEL: Log level for local output (default: INFO)
+    """
+    from mazza_base import configure_logging
+    from src.monitoring import json_formatter
+
+    load_env()
+    configure_logging(
+        application_tag='api-gatekeeper',
+        debug_local=os.environ.get('DEBUG_LOCAL', 'true').lower() == 'true',
+        local_level=os.environ.get('LOG_LEVEL', 'INFO')
+    )
+
+    formatter = json_formatter()
+
+    # Apply JSON formatter to all existing handlers
+    for handler in logging.root.handlers:
+        handler.setFormatter(formatter)
@@ -2,12 +2,16 @@
 Database driver for API Authentication Service.
 Provides connection pooling and database operations for routes, clients, and permissions.
 """
-from typing import Optional, List
+from typing import Optional, List, Iterable, Tuple
 from contextlib import contextmanager
+import io
 import json
+import uuid
+import threading
+import weakref
 import psycopg2
 from psycopg2.pool import ThreadedConnectionPool
-from psycopg2.extras import RealDictCursor
+from psycopg2.extras import RealDictCursor, execute_values
 
 from ..models.route import Route
 from ..models.client import Client
@@ -15,6 +19,31 @@ from ..models.client_permission import ClientPermission
 from ..models.rate_limit import RateLimit
 from ..monitoring import DB_CONNECTION_POOL
 
+# Characters escaped in COPY text format fields
+_COPY_ESCAPES = str.maketrans({'\\': '\\\\', '\t': '\\t', '\n': '\\n', '\r': '\\r'})
+
+
+def _copy_field(value) -> str:
+    """Encode a value as a COPY text format field (None becomes \\N)."""
+    if value is None:
+        return '\\N'
+    return str(value).translate(_COPY_ESCAPES)
+
+
+class _PoolStats:
+    """Active connection count shared by every handle on one pool."""
+
+    def __init__(self, max_conn: int):
+        self.active = 0
+        self.max_conn = max_conn
+        # Guards the count when handlers run in threads
+        self.lock = threading.Lock()
+
+
+# Handles sharing a pool share its stats, created by the first handle on it
+_pool_stats: 'weakref.WeakKeyDictionary[ThreadedConnectionPool, _PoolStats]' = weakref.WeakKeyDictionary()
+_pool_stats_lock = threading.Lock()
+
 
 class AuthServiceDB:
     """Database driver for API authentication service with connection pooling."""
@@ -27,7 +56,8 @@ class AuthServiceDB:
         db_password: str,
         db_port: int = 5432,
         min_conn: int = 2,
-        max_conn: int = 10
+        max_conn: int = 10,
+        pool: Optional[ThreadedConnectionPool] = None
     ):
         """
         Initialize database connection pool.
@@ -40,44 +70,66 @@ class AuthServiceDB:
             db_port: PostgreSQL port (default: 5432)
             min_conn: Minimum number of connections in pool
             max_conn: Maximum number of connections in pool
+            pool: Optional existing pool to share. A shared pool is not
+                  closed by close(); its owner is responsible for it.
         """
-        self.pool = ThreadedConnectionPool(
-            min_conn,
-            max_conn,
-            host=db_host,
-            port=db_port,
-            database=db_name,
-            user=db_user,
-            password=db_password
-        )
-        self._active_connections = 0
-        self._max_conn = max_conn
-
-        # Initialize pool metrics
-        DB_CONNECTION_POOL.labels(state='active').set(0)
-        DB_CONNECTION_POOL.labels(state='idle').set(min_conn)
-        DB_CONNECTION_POOL.labels(state='max').set(max_conn)
+        self._owns_pool = pool is None
+        if pool is None:
+            pool = ThreadedConnectionPool(
+                min_conn,
+                max_conn,
+                host=db_host,
+                port=db_port,
+                database=db_name,
+                user=db_user,
+                password=db_password
+            )
+        else:
+            max_conn = pool.maxconn
+        self.pool = pool
+        # Connection of the transaction() block active on the current thread
+        self._local = threading.local()
+
+        self._active_gauge = DB_CONNECTION_POOL.labels(state='active')
+        self._idle_gauge = DB_CONNECTION_POOL.labels(state='idle')
+        with _pool_stats_lock:
+            stats = _pool_stats.get(pool)
+            if stats is None:
+                # Initialize pool metrics once per pool, so a later handle
+                # sharing it does not reset the gauges mid-use
+                stats = _pool_stats[pool] = _PoolStats(max_conn)
+                self._active_gauge.set(0)
+                self._idle_gauge.set(pool.minconn)
+                DB_CONNECTION_POOL.labels(state='max').set(max_conn)
+        self._stats = stats
 
     @contextmanager
     def _get_connection(self):
         """Context manager for getting a connection from the pool."""
         conn = self.pool.getconn()
-        self._active_connections += 1
-        DB_CONNECTION_POOL.labels(state='active').set(self._active_connections)
-        DB_CONNECTION_POOL.labels(state='idle').set(self._max_conn - self._active_connections)
+        self._update_active_connections(1)
         try:
             yield conn
         finally:
             self.pool.putconn(conn)
-            self._active_connections -= 1
-            DB_CONNECTION_POOL.labels(state='active').set(self._active_connections)
-            DB_CONNECTION_POOL.labels(state='idle').set(self._max_conn - self._active_connections)
+            self._update_active_connections(-1)
+
+    def _update_active_connections(self, delta: int) -> None:
+        """Adjust the active connection count and publish pool metrics."""
+        stats = self._stats
+        with stats.lock:
+            stats.active += delta
+            self._active_gauge.set(stats.active)
+            self._idle_gauge.set(stats.max_conn - stats.active)
 
     @contextmanager
     def get_cursor(self, commit: bool = True, cursor_factory=None):
         """
         Context manager for database cursors with automatic commit/rollback.
 
+        Inside a transaction() block the cursor is opened on the transaction's
+        connection and commit/rollback is left to the transaction.
+
         Args:
             commit: Whether to commit on success
             cursor_factory: Optional cursor factory (e.g., RealDictCursor)
@@ -85,6 +137,15 @@ class AuthServiceDB:
         Yields:
             Database cursor
         """
+        transaction_conn = getattr(self._local, 'conn', None)
+        if transaction_conn is not None:
+            cursor = transaction_conn.cursor(cursor_factory=cursor_factory)
+            try:
+                yield cursor
+            finally:
+                cursor.close()
+            return
+
         with self._get_connection() as conn:
             cursor = conn.cursor(cursor_factory=cursor_factory)
             try:
@@ -97,6 +158,39 @@ class AuthServiceDB:
             finally:
                 cursor.close()
 
+    @contextmanager
+    def transaction(self, cursor_factory=None):
+        """
+        Context manager that runs all database operations in one transaction.
+
+        Every operation on this thread inside the block (save_*, delete_*,
+        load_*) shares a single connection and is committed once on success
+        or rolled back together on error. Nested calls join the outer
+        transaction.
+
+        Args:
+            cursor_factory: Optional cursor factory (e.g., RealDictCursor)
+
+        Yields:
+            Database cursor on the transaction's connection
+        """
+        if getattr(self._local, 'conn', None) is not None:
+            with self.get_cursor(cursor_factory=cursor_factory) as cursor:
+                yield cursor
+            return
+
+        with self._get_connection() as conn:
+            self._local.conn = conn
+            try:
+                with self.get_cursor(cursor_factory=cursor_factory) as cursor:
+                    yield cursor
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+            finally:
+                self._local.conn = None
+
     def load_route_by_id(self, route_id: str) -> Optional[Route]:
         """
         Load a route by its ID.
@@ -117,6 +211,28 @@ class AuthServiceDB:
                 return None
             return Route.from_dict(dict(result))
 
+    def load_routes_by_ids(self, route_ids: Iterable[str]) -> List[Route]:
+        """
+        Load several routes by ID in a single query.
+
+        Args:
+            route_ids: Route identifiers; IDs that don't exist are skipped
+
+        Returns:
+            List of Route objects
+        """
+        route_ids = list(route_ids)
+        if not route_ids:
+            return []
+
+        with self.get_cursor(commit=False, cursor_factory=RealDictCursor) as cursor:
+            cursor.execute(
+                "SELECT * FROM routes WHERE route_id = ANY(%s::uuid[])",
+                (route_ids,)
+            )
+            results = cursor.fetchall()
+            return [Route.from_dict(dict(row)) for row in results]
+
     def load_route_by_pattern(self, pattern: str) -> Optional[Route]:
         """
         Load a route by its exact pattern.
@@ -262,6 +378,62 @@ class AuthServiceDB:
             route.route_id = route_id
             return route_id
 
+    def save_routes_bulk(self, routes: List[Route]) -> List[str]:
+        """
+        Insert or update multiple routes with a single multi-row INSERT.
+
+        Routes without a route_id get a new UUID; routes with one are
+        upserted, matching save_route.
+
+        Args:
+            routes: Route objects to save
+
+        Returns:
+            List of route_ids in the same order as the input routes
+
+        Raises:
+            ValueError: If the same route_id appears more than once
+        """
+        if not routes:
+            return []
+
+        route_ids = [route.route_id or str(uuid.uuid4()) for route in routes]
+        if len(set(route_ids)) != len(route_ids):
+            raise ValueError("Duplicate route_id in bulk save")
+
+        rows = []
+        for route, route_id in zip(routes, route_ids):
+            route_dict = route.to_dict()
+            route_dict['route_id'] = route_id
+            route_dict['methods'] = json.dumps(route_dict['methods'])
+            rows.append(route_dict)
+
+        with self.get_cursor() as cursor:
+            execute_values(
+                cursor,
+                """
+                INSERT INTO routes (route_id, route_pattern, domain, service_name, methods, created_at, updated_at)
+                VALUES %s
+                ON CONFLICT (route_id)
+                DO UPDATE SET
+                    route_pattern = EXCLUDED.route_pattern,
+                    domain = EXCLUDED.domain,
+                    service_name = EXCLUDED.service_name,
+                    methods = EXCLUDED.methods,
+                    updated_at = EXCLUDED.updated_at
+                """,
+                rows,
+                template="""(
+                    %(route_id)s, %(route_pattern)s, %(domain)s,
+                    %(service_name)s, %(methods)s, %(created_at)s, %(updated_at)s
+                )""",
+                page_size=len(rows)
+            )
+
+        for route, route_id in zip(routes, route_ids):
+            route.route_id = route_id
+        return route_ids
+
     def delete_route(self, route_id: str) -> bool:
         """
         Delete a route by its ID.
@@ -321,6 +493,41 @@ class AuthServiceDB:
                 return None
             return Client.from_dict(dict(result))
 
+    def load_client_with_permission_by_api_key(
+        self, api_key: str, route_id: str
+    ) -> Tuple[Optional[Client], Optional[ClientPermission]]:
+        """
+        Load a client by its API key together with its permission for a route in one query.
+
+        Args:
+            api_key: Client's API key
+            route_id: Route identifier
+
+        Returns:
+            (Client, ClientPermission) pair; the permission is None if the
+            client has none for the route, and both are None if no client
+            has the API key
+        """
+        with self.get_cursor(commit=False, cursor_factory=RealDictCursor) as cursor:
+            cursor.execute(
+                """
+                SELECT c.*, to_jsonb(p) AS permission
+                FROM clients c
+                LEFT JOIN client_permissions p
+                    ON p.client_id = c.client_id AND p.route_id = %s
+                WHERE c.api_key = %s
+                """,
+                (route_id, api_key)
+            )
+            result = cursor.fetchone()
+            if not result:
+                return None, None
+            permission = result['permission']
+            return (
+                Client.from_dict(result),
+                ClientPermission.from_dict(permission) if permission else None
+            )
+
     def load_client_by_shared_secret(self, shared_secret: str) -> Optional[Client]:
         """
         Load a client by its shared secret.
@@ -353,6 +560,19 @@ class AuthServiceDB:
             results = cursor.fetchall()
             return [Client.from_dict(dict(row)) for row in results]
 
+    def count_routes_and_clients(self) -> Tuple[int, int]:
+        """
+        Count configured routes and clients in one query.
+
+        Returns:
+            (route count, client count)
+        """
+        with self.get_cursor(commit=False) as cursor:
+            cursor.execute(
+                "SELECT (SELECT count(*) FROM routes), (SELECT count(*) FROM clients)"
+            )
+            return cursor.fetchone()
+
     def save_client(self, client: Client) -> str:
         """
         Insert or update a client in the database.
@@ -401,6 +621,103 @@ class AuthServiceDB:
             client.client_id = client_id
             return client_id
 
+    def save_clients_bulk(self, clients: List[Client]) -> List[str]:
+        """
+        Insert or update multiple clients with a single multi-row INSERT.
+
+        Clients without a client_id get a new UUID; clients with one are
+        upserted, matching save_client.
+
+        Args:
+            clients: Client objects to save
+
+        Returns:
+            List of client_ids in the same order as the input clients
+
+        Raises:
+            ValueError: If the same client_id appears more than once
+        """
+        if not clients:
+            return []
+
+        client_ids = [client.client_id or str(uuid.uuid4()) for client in clients]
+        if len(set(client_ids)) != len(client_ids):
+            raise ValueError("Duplicate client_id in bulk save")
+
+        rows = []
+        for client, client_id in zip(clients, client_ids):
+            client_dict = client.to_dict()
+            client_dict['client_id'] = client_id
+            rows.append(client_dict)
+
+        with self.get_cursor() as cursor:
+            execute_values(
+                cursor,
+                """
+                INSERT INTO clients (client_id, client_name, shared_secret, api_key, status, created_at, updated_at)
+                VALUES %s
+                ON CONFLICT (client_id)
+                DO UPDATE SET
+                    client_name = EXCLUDED.client_name,
+                    shared_secret = EXCLUDED.shared_secret,
+                    api_key = EXCLUDED.api_key,
+                    status = EXCLUDED.status,
+                    updated_at = EXCLUDED.updated_at
+                """,
+                rows,
+                template="""(
+                    %(client_id)s, %(client_name)s, %(shared_secret)s,
+                    %(api_key)s, %(status)s, %(created_at)s, %(updated_at)s
+                )""",
+                page_size=len(rows)
+            )
+
+        for client, client_id in zip(clients, client_ids):
+            client.client_id = client_id
+        return client_ids
+
+    def copy_clients(self, clients: Iterable[Client]) -> List[str]:
+        """
+        Insert clients with COPY FROM STDIN, the fastest path for bulk loads.
+
+        Unlike save_clients_bulk this only inserts: COPY fails if any
+        client_id already exists. Clients without a client_id are assigned
+        a random UUID before loading, since COPY cannot return generated keys.
+
+        Args:
+            clients: Client objects to insert
+
+        Returns:
+            List of client_ids in the same order as the input clients
+        """
+        buffer = io.StringIO()
+        client_ids = []
+        for client in clients:
+            if client.client_id is None:
+                client.client_id = str(uuid.uuid4())
+            row = client.to_dict()
+            buffer.write('\t'.join(_copy_field(row[column]) for column in (
+                'client_id', 'client_name', 'shared_secret', 'api_key',
+                'status', 'created_at', 'updated_at'
+            )))
+            buffer.write('\n')
+            client_ids.append(client.client_id)
+
+        if not client_ids:
+            return []
+
+        buffer.seek(0)
+        with self.get_cursor() as cursor:
+            cursor.copy_expert(
+                """
+                COPY clients (client_id, client_name, shared_secret, api_key, status, created_at, updated_at)
+                FROM STDIN
+                """,
+                buffer
+            )
+
+        return client_ids
+
     def delete_client(self, client_id: str) -> bool:
         """
         Delete a client by its ID.
@@ -477,6 +794,72 @@ class AuthServiceDB:
             results = cursor.fetchall()
             return [ClientPermission.from_dict(dict(row)) for row in results]
 
+    def load_all_permissions(self) -> List[ClientPermission]:
+        """
+        Load all permissions from the database.
+
+        Returns:
+            List of all ClientPermission objects
+        """
+        with self.get_cursor(commit=False, cursor_factory=RealDictCursor) as cursor:
+            cursor.execute("SELECT * FROM client_permissions ORDER BY created_at")
+            results = cursor.fetchall()
+            return [ClientPermission.from_dict(dict(row)) for row in results]
+
+    def load_permissions_with_routes(self, client_id: str) -> List[Tuple[ClientPermission, Route]]:
+        """
+        Load a client's permissions together with their routes in one query.
+
+        Args:
+            client_id: Client identifier
+
+        Returns:
+            List of (ClientPermission, Route) pairs ordered by route pattern
+        """
+        with self.get_cursor(commit=False, cursor_factory=RealDictCursor) as cursor:
+            cursor.execute(
+                """
+                SELECT p.*, to_jsonb(r) AS route
+                FROM client_permissions p
+                JOIN routes r ON r.route_id = p.route_id
+                WHERE p.client_id = %s
+                ORDER BY r.route_pattern
+                """,
+                (client_id,)
+            )
+            results = cursor.fetchall()
+            return [
+                (ClientPermission.from_dict(row), Route.from_dict(row['route']))
+                for row in results
+            ]
+
+    def load_permissions_with_clients(self, route_id: str) -> List[Tuple[ClientPermission, Client]]:
+        """
+        Load a route's permissions together with their clients in one query.
+
+        Args:
+            route_id: Route identifier
+
+        Returns:
+            List of (ClientPermission, Client) pairs ordered by client name
+        """
+        with self.get_cursor(commit=False, cursor_factory=RealDictCursor) as cursor:
+            cursor.execute(
+                """
+                SELECT p.*, to_jsonb(c) AS client
+                FROM client_permissions p
+                JOIN clients c ON c.client_id = p.client_id
+                WHERE p.route_id = %s
+                ORDER BY c.client_name
+                """,
+                (route_id,)
+            )
+            results = cursor.fetchall()
+            return [
+                (ClientPermission.from_dict(row), Client.from_dict(row['client']))
+                for row in results
+            ]
+
     def load_permission_by_client_and_route(
         self, client_id: str, route_id: str
     ) -> Optional[ClientPermission]:
@@ -547,6 +930,67 @@ class AuthServiceDB:
             permission.permission_id = permission_id
             return permission_id
 
+    def save_permissions_bulk(self, permissions: List[ClientPermission]) -> List[str]:
+        """
+        Insert multiple permissions with a single multi-row INSERT.
+
+        Like save_permission for new permissions, an existing permission for
+        the same client/route pair has its allowed methods updated and keeps
+        its permission_id.
+
+        Args:
+            permissions: ClientPermission objects to save
+
+        Returns:
+            List of permission_ids in the same order as the input permissions
+
+        Raises:
+            ValueError: If the same client/route pair appears more than once
+        """
+        if not permissions:
+            return []
+
+        keys = [
+            (str(uuid.UUID(str(p.client_id))), str(uuid.UUID(str(p.route_id))))
+            for p in permissions
+        ]
+        if len(set(keys)) != len(keys):
+            raise ValueError("Duplicate client_id/route_id pair in bulk save")
+
+        rows = []
+        for permission in permissions:
+            perm_dict = permission.to_dict()
+            perm_dict['permission_id'] = permission.permission_id or str(uuid.uuid4())
+            rows.append(perm_dict)
+
+        with self.get_cursor() as cursor:
+            results = execute_values(
+                cursor,
+                """
+                INSERT INTO client_permissions (permission_id, client_id, route_id, allowed_methods, created_at)
+                VALUES %s
+                ON CONFLICT (client_id, route_id)
+                DO UPDATE SET
+                    allowed_methods = EXCLUDED.allowed_methods
+                RETURNING client_id, route_id, permission_id
+                """,
+                rows,
+                template="""(
+                    %(permission_id)s, %(client_id)s, %(route_id)s,
+                    %(allowed_methods)s, %(created_at)s
+                )""",
+                page_size=len(rows),
+                fetch=True
+            )
+
+        # An existing pair keeps its permission_id, so match rows by pair
+        # rather than relying on RETURNING order
+        saved_ids = {(str(row[0]), str(row[1])): str(row[2]) for row in results}
+        permission_ids = [saved_ids[key] for key in keys]
+        for permission, permission_id in zip(permissions, permission_ids):
+            permission.permission_id = permission_id
+        return permission_ids
+
     def delete_permission(self, permission_id: str) -> bool:
         """
         Delete a permission by its ID.
@@ -664,8 +1108,8 @@ class AuthServiceDB:
             return cursor.rowcount > 0
 
     def close(self) -> None:
-        """Close all connections in the pool."""
-        if self.pool and not self.pool.closed:
+        """Close all connections in the pool (unless the pool is shared)."""
+        if self._owns_pool and self.pool and not self.pool.closed:
             self.pool.closeall()
 
     def __del__(self):
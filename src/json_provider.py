@@ -0,0 +1,27 @@
+"""
+Flask JSON provider backed by orjson.
+"""
+import orjson
+from flask.json.provider import DefaultJSONProvider
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    JSON provider that encodes and decodes with orjson.
+
+    Follows the default provider's settings: keys are sorted and responses
+    are compact unless indentation is requested (debug mode). Dates and
+    datetimes are encoded by orjson as ISO 8601; other types orjson does
+    not handle natively fall back to DefaultJSONProvider.default.
+    """
+
+    def dumps(self, obj, **kwargs) -> str:
+        """Serialize obj to a JSON string."""
+        option = orjson.OPT_SORT_KEYS if self.sort_keys else 0
+        if kwargs.get('indent'):
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=self.default, option=option).decode()
+
+    def loads(self, s, **kwargs):
+        """Deserialize JSON from a string or bytes."""
+        return orjson.loads(s)
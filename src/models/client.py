@@ -3,6 +3,7 @@ Client model for API authentication.
 """
 from typing import Optional
 from dataclasses import dataclass
+from functools import cached_property
 from enum import Enum
 import time
 
@@ -61,6 +62,23 @@ class Client:
         """Check if client has an API key."""
         return self.api_key is not None
 
+    @staticmethod
+    def _short(value: Optional[str]) -> str:
+        """Truncate a credential to 8 characters plus "..."; shorter values show in full."""
+        if not value:
+            return "None"
+        return f"{value[:8]}..." if len(value) > 8 else value
+
+    @cached_property
+    def api_key_short(self) -> str:
+        """API key truncated to its first 8 characters for display, or "None"."""
+        return self._short(self.api_key)
+
+    @cached_property
+    def shared_secret_short(self) -> str:
+        """Shared secret truncated to its first 8 characters for display, or "None"."""
+        return self._short(self.shared_secret)
+
     @classmethod
     def from_dict(cls, data: dict) -> 'Client':
         """
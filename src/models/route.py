@@ -1,9 +1,10 @@
 """
 Route model for endpoint authentication and authorization.
 """
-from typing import Optional, Dict
+from typing import Optional, Dict, Iterable
 from dataclasses import dataclass
 from enum import Enum
+from functools import cached_property
 import time
 
 from .method_auth import MethodAuth
@@ -20,6 +21,15 @@ class HttpMethod(Enum):
     OPTIONS = "OPTIONS"
 
 
+# HttpMethod values, looked up once instead of through Enum.value on each render
+_METHOD_VALUE = {m: m.value for m in HttpMethod}
+
+
+def format_methods(methods: Iterable[HttpMethod]) -> str:
+    """Render HTTP methods as a comma-separated list for display."""
+    return ", ".join([_METHOD_VALUE[m] for m in methods])
+
+
 @dataclass
 class Route:
     """
@@ -154,6 +164,11 @@ class Route:
         method_auth = self.get_auth_requirements(method)
         return method_auth.auth_required if method_auth else False
 
+    @cached_property
+    def methods_str(self) -> str:
+        """Configured HTTP methods as a comma-separated list for display."""
+        return format_methods(self.methods)
+
     @classmethod
     def from_dict(cls, data: dict) -> 'Route':
         """
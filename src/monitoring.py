@@ -6,11 +6,10 @@ Provides Prometheus metrics and structured logging for the auth service.
 
 from prometheus_client import Counter, Histogram, Gauge, generate_latest, CONTENT_TYPE_LATEST
 import time
-from functools import wraps
-from typing import Callable
+from functools import lru_cache, wraps
+from typing import Callable, Tuple
 import logging
 import os
-from pythonjsonlogger import jsonlogger
 
 
 # Prometheus Metrics
@@ -40,6 +39,55 @@ DB_CONNECTION_POOL = Gauge(
 )
 
 
+# Route label used for requests that matched no configured route, so
+# arbitrary client-supplied paths cannot create new metric series
+UNMATCHED_ROUTE = 'unmatched'
+
+# Upper bound on cached label children (routes x methods)
+METRIC_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=METRIC_CACHE_SIZE)
+def auth_request_metrics(route_pattern: str, method: str) -> Tuple:
+    """
+    Get the metric children for one route and method.
+
+    Binding labels once per (route, method) spares the authz hot path the
+    labels() lookup and its lock on every request.
+
+    Args:
+        route_pattern: Matched route ID, or UNMATCHED_ROUTE
+        method: HTTP method name
+
+    Returns:
+        Tuple of (allowed counter, denied counter, duration histogram)
+    """
+    return (
+        AUTH_REQUESTS_TOTAL.labels(result='allowed', route_pattern=route_pattern, method=method),
+        AUTH_REQUESTS_TOTAL.labels(result='denied', route_pattern=route_pattern, method=method),
+        AUTH_DURATION_SECONDS.labels(route_pattern=route_pattern, method=method)
+    )
+
+
+def json_formatter() -> logging.Formatter:
+    """
+    Build the JSON log formatter shared by the service's logging setups.
+
+    Returns:
+        Formatter emitting timestamp, logger name, level, message and extras
+    """
+    try:
+        # orjson-backed formatter: same output, several times faster to encode
+        from pythonjsonlogger.orjson import OrjsonFormatter as JsonFormatter
+    except ImportError:
+        from pythonjsonlogger.jsonlogger import JsonFormatter
+
+    return JsonFormatter(
+        '%(asctime)s %(name)s %(levelname)s %(message)s',
+        timestamp=True
+    )
+
+
 def setup_json_logging(app):
     """
     Configure JSON structured logging for the application.
@@ -47,13 +95,8 @@ def setup_json_logging(app):
     Args:
         app: Flask application instance
     """
-    # Create JSON formatter
     log_handler = logging.StreamHandler()
-    formatter = jsonlogger.JsonFormatter(
-        '%(asctime)s %(name)s %(levelname)s %(message)s',
-        timestamp=True
-    )
-    log_handler.setFormatter(formatter)
+    log_handler.setFormatter(json_formatter())
 
     # Get log level from environment variable (default: INFO)
     log_level_name = os.environ.get('LOG_LEVEL', 'INFO').upper()
@@ -0,0 +1,137 @@
+"""
+Interactive prompt helpers shared by the management scripts.
+"""
+
+# Responses accepted as "yes" by get_yes_no
+_YES = frozenset({'y', 'yes'})
+
+
+def get_input(prompt: str, default: str = None) -> str:
+    """Get user input with optional default value."""
+    if default:
+        prompt = f"{prompt} [{default}]: "
+    else:
+        prompt = f"{prompt}: "
+
+    value = input(prompt).strip()
+    if not value and default:
+        return default
+    return value
+
+
+def get_yes_no(prompt: str, default: bool = False) -> bool:
+    """Get yes/no input from user."""
+    default_str = "Y/n" if default else "y/N"
+    response = input(f"{prompt} [{default_str}]: ").strip().lower()
+
+    if not response:
+        return default
+    return response in _YES
+
+
+def get_choice(prompt: str, choices: list, default: str = None) -> str:
+    """Get a choice from a list of options."""
+    choices_display = "\n".join(f"  {i}. {choice}" for i, choice in enumerate(choices, 1))
+    print(f"\n{prompt}\n{choices_display}")
+
+    if default:
+        choice_prompt = f"Enter choice (1-{len(choices)}) [{default}]: "
+    else:
+        choice_prompt = f"Enter choice (1-{len(choices)}): "
+
+    while True:
+        response = input(choice_prompt).strip()
+
+        if not response and default:
+            return default
+
+        # Out-of-range numbers surface as IndexError; only the lower bound
+        # needs a check, since 0 and negatives would wrap around the list
+        try:
+            idx = int(response)
+            if idx > 0:
+                return choices[idx - 1]
+        except (ValueError, IndexError):
+            pass
+
+        print(f"Invalid choice. Please enter a number between 1 and {len(choices)}")
+
+
+# Largest candidate list shown without first asking for a name prefix
+MAX_LISTED = 10
+
+
+class _TrieNode:
+    """Node of a PrefixIndex; holds every item whose name passes through it."""
+
+    __slots__ = ('children', 'items')
+
+    def __init__(self):
+        self.children = {}
+        self.items = []
+
+
+class PrefixIndex:
+    """
+    Case-insensitive character trie mapping name prefixes to items.
+
+    Building the index touches each character of each name once; a lookup
+    then walks one node per prefix character and returns the items stored
+    at that node, independent of the total number of items.
+    """
+
+    def __init__(self, items: list, key):
+        self._root = _TrieNode()
+        for item in items:
+            node = self._root
+            node.items.append(item)
+            for char in key(item).casefold():
+                node = node.children.setdefault(char, _TrieNode())
+                node.items.append(item)
+
+    def search(self, prefix: str) -> list:
+        """Return the items whose name starts with prefix, in insertion order."""
+        node = self._root
+        for char in prefix.casefold():
+            node = node.children.get(char)
+            if node is None:
+                return []
+        return node.items
+
+
+def narrow_by_prefix(items: list, key, noun: str) -> list:
+    """
+    Narrow a long list of items by name prefix before numeric selection.
+
+    Lists of at most MAX_LISTED items are returned unchanged. Otherwise the
+    user is asked for a prefix until at most MAX_LISTED items match; a blank
+    response keeps the current candidates.
+
+    Args:
+        items: Items to choose from
+        key: Function returning the name an item is searched by
+        noun: Plural name of the items, used in messages
+
+    Returns:
+        The candidate items to list
+    """
+    if len(items) <= MAX_LISTED:
+        return items
+
+    index = PrefixIndex(items, key)
+    candidates = items
+    print(f"\n{len(items)} {noun} found.")
+
+    while True:
+        prefix = input("Type a name prefix to narrow the list (blank to show the list): ").strip()
+        if not prefix:
+            return candidates
+
+        matches = index.search(prefix)
+        if not matches:
+            print(f"No {noun} match '{prefix}'")
+        elif len(matches) <= MAX_LISTED:
+            return matches
+        else:
+            candidates = matches
+            print(f"{len(matches)} {noun} match '{prefix}'; type a longer prefix")
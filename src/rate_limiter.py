@@ -1,7 +1,8 @@
 """
 Rate limiting service with Redis backend.
 
-Uses rolling 24-hour windows for rate limiting.
+Uses 24-hour windows for rate limiting, either fixed per client (the
+default) or an approximate sliding window.
 """
 import time
 import logging
@@ -12,6 +13,28 @@ logger = logging.getLogger(__name__)
 # 24 hours in seconds
 TTL_24_HOURS = 86400
 
+# Increment a counter and start its expiry window if it has none, in one
+# server-side step (equivalent to INCR + EXPIRE NX, without needing Redis 7)
+_INCREMENT_SCRIPT = """
+local count = redis.call('INCR', KEYS[1])
+if redis.call('TTL', KEYS[1]) == -1 then
+    redis.call('EXPIRE', KEYS[1], ARGV[1])
+end
+return count
+"""
+
+# Increment the current window's counter and read the previous window's,
+# in one server-side step. Each counter lives for two windows so it can
+# still be read as "previous" throughout the following window.
+_SLIDING_WINDOW_SCRIPT = """
+local current = redis.call('INCR', KEYS[1])
+if redis.call('TTL', KEYS[1]) == -1 then
+    redis.call('EXPIRE', KEYS[1], ARGV[1])
+end
+local previous = tonumber(redis.call('GET', KEYS[2]) or '0')
+return {current, previous}
+"""
+
 
 class RedisBackend:
     """Redis-based rate limit storage."""
@@ -24,6 +47,8 @@ class RedisBackend:
             redis_client: Redis client instance
         """
         self._redis = redis_client
+        # Sent as EVALSHA, so each check is one command and one round trip
+        self._increment = redis_client.register_script(_INCREMENT_SCRIPT)
 
     def _get_key(self, client_id: str) -> str:
         """Generate Redis key for rate limit counter."""
@@ -43,14 +68,7 @@ class RedisBackend:
             Tuple of (current_count, is_allowed)
         """
         key = self._get_key(client_id)
-
-        pipe = self._redis.pipeline()
-        pipe.incr(key)
-        # Only set expiry if key is new (NX = only if not exists)
-        pipe.expire(key, TTL_24_HOURS, nx=True)
-
-        results = pipe.execute()
-        current_count = results[0]
+        current_count = self._increment(keys=[key], args=[TTL_24_HOURS])
 
         if current_count > limit:
             return current_count, False
@@ -64,6 +82,80 @@ class RedisBackend:
         return int(count) if count else 0
 
 
+class SlidingWindowBackend:
+    """
+    Redis-based rate limit storage using an approximate sliding window.
+
+    Keeps one counter per client per fixed 24-hour window. The count for a
+    request is the current window's counter plus the previous window's,
+    weighted by how much of the previous window still overlaps the last
+    24 hours. This avoids the burst a fixed window allows at its boundary
+    while storing only two integers per client.
+    """
+
+    def __init__(self, redis_client, window: int = TTL_24_HOURS, clock=time.time):
+        """
+        Initialize sliding window backend.
+
+        Args:
+            redis_client: Redis client instance
+            window: Window length in seconds (default: 24 hours)
+            clock: Wall-clock time source shared by all workers (overridable for tests)
+        """
+        self._redis = redis_client
+        self._window = window
+        self._clock = clock
+        self._increment = redis_client.register_script(_SLIDING_WINDOW_SCRIPT)
+
+    def _get_keys(self, client_id: str) -> tuple[list[str], float]:
+        """
+        Generate Redis keys for the current and previous window counters.
+
+        Returns:
+            Tuple of ([current_key, previous_key], weight of the previous window)
+        """
+        window_id, elapsed = divmod(self._clock(), self._window)
+        window_id = int(window_id)
+        keys = [
+            f"ratelimit:{client_id}:{window_id}",
+            f"ratelimit:{client_id}:{window_id - 1}"
+        ]
+        return keys, 1 - elapsed / self._window
+
+    def increment_and_check(self, client_id: str, limit: int) -> tuple[int, bool]:
+        """
+        Increment counter and check limit using Redis.
+
+        Args:
+            client_id: Client identifier
+            limit: Maximum requests allowed per 24 hours
+
+        Returns:
+            Tuple of (current_count, is_allowed)
+        """
+        keys, weight = self._get_keys(client_id)
+        current, previous = self._increment(keys=keys, args=[2 * self._window])
+        current_count = int(previous * weight + current)
+
+        if current_count > limit:
+            return current_count, False
+
+        return current_count, True
+
+    def get_current_count(self, client_id: str) -> int:
+        """Get current weighted count from Redis."""
+        keys, weight = self._get_keys(client_id)
+        current, previous = self._redis.mget(keys)
+        return int(int(previous or 0) * weight + int(current or 0))
+
+
+# Backends selectable through RATE_LIMIT_ALGORITHM
+BACKENDS = {
+    'fixed': RedisBackend,
+    'sliding': SlidingWindowBackend,
+}
+
+
 class RateLimiter:
     """
     Rate limiter service that checks and enforces request limits.
@@ -77,7 +169,7 @@ class RateLimiter:
 
         Args:
             db: Database driver instance for loading rate limit configs
-            backend: Rate limit storage backend (Redis)
+            backend: Rate limit storage backend (RedisBackend or SlidingWindowBackend)
         """
         self._db = db
         self._backend = backend
@@ -1,6 +1,7 @@
 """
 Utility functions for the API authentication service.
 """
-from .db_connection import get_db_connection
+from .db_connection import get_db_connection, db_session
+from .schema import schema_path, iter_statements, execute_statements
 
-__all__ = ['get_db_connection']
+__all__ = ['get_db_connection', 'db_session', 'schema_path', 'iter_statements', 'execute_statements']
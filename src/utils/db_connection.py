@@ -3,25 +3,46 @@ Database connection utilities for scripts.
 """
 import os
 import sys
-from typing import Optional
-from dotenv import load_dotenv
+import atexit
+from contextlib import contextmanager
+from typing import Iterator, Optional
+from psycopg2.pool import ThreadedConnectionPool
 
+from src.config import load_env
 from src.database import AuthServiceDB
 
 # Load environment variables from .env file
-load_dotenv()
+load_env()
+
+# Connection pool shared by every get_db_connection() call in this process
+_shared_pool: Optional[ThreadedConnectionPool] = None
+
+
+def _close_shared_pool() -> None:
+    """Close the shared connection pool at interpreter exit."""
+    global _shared_pool
+    if _shared_pool is not None and not _shared_pool.closed:
+        _shared_pool.closeall()
+    _shared_pool = None
 
 
 def get_db_connection(verbose: bool = True) -> AuthServiceDB:
     """
     Create and return a database connection using environment variables.
 
+    All handles returned in the same process share one connection pool, so
+    nested or repeated calls reuse already-open connections instead of
+    reconnecting. Calling close() on a handle leaves the shared pool open;
+    it is closed automatically when the process exits.
+
     Environment variables:
         POSTGRES_HOST: Database host (default: localhost)
         POSTGRES_PORT: Database port (default: 5432)
         API_AUTH_ADMIN_PG_DB: Database name (default: api_auth_admin)
         API_AUTH_ADMIN_PG_USER: Database user (default: api_auth_admin)
         API_AUTH_ADMIN_PG_PASSWORD: Database password (required)
+        DB_POOL_MIN_SIZE: Connections opened when the pool is created (default: 2)
+        DB_POOL_SIZE: Maximum connections in the pool (default: 10)
 
     Args:
         verbose: Whether to print connection status messages
@@ -32,30 +53,72 @@ def get_db_connection(verbose: bool = True) -> AuthServiceDB:
     Raises:
         SystemExit: If required environment variables are missing or connection fails
     """
+    global _shared_pool
+
     db_host = os.environ.get('POSTGRES_HOST', 'localhost')
     db_port = int(os.environ.get('POSTGRES_PORT', '5432'))
     db_name = os.environ.get('API_AUTH_ADMIN_PG_DB', 'api_auth_admin')
     db_user = os.environ.get('API_AUTH_ADMIN_PG_USER', 'api_auth_admin')
     db_password = os.environ.get('API_AUTH_ADMIN_PG_PASSWORD')
+    pool_min_size = int(os.environ.get('DB_POOL_MIN_SIZE', '2'))
+    pool_size = int(os.environ.get('DB_POOL_SIZE', '10'))
 
     if not db_password:
         print("Error: API_AUTH_ADMIN_PG_PASSWORD environment variable is required")
         sys.exit(1)
 
-    if verbose:
-        print(f"Connecting to database '{db_name}' at {db_host}:{db_port}...")
+    if _shared_pool is None or _shared_pool.closed:
+        if verbose:
+            print(f"Connecting to database '{db_name}' at {db_host}:{db_port}...")
+
+        try:
+            pool = ThreadedConnectionPool(
+                pool_min_size,
+                pool_size,
+                host=db_host,
+                port=db_port,
+                database=db_name,
+                user=db_user,
+                password=db_password
+            )
+        except Exception as e:
+            print(f"Error connecting to database: {e}")
+            sys.exit(1)
+
+        if _shared_pool is None:
+            atexit.register(_close_shared_pool)
+        _shared_pool = pool
 
-    try:
-        db = AuthServiceDB(
-            db_host=db_host,
-            db_port=db_port,
-            db_name=db_name,
-            db_user=db_user,
-            db_password=db_password
-        )
         if verbose:
             print("✓ Connected\n")
-        return db
-    except Exception as e:
-        print(f"Error connecting to database: {e}")
-        sys.exit(1)
+
+    return AuthServiceDB(
+        db_host=db_host,
+        db_port=db_port,
+        db_name=db_name,
+        db_user=db_user,
+        db_password=db_password,
+        min_conn=pool_min_size,
+        pool=_shared_pool
+    )
+
+
+@contextmanager
+def db_session(verbose: bool = True) -> Iterator[AuthServiceDB]:
+    """
+    Context manager yielding a database handle that is closed on exit.
+
+    Scripts open one session in main() and pass the handle to their helpers
+    rather than having each helper connect on its own.
+
+    Args:
+        verbose: Whether to print connection status messages
+
+    Yields:
+        AuthServiceDB instance
+    """
+    db = get_db_connection(verbose=verbose)
+    try:
+        yield db
+    finally:
+        db.close()
@@ -0,0 +1,215 @@
+"""
+SQL schema file utilities for database setup scripts.
+"""
+import os
+import re
+import functools
+import psycopg2
+from typing import Iterable, Iterator, List, TextIO
+
+# Read schema files in 64 KiB chunks
+CHUNK_SIZE = 65536
+
+# Maximum number of statements sent to the server in one query message
+BATCH_SIZE = 100
+
+# Dollar-quote tags are $$ or $identifier$ (identifiers are at most 63 chars)
+_DOLLAR_TAG = re.compile(r'\$(?:[A-Za-z_][A-Za-z0-9_]*)?\$')
+
+# Characters that must be buffered past the scan position before a token can be
+# classified (longest possible dollar-quote tag plus its delimiters)
+_LOOKAHEAD = 66
+
+
+@functools.lru_cache(maxsize=1)
+def schema_path() -> str:
+    """
+    Return the path of the bundled database schema file.
+
+    The path is resolved and checked once per process.
+
+    Returns:
+        Absolute path to src/database/schema.sql
+
+    Raises:
+        FileNotFoundError: If the schema file does not exist
+    """
+    src_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    path = os.path.join(src_root, 'database', 'schema.sql')
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"schema file not found at {path}")
+    return path
+
+
+def iter_statements(fp: TextIO, chunk_size: int = CHUNK_SIZE) -> Iterator[str]:
+    """
+    Stream complete SQL statements from a file object.
+
+    Reads the file in chunks and yields each statement as soon as its
+    terminating semicolon is seen, so the whole file is never held in memory.
+    Semicolons inside single-quoted strings, quoted identifiers, dollar-quoted
+    bodies ($$...$$ or $tag$...$tag$), -- line comments and /* */ block
+    comments (including nested ones) do not end a statement.
+
+    Args:
+        fp: Text file object positioned at the start of the SQL script
+        chunk_size: Number of characters to read per chunk
+
+    Yields:
+        Statement text without the trailing semicolon. Statements consisting
+        only of comments or whitespace are skipped.
+    """
+    buf = ''
+    start = 0          # Start of the current statement in buf
+    pos = 0            # Scan position in buf
+    state = None       # None, "'", '"', '--', '/*' or a dollar-quote tag
+    comment_depth = 0
+    has_code = False   # Current statement contains something besides comments
+    eof = False
+
+    while not eof:
+        chunk = fp.read(chunk_size)
+        if chunk:
+            buf = buf[start:] + chunk
+            pos -= start
+            start = 0
+        else:
+            eof = True
+
+        end = len(buf)
+        # Leave enough unscanned text to classify multi-character tokens
+        # until more data has been read
+        limit = end if eof else end - _LOOKAHEAD
+
+        while pos < limit:
+            ch = buf[pos]
+
+            if state is None:
+                if ch == ';':
+                    if has_code:
+                        yield buf[start:pos].strip()
+                    pos += 1
+                    start = pos
+                    has_code = False
+                    continue
+                if ch == '-' and buf.startswith('--', pos):
+                    state = '--'
+                    pos += 2
+                    continue
+                if ch == '/' and buf.startswith('/*', pos):
+                    state = '/*'
+                    comment_depth = 1
+                    pos += 2
+                    continue
+                if not ch.isspace():
+                    has_code = True
+                if ch in ("'", '"'):
+                    state = ch
+                elif ch == '$':
+                    match = _DOLLAR_TAG.match(buf, pos)
+                    if match:
+                        state = match.group()
+                        pos = match.end()
+                        continue
+                pos += 1
+
+            elif state == '--':
+                if ch == '\n':
+                    state = None
+                pos += 1
+
+            elif state == '/*':
+                if buf.startswith('*/', pos):
+                    comment_depth -= 1
+                    if comment_depth == 0:
+                        state = None
+                    pos += 2
+                elif buf.startswith('/*', pos):
+                    comment_depth += 1
+                    pos += 2
+                else:
+                    pos += 1
+
+            elif state in ("'", '"'):
+                # Doubled quotes ('' or "") close and immediately reopen
+                if ch == state:
+                    state = None
+                pos += 1
+
+            else:
+                # Inside a dollar-quoted body; state holds the tag
+                if ch == '$' and buf.startswith(state, pos):
+                    pos += len(state)
+                    state = None
+                else:
+                    pos += 1
+
+    if has_code:
+        yield buf[start:].strip()
+
+
+def _rollback(cursor) -> None:
+    """
+    Roll back the open transaction on a separate cursor.
+
+    Leaves cursor.query pointing at the failed statement for error reports.
+    """
+    with cursor.connection.cursor() as rollback_cursor:
+        rollback_cursor.execute('ROLLBACK')
+
+
+def execute_statements(cursor, statements: Iterable[str], batch_size: int = BATCH_SIZE) -> int:
+    """
+    Execute SQL statements in batches, one server round-trip per batch.
+
+    Each batch is joined into a single multi-statement query, which PostgreSQL
+    runs as one implicit transaction when the connection is in autocommit mode.
+    If a batch fails, it has been rolled back as a whole. Its statements are
+    then replayed one at a time inside an explicit transaction that is always
+    rolled back, so the error is raised from the statement that caused it
+    (available afterwards as ``error.cursor.query``) without committing any
+    of the statements before it.
+
+    Args:
+        cursor: psycopg2 cursor on a connection in autocommit mode
+        statements: Statements without trailing semicolons (e.g. from iter_statements)
+        batch_size: Maximum number of statements per round-trip
+
+    Returns:
+        Number of statements executed
+
+    Raises:
+        psycopg2.Error: If a statement fails
+    """
+    count = 0
+    batch: List[str] = []
+
+    def flush() -> None:
+        try:
+            # Statements may end in a -- comment, so terminate on a new line
+            cursor.execute('\n;\n'.join(batch))
+        except psycopg2.Error as batch_error:
+            # The batch was rolled back; replaying it statement by statement
+            # raises from the statement at fault. The replay is diagnostic
+            # only, so it runs in a transaction that is never committed
+            cursor.execute('BEGIN')
+            try:
+                for statement in batch:
+                    cursor.execute(statement)
+            except psycopg2.Error:
+                _rollback(cursor)
+                raise
+            _rollback(cursor)
+            raise batch_error
+
+    for statement in statements:
+        batch.append(statement)
+        count += 1
+        if len(batch) >= batch_size:
+            flush()
+            batch = []
+
+    if batch:
+        flush()
+
+    return count
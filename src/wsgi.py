@@ -0,0 +1,15 @@
+"""
+WSGI entry point for production servers.
+
+Configures logging and builds the application once per worker process:
+
+    gunicorn src.wsgi:app
+"""
+from src.config import setup_logging
+
+# Must be done before the app is created so startup is logged
+setup_logging()
+
+from src.app import create_app
+
+app = create_app()
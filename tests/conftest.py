@@ -5,7 +5,6 @@ CRITICAL: All tests use the api_auth_admin_test database to avoid affecting prod
 import os
 import pytest
 import psycopg2
-from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT
 from dotenv import load_dotenv
 
 from src.database import AuthServiceDB
@@ -44,7 +43,7 @@ def ensure_test_db_exists(test_db_config):
             user=os.environ.get('POSTGRES_USER', 'postgres'),
             password=os.environ['PG_PASSWORD']
         )
-        conn.set_isolation_level(ISOLATION_LEVEL_AUTOCOMMIT)
+        conn.autocommit = True
 
         with conn.cursor() as cursor:
             cursor.execute(
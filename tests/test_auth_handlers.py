@@ -2,9 +2,14 @@
 Unit tests for authentication handlers (API Key, HMAC).
 CRITICAL: All tests use the api_auth_admin_test database via fixtures.
 """
+import hashlib
+import hmac
 import pytest
 import time
+from unittest.mock import patch
+from byteforge_hmac import AuthHeaderParser
 from src.auth import APIKeyHandler, HMACHandler, DatabaseSecretProvider, RequestSigner
+from src.auth.hmac_handler import _parse_auth_header
 from src.models.client import Client, ClientStatus
 
 
@@ -56,6 +61,23 @@ class TestAPIKeyHandler:
 
         assert api_key == 'test-key'
 
+    def test_scheme_without_credentials_is_raw_key(self):
+        """Test a bare scheme word with no key is passed through unchanged."""
+        handler = APIKeyHandler()
+
+        assert handler.extract_from_header({'Authorization': 'Bearer '}) == 'Bearer'
+        assert handler.extract_from_header({'Authorization': 'Bearer   spaced-key '}) == 'spaced-key'
+        assert handler.extract_from_header({'Authorization': 'hmac x'}) is None
+
+    def test_werkzeug_headers(self):
+        """Test extraction directly from a request's Werkzeug headers."""
+        from werkzeug.datastructures import EnvironHeaders
+        handler = APIKeyHandler()
+        headers = EnvironHeaders({'HTTP_AUTHORIZATION': 'Bearer environ-key'})
+
+        assert handler.extract_from_header(headers) == 'environ-key'
+        assert handler.extract_from_header(EnvironHeaders({})) is None
+
     def test_mixed_case_bearer_prefix(self):
         """Test that Bearer prefix is case-insensitive."""
         handler = APIKeyHandler()
@@ -101,6 +123,15 @@ class TestAPIKeyHandler:
 
         assert api_key == 'query-key-456'
 
+    def test_exact_query_param_name_preferred(self):
+        """Test the exact parameter name wins over other casings."""
+        handler = APIKeyHandler()
+        query_params = {'API_KEY': 'upper-key', 'api_key': 'exact-key'}
+
+        api_key = handler.extract_from_query(query_params)
+
+        assert api_key == 'exact-key'
+
     def test_query_param_list_value(self):
         """Test extraction when query param has list value (take first)."""
         handler = APIKeyHandler()
@@ -166,6 +197,23 @@ class TestAPIKeyHandler:
 
         assert api_key is None
 
+    def test_extract_uses_preread_authorization_header(self):
+        """Test that an already-read Authorization value is used instead of the headers."""
+        handler = APIKeyHandler()
+
+        api_key = handler.extract({}, None, 'Bearer preread-key')
+
+        assert api_key == 'preread-key'
+
+    def test_extract_ignores_preread_value_for_custom_header(self):
+        """Test that a handler reading another header does not use the Authorization value."""
+        handler = APIKeyHandler(header_name='X-API-Key')
+        headers = {'X-API-Key': 'custom-header-key', 'Authorization': 'Bearer other-key'}
+
+        api_key = handler.extract(headers, None, 'Bearer other-key')
+
+        assert api_key == 'custom-header-key'
+
     def test_custom_header_name(self):
         """Test using custom header name."""
         handler = APIKeyHandler(header_name='X-API-Key')
@@ -226,6 +274,25 @@ class TestDatabaseSecretProvider:
 
         assert secret is None
 
+    def test_cached_secret_reads_database_once(self, clean_db):
+        """Test a caching provider reuses the client until the cache is cleared."""
+        client = Client.create_new(
+            client_name='Cached HMAC Client',
+            shared_secret='cached-secret',
+            status=ClientStatus.ACTIVE
+        )
+        clean_db.save_client(client)
+
+        provider = DatabaseSecretProvider(clean_db, cache_ttl=30)
+        with patch.object(clean_db, 'load_client_by_id', wraps=clean_db.load_client_by_id) as load_client:
+            assert provider.get_secret(client.client_id) == 'cached-secret'
+            assert provider.load_client(client.client_id).client_id == client.client_id
+            assert load_client.call_count == 1
+
+            provider.clear_cache()
+            assert provider.get_secret(client.client_id) == 'cached-secret'
+            assert load_client.call_count == 2
+
 
 class TestHMACHandler:
     """Test HMAC signature validation."""
@@ -420,6 +487,26 @@ class TestHMACHandler:
         assert client is not None
         assert client.client_id == hmac_client.client_id
 
+    def test_header_parsing_matches_library(self):
+        """Test the canonical-header fast path parses exactly as AuthHeaderParser does."""
+        canonical = RequestSigner(client_id='client-123', secret_key='secret').sign_get('/api/test')
+        reordered = 'HMAC nonce="n-1", signature="abc",client_id="client-123",timestamp="1700000000"'
+        comma_in_value = 'HMAC client_id="a,b",timestamp="1",nonce="n",signature="s"'
+
+        for header in (canonical, reordered, comma_in_value):
+            assert _parse_auth_header(header) == AuthHeaderParser.parse(header)
+        assert _parse_auth_header(canonical).client_id == 'client-123'
+        assert _parse_auth_header(reordered).nonce == 'n-1'
+        assert _parse_auth_header(comma_in_value) is None
+
+    def test_get_client_id_from_header(self, clean_db):
+        """Test reading the client ID from a header without validating it."""
+        handler = HMACHandler(clean_db)
+        header = RequestSigner(client_id='client-123', secret_key='secret').sign_get('/api/test')
+
+        assert handler.get_client_id_from_header(header) == 'client-123'
+        assert handler.get_client_id_from_header('HMAC garbage') is None
+
 
 class TestRequestSigner:
     """Test request signing utility for generating valid HMAC signatures."""
@@ -547,3 +634,19 @@ class TestRequestSigner:
 
         # Should work (method normalized internally)
         assert auth_header.startswith('HMAC ')
+
+    def test_repeated_signatures_match_fresh_hmac(self):
+        """Test that reusing the keyed HMAC gives the documented signature every time."""
+        signer = RequestSigner(client_id='client-123', secret_key='secret-key')
+
+        for body in ('{"data": "first"}', '{"data": "second"}'):
+            auth_header = signer.sign_post('/api/test', body)
+            fields = dict(
+                part.split('=', 1) for part in auth_header[len('HMAC '):].split(',')
+            )
+            timestamp = fields['timestamp'].strip('"')
+            nonce = fields['nonce'].strip('"')
+            message = f"POST\n/api/test\n{timestamp}\n{nonce}\n{body}"
+            expected = hmac.new(b'secret-key', message.encode('utf-8'), hashlib.sha256).hexdigest()
+
+            assert fields['signature'].strip('"') == expected
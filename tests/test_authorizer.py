@@ -3,7 +3,10 @@ Unit tests for the Authorization Engine.
 CRITICAL: All tests use the api_auth_admin_test database via fixtures.
 """
 import pytest
+from unittest.mock import patch
 from src.auth import Authorizer, AuthResult, RequestSigner
+from src.auth import RouteMatcher
+from src.auth.lookup_cache import LookupCache
 from src.models.route import Route, HttpMethod
 from src.models.method_auth import MethodAuth, AuthType
 from src.models.client import Client, ClientStatus
@@ -109,6 +112,29 @@ class TestRouteMatching:
         assert result.allowed is True
         assert result.matched_route_id == specific_route.route_id
 
+    def test_equal_wildcards_prefer_specific_domain(self, clean_db):
+        """Test that of two equally long wildcards, the exact-domain route is chosen."""
+        any_domain_route = Route.create_new(
+            route_pattern='/api/*',
+            domain='*',
+            service_name='any-service',
+            methods={HttpMethod.GET: MethodAuth(auth_required=False)}
+        )
+        clean_db.save_route(any_domain_route)
+
+        domain_route = Route.create_new(
+            route_pattern='/api/*',
+            domain='api.example.com',
+            service_name='domain-service',
+            methods={HttpMethod.GET: MethodAuth(auth_required=False)}
+        )
+        clean_db.save_route(domain_route)
+
+        authorizer = Authorizer(clean_db)
+        result = authorizer.authorize_request('/api/users/123', HttpMethod.GET, domain='api.example.com')
+
+        assert result.matched_route_id == domain_route.route_id
+
 
 class TestPublicRoutes:
     """Test public routes (no authentication required)."""
@@ -456,6 +482,207 @@ class TestSharedSecretAuth:
         assert result.allowed is False
         assert result.reason == "invalid_credentials"
 
+    def test_body_callable_read_only_for_hmac(self, clean_db):
+        """Test a body function is called for HMAC requests and skipped for API keys."""
+        route = Route.create_new(
+            route_pattern='/api/hmac-test',
+            domain='*',
+            service_name='test-service',
+            methods={HttpMethod.POST: MethodAuth(auth_required=True, auth_type=AuthType.HMAC)}
+        )
+        clean_db.save_route(route)
+
+        client = Client.create_new(
+            client_name='HMAC Client',
+            api_key='body-test-key',
+            shared_secret='test-shared-secret',
+            status=ClientStatus.ACTIVE
+        )
+        clean_db.save_client(client)
+
+        permission = ClientPermission.create_new(
+            client_id=client.client_id,
+            route_id=route.route_id,
+            allowed_methods=[HttpMethod.POST]
+        )
+        clean_db.save_permission(permission)
+
+        signer = RequestSigner(
+            client_id=client.client_id,
+            secret_key='test-shared-secret'
+        )
+        auth_header = signer.sign_post('/api/hmac-test', '{"test": "data"}')
+        reads = []
+
+        def read_body():
+            reads.append(True)
+            return '{"test": "data"}'
+
+        authorizer = Authorizer(clean_db)
+        result = authorizer.authorize_request(
+            '/api/hmac-test',
+            HttpMethod.POST,
+            headers={'Authorization': auth_header},
+            body=read_body
+        )
+
+        assert result.allowed is True
+        assert len(reads) == 1
+
+        authorizer.authorize_request(
+            '/api/hmac-test',
+            HttpMethod.POST,
+            headers={'Authorization': 'Bearer body-test-key'},
+            body=read_body
+        )
+
+        assert len(reads) == 1
+
+
+class TestRouteMatcher:
+    """Test the precomputed route index."""
+
+    def test_matches_database_lookup(self, clean_db):
+        """Test RouteMatcher returns the same routes in the same order as the database."""
+        patterns = [
+            ('/*', '*'),
+            ('/api/*', '*'),
+            ('/api/users', '*'),
+            ('/api/users/*', '*.example.com'),
+            ('/api/users/*', 'api.example.com'),
+            ('/api/users', 'API.example.com'),
+            ('/api/userstats/*', '*'),
+            ('/other', 'other.com'),
+        ]
+        for pattern, domain in patterns:
+            clean_db.save_route(Route.create_new(
+                route_pattern=pattern,
+                domain=domain,
+                service_name='test-service',
+                methods={HttpMethod.GET: MethodAuth(auth_required=False)}
+            ))
+
+        matcher = RouteMatcher(clean_db.load_all_routes())
+
+        for path in ['/api/users', '/api/users/1', '/api/userstats/2', '/other', '/', '/x']:
+            for domain in [None, 'api.example.com', 'a.example.com', 'other.com']:
+                expected = [r.route_id for r in clean_db.find_matching_routes(path, domain)]
+                actual = [r.route_id for r in matcher.match(path, domain)]
+                assert actual == expected, (path, domain)
+
+    def test_best_matches_authorizer_selection(self, clean_db):
+        """Test RouteMatcher.best picks the route the uncached authorizer would."""
+        patterns = [
+            ('/*', '*'),
+            ('/api/*', 'api.example.com'),
+            ('/api/*', '*'),
+            ('/api/users', '*'),
+            ('/api/users/*', '*'),
+            ('/api/users/*', '*.example.com'),
+            ('/api/users', 'api.example.com'),
+            ('/other/*', 'other.com'),
+        ]
+        for pattern, domain in patterns:
+            clean_db.save_route(Route.create_new(
+                route_pattern=pattern,
+                domain=domain,
+                service_name='test-service',
+                methods={HttpMethod.GET: MethodAuth(auth_required=False)}
+            ))
+
+        matcher = RouteMatcher(clean_db.load_all_routes())
+        authorizer = Authorizer(clean_db)
+
+        for path in ['/api/users', '/api/users/1', '/api/x', '/other/1', '/', '/x']:
+            for domain in [None, 'api.example.com', 'a.example.com', 'other.com']:
+                expected = authorizer._find_route(path, domain)
+                actual = matcher.best(path, domain)
+                assert (actual and actual.route_id) == (expected and expected.route_id), (path, domain)
+
+        clean_db.delete_route(clean_db.load_route_by_pattern('/*').route_id)
+        assert RouteMatcher(clean_db.load_all_routes()).best('/x', 'other.com') is None
+
+
+class TestLookupCache:
+    """Test the in-process lookup cache and its use by the authorizer."""
+
+    def test_entries_expire_after_ttl(self):
+        """Test cached values are reloaded once the TTL has passed."""
+        now = [100.0]
+        cache = LookupCache(ttl=10, clock=lambda: now[0])
+        calls = []
+
+        def loader():
+            calls.append(now[0])
+            return None
+
+        assert cache.get_or_load('key', loader) is None
+        now[0] = 109.0
+        assert cache.get_or_load('key', loader) is None
+        now[0] = 110.0
+        cache.get_or_load('key', loader)
+
+        assert calls == [100.0, 110.0]
+
+    def test_least_recently_used_entry_evicted(self):
+        """Test the cache stays within max_size by evicting the oldest entry."""
+        cache = LookupCache(ttl=60, max_size=2)
+        cache.get_or_load('a', lambda: 1)
+        cache.get_or_load('b', lambda: 2)
+        cache.get_or_load('a', lambda: 0)
+        cache.get_or_load('c', lambda: 3)
+
+        assert len(cache) == 2
+        assert cache.get_or_load('a', lambda: 0) == 1
+        assert cache.get_or_load('b', lambda: 0) == 0
+
+    def test_authorizer_reuses_lookups(self, clean_db):
+        """Test a caching authorizer reads each lookup from the database once."""
+        route = Route.create_new(
+            route_pattern='/api/cached',
+            domain='*',
+            service_name='test-service',
+            methods={HttpMethod.GET: MethodAuth(auth_required=True, auth_type=AuthType.API_KEY)}
+        )
+        clean_db.save_route(route)
+        client = Client.create_new(client_name='Cached Client', api_key='cached-key')
+        clean_db.save_client(client)
+        clean_db.save_permission(ClientPermission.create_new(
+            client_id=client.client_id,
+            route_id=route.route_id,
+            allowed_methods=[HttpMethod.GET]
+        ))
+
+        authorizer = Authorizer(clean_db, cache_ttl=30)
+        headers = {'Authorization': 'Bearer cached-key'}
+
+        with patch.object(clean_db, 'load_all_routes', wraps=clean_db.load_all_routes) as load_routes, \
+                patch.object(clean_db, 'load_client_with_permission_by_api_key',
+                             wraps=clean_db.load_client_with_permission_by_api_key) as load_client, \
+                patch.object(clean_db, 'load_permission_by_client_and_route',
+                             wraps=clean_db.load_permission_by_client_and_route) as load_permission:
+            for _ in range(3):
+                result = authorizer.authorize_request('/api/cached', HttpMethod.GET, headers=headers)
+                assert result.allowed is True
+
+        assert load_routes.call_count == 1
+        assert load_client.call_count == 1
+        assert load_permission.call_count == 0
+
+    def test_cache_disabled_by_default(self, clean_db):
+        """Test the authorizer sees database changes immediately without a TTL."""
+        authorizer = Authorizer(clean_db)
+        assert authorizer.authorize_request('/api/late', HttpMethod.GET).reason == "no_route_match"
+
+        clean_db.save_route(Route.create_new(
+            route_pattern='/api/late',
+            domain='*',
+            service_name='test-service',
+            methods={HttpMethod.GET: MethodAuth(auth_required=False)}
+        ))
+
+        assert authorizer.authorize_request('/api/late', HttpMethod.GET).allowed is True
+
 
 class TestAuthResultModel:
     """Test AuthResult model methods."""
@@ -510,3 +737,11 @@ class TestAuthResultModel:
         assert result.client_id is None
         assert result.client_name is None
         assert result.matched_route_id is None
+
+    def test_uses_slots(self):
+        """Test AuthResult instances carry no per-instance __dict__."""
+        result = AuthResult(allowed=True, reason="authenticated")
+
+        assert not hasattr(result, '__dict__')
+        with pytest.raises(AttributeError):
+            result.extra = 'value'
@@ -156,6 +156,15 @@ class TestClientCRUD:
         clients = clean_db.load_all_clients()
         assert clients == []
 
+    def test_count_routes_and_clients(self, clean_db):
+        """Test counting routes and clients in one query."""
+        assert clean_db.count_routes_and_clients() == (0, 0)
+
+        clean_db.save_client(Client.create_new(client_name='Client A', api_key='key-a'))
+        clean_db.save_client(Client.create_new(client_name='Client B', api_key='key-b'))
+
+        assert clean_db.count_routes_and_clients() == (0, 2)
+
     def test_delete_client(self, clean_db):
         """Test deleting a client."""
         client = Client.create_new(client_name='To Delete', api_key='delete-me')
@@ -200,6 +209,34 @@ class TestClientCRUD:
         assert loaded_revoked.is_active() is False
 
 
+class TestClientDisplay:
+    """Test truncated credential display properties."""
+
+    def test_credentials_truncated(self):
+        """Test credentials are shown as their first 8 characters."""
+        client = Client.create_new(
+            client_name='Display Client',
+            api_key='abcdefghijklmnop',
+            shared_secret='secret-value-123'
+        )
+
+        assert client.api_key_short == 'abcdefgh...'
+        assert client.shared_secret_short == 'secret-v...'
+
+    def test_short_credential_shown_in_full(self):
+        """Test credentials of 8 characters or fewer are shown without "..."."""
+        client = Client.create_new(client_name='Short Key', api_key='abcdefgh', shared_secret='abc')
+
+        assert client.api_key_short == 'abcdefgh'
+        assert client.shared_secret_short == 'abc'
+
+    def test_missing_credential_shown_as_none(self):
+        """Test a missing credential displays as None."""
+        client = Client.create_new(client_name='Key Only', api_key='abcdefghijklmnop')
+
+        assert client.shared_secret_short == 'None'
+
+
 class TestClientPermissionCRUD:
     """Test client permission CRUD operations."""
 
@@ -358,6 +395,84 @@ class TestClientPermissionCRUD:
         permissions = clean_db.load_permissions_by_route(sample_route.route_id)
         assert permissions == []
 
+    def test_load_all_permissions(self, clean_db, sample_client, sample_route):
+        """Test loading permissions across all clients."""
+        other_client = Client.create_new(client_name='Other Client', api_key='other-key')
+        clean_db.save_client(other_client)
+
+        for client in (sample_client, other_client):
+            clean_db.save_permission(ClientPermission.create_new(
+                client_id=client.client_id,
+                route_id=sample_route.route_id,
+                allowed_methods=[HttpMethod.GET]
+            ))
+
+        permissions = clean_db.load_all_permissions()
+        assert len(permissions) == 2
+        assert {p.client_id for p in permissions} == {sample_client.client_id, other_client.client_id}
+
+    def test_load_permissions_with_routes(self, clean_db, sample_client, sample_route):
+        """Test loading a client's permissions joined with their routes."""
+        permission = ClientPermission.create_new(
+            client_id=sample_client.client_id,
+            route_id=sample_route.route_id,
+            allowed_methods=[HttpMethod.GET, HttpMethod.POST]
+        )
+        clean_db.save_permission(permission)
+
+        pairs = clean_db.load_permissions_with_routes(sample_client.client_id)
+        assert len(pairs) == 1
+        loaded_perm, loaded_route = pairs[0]
+        assert loaded_perm.permission_id == permission.permission_id
+        assert loaded_perm.allowed_methods == [HttpMethod.GET, HttpMethod.POST]
+        assert loaded_route == clean_db.load_route_by_id(sample_route.route_id)
+
+    def test_load_permissions_with_clients(self, clean_db, sample_client, sample_route):
+        """Test loading a route's permissions joined with their clients."""
+        permission = ClientPermission.create_new(
+            client_id=sample_client.client_id,
+            route_id=sample_route.route_id,
+            allowed_methods=[HttpMethod.GET]
+        )
+        clean_db.save_permission(permission)
+
+        pairs = clean_db.load_permissions_with_clients(sample_route.route_id)
+        assert len(pairs) == 1
+        loaded_perm, loaded_client = pairs[0]
+        assert loaded_perm.client_id == sample_client.client_id
+        assert loaded_client == clean_db.load_client_by_id(sample_client.client_id)
+
+    def test_load_permissions_joined_empty(self, clean_db, sample_client, sample_route):
+        """Test joined loaders return empty lists when nothing is granted."""
+        assert clean_db.load_permissions_with_routes(sample_client.client_id) == []
+        assert clean_db.load_permissions_with_clients(sample_route.route_id) == []
+
+    def test_load_client_with_permission_by_api_key(self, clean_db, sample_client, sample_route):
+        """Test loading a client by API key together with its permission for a route."""
+        permission = ClientPermission.create_new(
+            client_id=sample_client.client_id,
+            route_id=sample_route.route_id,
+            allowed_methods=[HttpMethod.GET]
+        )
+        clean_db.save_permission(permission)
+
+        client, loaded_perm = clean_db.load_client_with_permission_by_api_key('test-key', sample_route.route_id)
+        assert client == clean_db.load_client_by_id(sample_client.client_id)
+        assert loaded_perm.permission_id == permission.permission_id
+        assert loaded_perm.allowed_methods == [HttpMethod.GET]
+
+    def test_load_client_with_permission_by_api_key_without_permission(self, clean_db, sample_client, sample_route):
+        """Test the client is still returned when it has no permission for the route."""
+        client, permission = clean_db.load_client_with_permission_by_api_key('test-key', sample_route.route_id)
+        assert client.client_id == sample_client.client_id
+        assert permission is None
+
+        assert clean_db.load_client_with_permission_by_api_key('nonexistent-key', sample_route.route_id) == (None, None)
+
+    def test_load_all_permissions_empty(self, clean_db):
+        """Test loading all permissions when none exist."""
+        assert clean_db.load_all_permissions() == []
+
     def test_load_permission_by_client_and_route(self, clean_db, sample_client, sample_route):
         """Test loading a specific permission by client and route."""
         permission = ClientPermission.create_new(
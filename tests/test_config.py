@@ -0,0 +1,74 @@
+"""
+Unit tests for environment and logging configuration.
+"""
+import logging
+import sys
+from unittest.mock import MagicMock, patch
+
+from src import config
+
+
+class TestLoadEnv:
+    """Tests for load_env caching."""
+
+    def test_dotenv_parsed_once(self, monkeypatch):
+        """Test repeated calls reuse the first result."""
+        monkeypatch.setattr(config, '_env_loaded', None)
+
+        with patch('dotenv.load_dotenv', return_value=False) as mock_load:
+            assert config.load_env() is False
+            assert config.load_env() is False
+
+        mock_load.assert_called_once()
+
+
+class TestSettings:
+    """Tests for Settings.from_env."""
+
+    def test_defaults(self, monkeypatch):
+        """Test defaults apply when variables are unset."""
+        monkeypatch.setattr(config, '_env_loaded', False)
+        for name in ('REDIS_HOST', 'REDIS_PORT', 'REDIS_PASSWORD', 'REDIS_DB', 'REDIS_POOL_SIZE',
+                     'RATE_LIMIT_ALGORITHM', 'AUTH_CACHE_TTL', 'PORT'):
+            monkeypatch.delenv(name, raising=False)
+
+        assert config.Settings.from_env() == config.Settings()
+
+    def test_parses_environment(self, monkeypatch):
+        """Test values are read from the environment and converted."""
+        monkeypatch.setattr(config, '_env_loaded', False)
+        monkeypatch.setenv('REDIS_HOST', 'redis.local')
+        monkeypatch.setenv('REDIS_PORT', '6380')
+        monkeypatch.setenv('REDIS_POOL_SIZE', '8')
+        monkeypatch.setenv('RATE_LIMIT_ALGORITHM', 'Sliding')
+        monkeypatch.setenv('AUTH_CACHE_TTL', '2.5')
+
+        settings = config.Settings.from_env()
+
+        assert settings.redis_host == 'redis.local'
+        assert settings.redis_port == 6380
+        assert settings.redis_pool_size == 8
+        assert settings.rate_limit_algorithm == 'sliding'
+        assert settings.auth_cache_ttl == 2.5
+
+
+class TestSetupLogging:
+    """Tests for setup_logging."""
+
+    def test_configures_once(self):
+        """Test logging is configured on the first call only."""
+        mazza_base = MagicMock()
+        config.setup_logging.cache_clear()
+        handler = logging.NullHandler()
+        logging.root.addHandler(handler)
+
+        try:
+            with patch.dict(sys.modules, {'mazza_base': mazza_base}):
+                config.setup_logging()
+                config.setup_logging()
+
+            mazza_base.configure_logging.assert_called_once()
+            assert type(handler.formatter).__name__ in ('JsonFormatter', 'OrjsonFormatter')
+        finally:
+            logging.root.removeHandler(handler)
+            config.setup_logging.cache_clear()
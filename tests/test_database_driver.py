@@ -4,8 +4,13 @@ CRITICAL: All tests use the api_auth_admin_test database via fixtures.
 """
 import pytest
 import time
+from unittest.mock import patch
 from src.models.route import Route, HttpMethod
 from src.models.method_auth import MethodAuth, AuthType
+from src.models.client import Client
+from src.models.client_permission import ClientPermission
+from src.database import AuthServiceDB
+from src.monitoring import DB_CONNECTION_POOL
 
 
 class TestDatabaseConnection:
@@ -22,6 +27,85 @@ class TestDatabaseConnection:
         routes = clean_db.load_all_routes()
         assert routes == []
 
+    def test_shared_pool_not_closed_by_handle(self, db, test_db_config):
+        """Test that closing a handle on a shared pool leaves the pool open."""
+        handle = AuthServiceDB(**test_db_config, pool=db.pool)
+
+        handle.close()
+
+        assert not db.pool.closed
+        assert db.load_all_routes() is not None
+
+    def test_shared_pool_handle_keeps_pool_metrics(self, db, test_db_config):
+        """Test that a handle on a shared pool shares its count and keeps the gauges."""
+        active_gauge = DB_CONNECTION_POOL.labels(state='active')
+        with db._get_connection():
+            handle = AuthServiceDB(**test_db_config, pool=db.pool)
+            assert handle._stats is db._stats
+            assert active_gauge._value.get() == 1
+
+            with handle._get_connection():
+                assert active_gauge._value.get() == 2
+            handle.close()
+
+        assert active_gauge._value.get() == 0
+
+    def test_get_db_connection_shares_pool(self, db, test_db_config, monkeypatch):
+        """Test that repeated get_db_connection calls reuse one pool."""
+        from src.utils import db_connection
+
+        monkeypatch.setenv('POSTGRES_HOST', test_db_config['db_host'])
+        monkeypatch.setenv('API_AUTH_ADMIN_PG_DB', test_db_config['db_name'])
+        monkeypatch.setenv('API_AUTH_ADMIN_PG_USER', test_db_config['db_user'])
+        monkeypatch.setattr(db_connection, '_shared_pool', None)
+
+        try:
+            outer = db_connection.get_db_connection(verbose=False)
+            inner = db_connection.get_db_connection(verbose=False)
+            assert inner.pool is outer.pool
+
+            # Closing a nested handle must not break the outer one
+            inner.close()
+            assert outer.load_all_routes() == []
+        finally:
+            db_connection._close_shared_pool()
+
+    def test_get_db_connection_pool_size_from_env(self, db, test_db_config, monkeypatch):
+        """Test that the shared pool is sized from DB_POOL_MIN_SIZE and DB_POOL_SIZE."""
+        from src.utils import db_connection
+
+        monkeypatch.setenv('POSTGRES_HOST', test_db_config['db_host'])
+        monkeypatch.setenv('API_AUTH_ADMIN_PG_DB', test_db_config['db_name'])
+        monkeypatch.setenv('API_AUTH_ADMIN_PG_USER', test_db_config['db_user'])
+        monkeypatch.setenv('DB_POOL_MIN_SIZE', '1')
+        monkeypatch.setenv('DB_POOL_SIZE', '4')
+        monkeypatch.setattr(db_connection, '_shared_pool', None)
+
+        try:
+            handle = db_connection.get_db_connection(verbose=False)
+            assert handle.pool.minconn == 1
+            assert handle.pool.maxconn == 4
+        finally:
+            db_connection._close_shared_pool()
+
+    def test_db_session_closes_handle(self, db, test_db_config, monkeypatch):
+        """Test that db_session yields a working handle and closes it on exit."""
+        from src.utils import db_connection
+
+        monkeypatch.setenv('POSTGRES_HOST', test_db_config['db_host'])
+        monkeypatch.setenv('API_AUTH_ADMIN_PG_DB', test_db_config['db_name'])
+        monkeypatch.setenv('API_AUTH_ADMIN_PG_USER', test_db_config['db_user'])
+        monkeypatch.setattr(db_connection, '_shared_pool', None)
+
+        try:
+            with patch.object(AuthServiceDB, 'close') as mock_close:
+                with db_connection.db_session(verbose=False) as session:
+                    assert session.load_all_routes() == []
+                    mock_close.assert_not_called()
+                mock_close.assert_called_once()
+        finally:
+            db_connection._close_shared_pool()
+
 
 class TestSaveRoute:
     """Test saving routes to database."""
@@ -120,6 +204,31 @@ class TestLoadRouteById:
         assert loaded is None
 
 
+class TestLoadRoutesByIds:
+    """Test loading several routes by ID at once."""
+
+    def test_load_routes_by_ids(self, clean_db):
+        """Test only the requested routes are returned, skipping unknown IDs."""
+        route_ids = [
+            clean_db.save_route(Route.create_new(
+                route_pattern=f'/api/ids{i}',
+                domain='*',
+                service_name='ids-service',
+                methods={HttpMethod.GET: MethodAuth(auth_required=False)}
+            ))
+            for i in range(3)
+        ]
+
+        loaded = clean_db.load_routes_by_ids(
+            {route_ids[0], route_ids[2], '00000000-0000-0000-0000-000000000000'}
+        )
+        assert {route.route_id for route in loaded} == {route_ids[0], route_ids[2]}
+
+    def test_load_routes_by_ids_empty(self, clean_db):
+        """Test an empty ID collection returns no routes."""
+        assert clean_db.load_routes_by_ids([]) == []
+
+
 class TestLoadRouteByPattern:
     """Test loading routes by pattern."""
 
@@ -326,6 +435,220 @@ class TestDeleteRoute:
         assert result is False
 
 
+class TestBulkSave:
+    """Test saving routes, clients and permissions in bulk."""
+
+    def test_save_routes_bulk(self, clean_db):
+        """Test bulk saving routes assigns IDs in input order."""
+        routes = [
+            Route.create_new(
+                route_pattern=f'/api/bulk{i}',
+                domain='*',
+                service_name='bulk-service',
+                methods={HttpMethod.GET: MethodAuth(auth_required=False)}
+            )
+            for i in range(3)
+        ]
+
+        route_ids = clean_db.save_routes_bulk(routes)
+
+        assert len(route_ids) == 3
+        for route, route_id in zip(routes, route_ids):
+            assert route.route_id == route_id
+            loaded = clean_db.load_route_by_id(route_id)
+            assert loaded.route_pattern == route.route_pattern
+
+    def test_save_routes_bulk_upserts_existing(self, clean_db):
+        """Test bulk saving a route with an ID updates it."""
+        route = Route.create_new(
+            route_pattern='/api/bulk',
+            domain='*',
+            service_name='service-v1',
+            methods={HttpMethod.GET: MethodAuth(auth_required=False)}
+        )
+        route_id = clean_db.save_route(route)
+
+        route.service_name = 'service-v2'
+        assert clean_db.save_routes_bulk([route]) == [route_id]
+
+        assert clean_db.load_route_by_id(route_id).service_name == 'service-v2'
+        assert len(clean_db.load_all_routes()) == 1
+
+    def test_save_bulk_empty(self, clean_db):
+        """Test bulk saving an empty list is a no-op."""
+        assert clean_db.save_routes_bulk([]) == []
+        assert clean_db.save_clients_bulk([]) == []
+        assert clean_db.save_permissions_bulk([]) == []
+
+    def test_save_clients_and_permissions_bulk(self, clean_db):
+        """Test bulk saving clients and their permissions."""
+        route = Route.create_new(
+            route_pattern='/api/bulk',
+            domain='*',
+            service_name='bulk-service',
+            methods={HttpMethod.GET: MethodAuth(auth_required=False)}
+        )
+        clean_db.save_route(route)
+
+        clients = [
+            Client.create_new(client_name='Bulk A', api_key='bulk-key-a'),
+            Client.create_new(client_name='Bulk B', shared_secret='bulk-secret-b'),
+        ]
+        client_ids = clean_db.save_clients_bulk(clients)
+
+        assert [c.client_id for c in clients] == client_ids
+        assert clean_db.load_client_by_api_key('bulk-key-a').client_id == client_ids[0]
+
+        permissions = [
+            ClientPermission.create_new(
+                client_id=client.client_id,
+                route_id=route.route_id,
+                allowed_methods=[HttpMethod.GET]
+            )
+            for client in clients
+        ]
+        permission_ids = clean_db.save_permissions_bulk(permissions)
+
+        assert [p.permission_id for p in permissions] == permission_ids
+        loaded = clean_db.load_permission_by_client_and_route(client_ids[1], route.route_id)
+        assert loaded.permission_id == permission_ids[1]
+
+    def test_save_bulk_rejects_duplicate_ids(self, clean_db):
+        """Test a batch naming the same row twice is rejected before inserting."""
+        route = Route.create_new(
+            route_pattern='/api/bulk',
+            domain='*',
+            service_name='bulk-service',
+            methods={HttpMethod.GET: MethodAuth(auth_required=False)}
+        )
+        clean_db.save_route(route)
+        client = Client.create_new(client_name='Bulk A', api_key='bulk-key-a')
+        clean_db.save_client(client)
+
+        with pytest.raises(ValueError, match="route_id"):
+            clean_db.save_routes_bulk([route, route])
+        with pytest.raises(ValueError, match="client_id"):
+            clean_db.save_clients_bulk([client, client])
+
+        permissions = [
+            ClientPermission.create_new(
+                client_id=client.client_id,
+                route_id=route.route_id,
+                allowed_methods=[method]
+            )
+            for method in (HttpMethod.GET, HttpMethod.POST)
+        ]
+        with pytest.raises(ValueError, match="pair"):
+            clean_db.save_permissions_bulk(permissions)
+        assert clean_db.load_permissions_by_client(client.client_id) == []
+
+    def test_save_permissions_bulk_keeps_existing_id(self, clean_db):
+        """Test an existing client/route pair keeps its permission_id."""
+        route = Route.create_new(
+            route_pattern='/api/bulk',
+            domain='*',
+            service_name='bulk-service',
+            methods={HttpMethod.GET: MethodAuth(auth_required=False)}
+        )
+        clean_db.save_route(route)
+        clients = [
+            Client.create_new(client_name='Bulk A', api_key='bulk-key-a'),
+            Client.create_new(client_name='Bulk B', api_key='bulk-key-b'),
+        ]
+        clean_db.save_clients_bulk(clients)
+        existing = ClientPermission.create_new(
+            client_id=clients[1].client_id,
+            route_id=route.route_id,
+            allowed_methods=[HttpMethod.GET]
+        )
+        existing_id = clean_db.save_permission(existing)
+
+        permissions = [
+            ClientPermission.create_new(
+                client_id=client.client_id,
+                route_id=route.route_id,
+                allowed_methods=[HttpMethod.POST]
+            )
+            for client in clients
+        ]
+        permission_ids = clean_db.save_permissions_bulk(permissions)
+
+        assert permission_ids[1] == existing_id
+        assert permission_ids[0] != existing_id
+        assert [p.permission_id for p in permissions] == permission_ids
+        loaded = clean_db.load_permission_by_client_and_route(clients[1].client_id, route.route_id)
+        assert loaded.allowed_methods == [HttpMethod.POST]
+
+    def test_copy_clients(self, clean_db):
+        """Test loading clients with COPY, including characters COPY escapes."""
+        clients = [
+            Client.create_new(client_name='Copy\tA\\n', api_key='copy-key-a'),
+            Client.create_new(client_name='Copy\nB', shared_secret='copy-secret-b'),
+        ]
+
+        client_ids = clean_db.copy_clients(clients)
+
+        assert [c.client_id for c in clients] == client_ids
+        loaded = clean_db.load_client_by_api_key('copy-key-a')
+        assert loaded.client_id == client_ids[0]
+        assert loaded.client_name == 'Copy\tA\\n'
+        assert loaded.shared_secret is None
+        assert clean_db.load_client_by_id(client_ids[1]).client_name == 'Copy\nB'
+
+    def test_copy_clients_empty(self, clean_db):
+        """Test copying no clients is a no-op."""
+        assert clean_db.copy_clients([]) == []
+
+
+class TestTransaction:
+    """Test grouping operations in a single transaction."""
+
+    def _make_route(self, pattern: str) -> Route:
+        return Route.create_new(
+            route_pattern=pattern,
+            domain='*',
+            service_name='tx-service',
+            methods={HttpMethod.GET: MethodAuth(auth_required=False)}
+        )
+
+    def test_transaction_commits_on_success(self, clean_db):
+        """Test saves inside a transaction are committed together."""
+        with clean_db.transaction():
+            clean_db.save_route(self._make_route('/api/tx1'))
+            clean_db.save_route(self._make_route('/api/tx2'))
+
+        assert len(clean_db.load_all_routes()) == 2
+
+    def test_transaction_rolls_back_on_error(self, clean_db):
+        """Test an error inside a transaction rolls back every save."""
+        with pytest.raises(RuntimeError):
+            with clean_db.transaction():
+                clean_db.save_route(self._make_route('/api/tx1'))
+                clean_db.save_client(Client.create_new(client_name='Tx Client', api_key='tx-key'))
+                raise RuntimeError("abort")
+
+        assert clean_db.load_all_routes() == []
+        assert clean_db.load_all_clients() == []
+
+    def test_transaction_sees_own_writes(self, clean_db):
+        """Test reads inside a transaction see uncommitted writes."""
+        with clean_db.transaction() as cursor:
+            route_id = clean_db.save_route(self._make_route('/api/tx'))
+            assert clean_db.load_route_by_id(route_id) is not None
+            cursor.execute("SELECT count(*) FROM routes")
+            assert cursor.fetchone()[0] == 1
+
+    def test_nested_transaction_joins_outer(self, clean_db):
+        """Test a nested transaction is rolled back with the outer one."""
+        with pytest.raises(RuntimeError):
+            with clean_db.transaction():
+                with clean_db.transaction():
+                    clean_db.save_route(self._make_route('/api/tx'))
+                raise RuntimeError("abort")
+
+        assert clean_db.load_all_routes() == []
+
+
 class TestDatabaseIsolation:
     """Test that tests are properly isolated from each other."""
 
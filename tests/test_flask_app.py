@@ -6,6 +6,7 @@ Mocks nginx headers (X-Original-URI, X-Original-Method) to simulate
 nginx auth_request integration.
 """
 import pytest
+from byteforge_hmac import DictNonceStorage
 from src.app import create_app
 from src.models.route import Route, HttpMethod
 from src.models.method_auth import MethodAuth, AuthType
@@ -19,7 +20,7 @@ def client(clean_db):
     """Flask test client with test database."""
     # Use in-memory nonce storage for tests (no Redis dependency)
     # Explicitly pass redis_client=None to avoid connecting to real Redis
-    hmac_handler = HMACHandler(clean_db, nonce_storage={})
+    hmac_handler = HMACHandler(clean_db, nonce_storage=DictNonceStorage())
     app = create_app(db=clean_db, redis_client=None, hmac_handler=hmac_handler, rate_limiter=None)
     app.config['TESTING'] = True
     with app.test_client() as client:
@@ -83,7 +84,7 @@ class TestHealthEndpoint:
         mock_redis = Mock()
         mock_redis.ping.return_value = True
 
-        hmac_handler = HMACHandler(clean_db, nonce_storage={})
+        hmac_handler = HMACHandler(clean_db, nonce_storage=DictNonceStorage())
         app = create_app(db=clean_db, redis_client=mock_redis, hmac_handler=hmac_handler, rate_limiter=None)
         app.config['TESTING'] = True
 
@@ -105,7 +106,7 @@ class TestHealthEndpoint:
         mock_redis = Mock()
         mock_redis.ping.side_effect = redis.ConnectionError("Connection refused")
 
-        hmac_handler = HMACHandler(clean_db, nonce_storage={})
+        hmac_handler = HMACHandler(clean_db, nonce_storage=DictNonceStorage())
         app = create_app(db=clean_db, redis_client=mock_redis, hmac_handler=hmac_handler, rate_limiter=None)
         app.config['TESTING'] = True
 
@@ -119,6 +120,41 @@ class TestHealthEndpoint:
             assert data['redis'] == 'error'
             assert data['message'] == 'Redis connection failed'
 
+    def test_health_check_json_encoding(self, client, clean_db):
+        """Test /health JSON is compact with sorted keys."""
+        response = client.get('/health')
+
+        assert response.content_type == 'application/json'
+        assert response.data.startswith(b'{"clients_configured":')
+
+    def test_redis_pool_exposed_in_config(self, clean_db):
+        """Test the Redis connection pool is shared through app config."""
+        from unittest.mock import Mock
+
+        mock_redis = Mock()
+        hmac_handler = HMACHandler(clean_db, nonce_storage=DictNonceStorage())
+        app = create_app(db=clean_db, redis_client=mock_redis, hmac_handler=hmac_handler, rate_limiter=None)
+
+        assert app.config['REDIS_POOL'] is mock_redis.connection_pool
+
+
+class TestDeprecatedAppTarget:
+    """Test the old gunicorn src.app:app target."""
+
+    def test_deprecated_app_target_uses_wsgi_app(self, monkeypatch):
+        """Test src.app:app still resolves, to the app built by src.wsgi."""
+        import sys
+        import types
+        import src.app
+
+        wsgi = types.ModuleType('src.wsgi')
+        wsgi.app = object()
+        monkeypatch.setitem(sys.modules, 'src.wsgi', wsgi)
+
+        assert src.app.app is wsgi.app
+        with pytest.raises(AttributeError):
+            src.app.no_such_attribute
+
 
 class TestAuthzEndpointPublicRoutes:
     """Test /authz endpoint with public routes (no authentication required)."""
@@ -503,6 +539,41 @@ class TestAuthzEndpointQueryParams:
         assert response.status_code == 200
         assert response.headers['X-Auth-Client-ID'] == test_client.client_id
 
+    def test_api_key_from_query_param_is_url_decoded(self, client, clean_db):
+        """Test percent-encoded API keys in the query string are decoded."""
+        route = Route.create_new(
+            route_pattern='/api/query-test',
+            domain='*',
+            service_name='test-service',
+            methods={HttpMethod.GET: MethodAuth(auth_required=True, auth_type=AuthType.API_KEY)}
+        )
+        clean_db.save_route(route)
+
+        test_client = Client.create_new(
+            client_name='Query Client',
+            api_key='query+key/123',
+            status=ClientStatus.ACTIVE
+        )
+        clean_db.save_client(test_client)
+
+        permission = ClientPermission.create_new(
+            client_id=test_client.client_id,
+            route_id=route.route_id,
+            allowed_methods=[HttpMethod.GET]
+        )
+        clean_db.save_permission(permission)
+
+        response = client.get(
+            '/authz',
+            headers={
+                'X-Original-URI': '/api/query-test?page=2&api_key=query%2Bkey%2F123',
+                'X-Original-Method': 'GET'
+            }
+        )
+
+        assert response.status_code == 200
+        assert response.headers['X-Auth-Client-ID'] == test_client.client_id
+
 
 class TestAuthzEndpointEdgeCases:
     """Test /authz endpoint edge cases and error handling."""
@@ -540,6 +611,20 @@ class TestAuthzEndpointEdgeCases:
         assert response.status_code == 400
         assert b'Invalid method' in response.data
 
+    def test_http_method_is_case_insensitive(self, client, clean_db):
+        """Test lower and mixed case methods are accepted, not rejected as invalid."""
+        for original_method in ('get', 'Get'):
+            response = client.get(
+                '/authz',
+                headers={
+                    'X-Original-URI': '/api/test',
+                    'X-Original-Method': original_method
+                }
+            )
+
+            assert response.status_code == 403
+            assert response.data == b'no_route_match'
+
     def test_protected_route_no_credentials(self, client, clean_db):
         """Test protected route without credentials returns 403."""
         # Create protected route
@@ -591,6 +676,23 @@ class TestMetricsEndpoint:
         assert 'auth_duration_seconds' in data
         assert 'auth_errors_total' in data
 
+    def test_metrics_gzip_when_accepted(self, client, clean_db):
+        """Test /metrics is gzip-compressed for scrapers that accept it."""
+        import gzip
+
+        response = client.get('/metrics', headers={'Accept-Encoding': 'gzip'})
+
+        assert response.status_code == 200
+        assert response.headers['Content-Encoding'] == 'gzip'
+        assert b'auth_requests_total' in gzip.decompress(response.data)
+
+    def test_metrics_uncompressed_by_default(self, client, clean_db):
+        """Test /metrics is plain text without Accept-Encoding: gzip."""
+        response = client.get('/metrics', headers={'Accept-Encoding': 'gzip;q=0'})
+
+        assert 'Content-Encoding' not in response.headers
+        assert b'auth_requests_total' in response.data
+
     def test_metrics_updates_after_authz_request(self, client, clean_db):
         """Test metrics are updated after authorization requests."""
         # Create a public route
@@ -625,6 +727,22 @@ class TestMetricsEndpoint:
         # The metrics should contain our route pattern
         assert '/api/metrics-test' in data2 or 'result="allowed"' in data2
 
+    def test_unmatched_paths_share_one_metric_series(self, client, clean_db):
+        """Test requests matching no route are labelled 'unmatched', not by path."""
+        for original_uri in ('/no/such/route-1', '/no/such/route-2'):
+            client.get(
+                '/authz',
+                headers={
+                    'X-Original-URI': original_uri,
+                    'X-Original-Method': 'get'
+                }
+            )
+
+        data = client.get('/metrics').data.decode('utf-8')
+
+        assert 'auth_requests_total{method="GET",result="denied",route_pattern="unmatched"}' in data
+        assert '/no/such/route' not in data
+
     def test_metrics_tracks_allowed_vs_denied(self, client, clean_db):
         """Test metrics differentiate between allowed and denied requests."""
         # Create public route
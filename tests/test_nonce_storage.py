@@ -3,8 +3,11 @@ Unit tests for RedisNonceStorage.
 
 Tests the Redis-backed nonce storage for HMAC replay protection.
 """
+import time
+
 import pytest
 from unittest.mock import Mock, MagicMock
+from byteforge_hmac.replay_protector import ReplayProtector
 from src.auth.nonce_storage import RedisNonceStorage, DEFAULT_NONCE_TTL
 
 
@@ -71,6 +74,31 @@ class TestRedisNonceStorage:
             "1699999999"
         )
 
+    def test_put_if_absent_stores_new_nonce(self):
+        """Test put_if_absent uses a single SET NX EX and reports a new nonce."""
+        mock_redis = Mock()
+        mock_redis.set.return_value = True
+        storage = RedisNonceStorage(mock_redis)
+
+        result = storage.put_if_absent("test-nonce", 1699999999, 450)
+
+        assert result is True
+        mock_redis.set.assert_called_once_with(
+            "hmac_nonce:test-nonce",
+            "1699999999",
+            nx=True,
+            ex=450
+        )
+        mock_redis.exists.assert_not_called()
+
+    def test_put_if_absent_rejects_existing_nonce(self):
+        """Test put_if_absent returns False when the nonce is already stored."""
+        mock_redis = Mock()
+        mock_redis.set.return_value = None
+        storage = RedisNonceStorage(mock_redis)
+
+        assert storage.put_if_absent("test-nonce", 1699999999, 450) is False
+
     def test_getitem_returns_timestamp(self):
         """Test __getitem__ returns stored timestamp."""
         mock_redis = Mock()
@@ -155,3 +183,20 @@ class TestRedisNonceStorageIntegration:
         assert len(calls) == 2
         assert calls[0][0][0] == "hmac_nonce:nonce-1"
         assert calls[1][0][0] == "hmac_nonce:nonce-2"
+
+    def test_replay_protector_uses_atomic_put(self):
+        """Test byteforge-hmac's ReplayProtector stores nonces via put_if_absent."""
+        mock_redis = Mock()
+        storage = RedisNonceStorage(mock_redis)
+        protector = ReplayProtector(storage)
+        timestamp = str(int(time.time()))
+
+        mock_redis.set.return_value = True
+        assert protector.check_and_store("client-1", "nonce-1", timestamp) is True
+
+        mock_redis.set.return_value = None
+        assert protector.check_and_store("client-1", "nonce-1", timestamp) is False
+
+        assert mock_redis.set.call_count == 2
+        mock_redis.exists.assert_not_called()
+        mock_redis.setex.assert_not_called()
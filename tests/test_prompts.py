@@ -0,0 +1,108 @@
+"""
+Unit tests for the interactive prompt helpers used by scripts.
+"""
+from unittest.mock import patch
+
+from src.prompts import (
+    MAX_LISTED,
+    PrefixIndex,
+    get_choice,
+    get_input,
+    get_yes_no,
+    narrow_by_prefix,
+)
+
+
+class TestGetYesNo:
+    """Tests for get_yes_no."""
+
+    def test_accepts_y_and_yes(self):
+        """Test y and yes (any case) are accepted."""
+        with patch('builtins.input', side_effect=['y', 'YES', 'no']):
+            assert get_yes_no("Continue?") is True
+            assert get_yes_no("Continue?") is True
+            assert get_yes_no("Continue?") is False
+
+    def test_empty_response_returns_default(self):
+        """Test an empty response returns the default."""
+        with patch('builtins.input', return_value=''):
+            assert get_yes_no("Continue?", default=True) is True
+            assert get_yes_no("Continue?", default=False) is False
+
+
+class TestGetInput:
+    """Tests for get_input."""
+
+    def test_default_used_for_empty_input(self):
+        """Test the default is returned for empty input."""
+        with patch('builtins.input', return_value='  ') as mock_input:
+            assert get_input("Name", default="x") == "x"
+
+        mock_input.assert_called_once_with("Name [x]: ")
+
+
+class TestGetChoice:
+    """Tests for get_choice."""
+
+    def test_retries_until_valid(self, capsys):
+        """Test invalid entries are rejected until a valid number is given."""
+        with patch('builtins.input', side_effect=['9', 'abc', '2']):
+            assert get_choice("Pick", ['a', 'b', 'c']) == 'b'
+
+        out = capsys.readouterr().out
+        assert "Pick\n  1. a\n  2. b\n  3. c\n" in out
+        assert out.count("Invalid choice") == 2
+
+    def test_empty_response_returns_default(self):
+        """Test an empty response returns the default."""
+        with patch('builtins.input', return_value=''):
+            assert get_choice("Pick", ['a', 'b'], default='a') == 'a'
+
+    def test_zero_and_negative_rejected(self):
+        """Test 0 and negative numbers do not wrap around to the last choice."""
+        with patch('builtins.input', side_effect=['0', '-1', '1']):
+            assert get_choice("Pick", ['a', 'b']) == 'a'
+
+
+class TestPrefixIndex:
+    """Tests for PrefixIndex."""
+
+    def test_search_is_case_insensitive_and_ordered(self):
+        """Test matches keep insertion order regardless of case."""
+        index = PrefixIndex(['Beta', 'alpha', 'Alpine', 'gamma'], key=str)
+
+        assert index.search('AL') == ['alpha', 'Alpine']
+        assert index.search('alph') == ['alpha']
+        assert index.search('') == ['Beta', 'alpha', 'Alpine', 'gamma']
+        assert index.search('delta') == []
+
+
+class TestNarrowByPrefix:
+    """Tests for narrow_by_prefix."""
+
+    def test_short_list_skips_prompt(self):
+        """Test lists within MAX_LISTED are returned without prompting."""
+        items = [f"client-{i}" for i in range(MAX_LISTED)]
+
+        with patch('builtins.input') as mock_input:
+            assert narrow_by_prefix(items, str, "clients") is items
+
+        mock_input.assert_not_called()
+
+    def test_prompts_until_few_enough_match(self, capsys):
+        """Test unmatched and overly broad prefixes prompt again."""
+        items = [f"svc-{i:02}" for i in range(30)] + ["admin"]
+
+        with patch('builtins.input', side_effect=['x', 'svc', 'svc-1']):
+            assert narrow_by_prefix(items, str, "clients") == [f"svc-{i}" for i in range(10, 20)]
+
+        out = capsys.readouterr().out
+        assert "No clients match 'x'" in out
+        assert "30 clients match 'svc'" in out
+
+    def test_blank_keeps_current_candidates(self):
+        """Test a blank response returns the candidates narrowed so far."""
+        items = [f"svc-{i:02}" for i in range(30)] + ["admin"]
+
+        with patch('builtins.input', side_effect=['svc', '']):
+            assert narrow_by_prefix(items, str, "clients") == items[:30]
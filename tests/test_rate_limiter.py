@@ -3,7 +3,7 @@ Tests for rate limiting functionality.
 """
 import pytest
 from unittest.mock import Mock, MagicMock, patch
-from src.rate_limiter import RedisBackend, RateLimiter
+from src.rate_limiter import RedisBackend, SlidingWindowBackend, RateLimiter
 from src.models.rate_limit import RateLimit
 
 
@@ -13,24 +13,21 @@ class TestRedisBackend:
     def test_increment_and_check_first_request(self):
         """First request should increment to 1 and be allowed."""
         mock_redis = Mock()
-        mock_pipeline = Mock()
-        mock_redis.pipeline.return_value = mock_pipeline
-        mock_pipeline.execute.return_value = [1, True]  # incr result, expire result
+        mock_script = Mock(return_value=1)
+        mock_redis.register_script.return_value = mock_script
 
         backend = RedisBackend(mock_redis)
         count, allowed = backend.increment_and_check("client-123", 100)
 
         assert count == 1
         assert allowed is True
-        mock_pipeline.incr.assert_called_once_with("ratelimit:client-123")
-        mock_pipeline.expire.assert_called_once()
+        mock_redis.register_script.assert_called_once()
+        mock_script.assert_called_once_with(keys=["ratelimit:client-123"], args=[86400])
 
     def test_increment_and_check_at_limit(self):
         """Request at exact limit should be allowed."""
         mock_redis = Mock()
-        mock_pipeline = Mock()
-        mock_redis.pipeline.return_value = mock_pipeline
-        mock_pipeline.execute.return_value = [100, True]
+        mock_redis.register_script.return_value = Mock(return_value=100)
 
         backend = RedisBackend(mock_redis)
         count, allowed = backend.increment_and_check("client-123", 100)
@@ -41,9 +38,7 @@ class TestRedisBackend:
     def test_increment_and_check_over_limit(self):
         """Request over limit should be denied."""
         mock_redis = Mock()
-        mock_pipeline = Mock()
-        mock_redis.pipeline.return_value = mock_pipeline
-        mock_pipeline.execute.return_value = [101, True]
+        mock_redis.register_script.return_value = Mock(return_value=101)
 
         backend = RedisBackend(mock_redis)
         count, allowed = backend.increment_and_check("client-123", 100)
@@ -73,6 +68,66 @@ class TestRedisBackend:
         assert count == 0
 
 
+class TestSlidingWindowBackend:
+    """Tests for the approximate sliding window backend."""
+
+    def _backend(self, current, previous, now):
+        mock_redis = Mock()
+        mock_script = Mock(return_value=[current, previous])
+        mock_redis.register_script.return_value = mock_script
+        backend = SlidingWindowBackend(mock_redis, window=100, clock=lambda: now)
+        return backend, mock_redis, mock_script
+
+    def test_increment_uses_current_and_previous_window_keys(self):
+        """Counters are keyed by window number and expire after two windows."""
+        backend, _, mock_script = self._backend(1, 0, now=1050)
+
+        count, allowed = backend.increment_and_check("client-123", 100)
+
+        assert count == 1
+        assert allowed is True
+        mock_script.assert_called_once_with(
+            keys=["ratelimit:client-123:10", "ratelimit:client-123:9"],
+            args=[200]
+        )
+
+    def test_previous_window_weighted_by_overlap(self):
+        """Halfway through a window, half the previous count still applies."""
+        backend, _, _ = self._backend(30, 80, now=1050)
+
+        count, allowed = backend.increment_and_check("client-123", 100)
+
+        assert count == 70
+        assert allowed is True
+
+    def test_over_limit_with_previous_window(self):
+        """A full previous window blocks a burst at the start of the next one."""
+        backend, _, _ = self._backend(11, 100, now=1010)
+
+        count, allowed = backend.increment_and_check("client-123", 100)
+
+        assert count == 101
+        assert allowed is False
+
+    def test_get_current_count(self):
+        """Current count applies the same weighting without incrementing."""
+        backend, mock_redis, mock_script = self._backend(0, 0, now=1075)
+        mock_redis.mget.return_value = ["10", "40"]
+
+        assert backend.get_current_count("client-123") == 20
+        mock_redis.mget.assert_called_once_with(
+            ["ratelimit:client-123:10", "ratelimit:client-123:9"]
+        )
+        mock_script.assert_not_called()
+
+    def test_get_current_count_no_values(self):
+        """Should return 0 if neither window has a count."""
+        backend, mock_redis, _ = self._backend(0, 0, now=1075)
+        mock_redis.mget.return_value = [None, None]
+
+        assert backend.get_current_count("client-123") == 0
+
+
 class TestRateLimiter:
     """Tests for RateLimiter service."""
 
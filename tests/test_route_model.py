@@ -4,7 +4,7 @@ Tests model validation, serialization, and business logic.
 """
 import pytest
 import time
-from src.models.route import Route, HttpMethod
+from src.models.route import Route, HttpMethod, format_methods
 from src.models.method_auth import MethodAuth, AuthType
 
 
@@ -324,6 +324,25 @@ class TestRoute:
         assert before <= route.updated_at <= after
         assert route.created_at == route.updated_at
 
+    def test_methods_str(self):
+        """Test methods_str lists configured methods in insertion order."""
+        route = Route.create_new(
+            route_pattern='/api/test',
+            domain='*',
+            service_name='test-service',
+            methods={
+                HttpMethod.POST: MethodAuth(auth_required=True, auth_type=AuthType.HMAC),
+                HttpMethod.GET: MethodAuth(auth_required=False)
+            }
+        )
+        assert route.methods_str == 'POST, GET'
+        assert route.to_dict()['methods'].keys() == {'POST', 'GET'}
+
+    def test_format_methods(self):
+        """Test format_methods renders methods in the order given."""
+        assert format_methods([HttpMethod.DELETE, HttpMethod.GET]) == 'DELETE, GET'
+        assert format_methods([]) == ''
+
 class TestRouteDomainMatching:
     """Test domain matching functionality."""
 
@@ -0,0 +1,155 @@
+"""
+Unit tests for SQL schema file utilities.
+"""
+import io
+import os
+from unittest.mock import MagicMock, Mock
+
+import psycopg2
+import pytest
+
+from src.utils.schema import schema_path, iter_statements, execute_statements
+
+
+def split(sql: str, chunk_size: int = 65536) -> list:
+    """Split a SQL string using iter_statements."""
+    return list(iter_statements(io.StringIO(sql), chunk_size=chunk_size))
+
+
+class TestSchemaPath:
+    """Tests for schema_path lookup."""
+
+    def test_points_at_bundled_schema(self):
+        """Test the path resolves to src/database/schema.sql."""
+        path = schema_path()
+
+        assert os.path.isabs(path)
+        assert path.endswith(os.path.join('src', 'database', 'schema.sql'))
+        assert os.path.exists(path)
+
+    def test_result_is_cached(self):
+        """Test the path is only resolved once."""
+        schema_path.cache_clear()
+        schema_path()
+        schema_path()
+
+        assert schema_path.cache_info().hits == 1
+
+
+class TestIterStatements:
+    """Tests for iter_statements streaming SQL splitter."""
+
+    def test_simple_statements(self):
+        """Test splitting on semicolons."""
+        assert split("SELECT 1; SELECT 2;") == ["SELECT 1", "SELECT 2"]
+
+    def test_final_statement_without_semicolon(self):
+        """Test trailing statement without terminator is yielded."""
+        assert split("SELECT 1;\nSELECT 2") == ["SELECT 1", "SELECT 2"]
+
+    def test_semicolon_in_string_literal(self):
+        """Test semicolons inside single-quoted strings are ignored."""
+        assert split("SELECT 'a;b', 'it''s;'; SELECT 2;") == ["SELECT 'a;b', 'it''s;'", "SELECT 2"]
+
+    def test_semicolon_in_quoted_identifier(self):
+        """Test semicolons inside double-quoted identifiers are ignored."""
+        assert split('SELECT "a;b" FROM t;') == ['SELECT "a;b" FROM t']
+
+    def test_semicolon_in_comments(self):
+        """Test semicolons inside line and block comments are ignored."""
+        sql = "-- first; comment\nSELECT 1 /* a; /* nested; */ b */;"
+        assert split(sql) == ["-- first; comment\nSELECT 1 /* a; /* nested; */ b */"]
+
+    def test_dollar_quoted_body(self):
+        """Test semicolons inside dollar-quoted bodies are ignored."""
+        sql = (
+            "DO $$ BEGIN PERFORM 1; END $$;"
+            "CREATE FUNCTION f() RETURNS int AS $fn$ SELECT 1; $fn$ LANGUAGE sql;"
+        )
+        assert split(sql) == [
+            "DO $$ BEGIN PERFORM 1; END $$",
+            "CREATE FUNCTION f() RETURNS int AS $fn$ SELECT 1; $fn$ LANGUAGE sql",
+        ]
+
+    def test_comment_only_statements_skipped(self):
+        """Test empty and comment-only statements are not yielded."""
+        assert split(";;\n-- just a comment;\n/* block */;\n  \n") == []
+
+    def test_small_chunks_match_single_read(self):
+        """Test chunk boundaries do not change the result."""
+        sql = "SELECT $tag$ x; $tag$; -- c;\nSELECT '--;' /* ; */;"
+        expected = split(sql)
+        for chunk_size in (1, 2, 3, 5, 8):
+            assert split(sql, chunk_size=chunk_size) == expected
+
+    def test_schema_file(self):
+        """Test the bundled schema splits into its CREATE/COMMENT statements."""
+        with open(schema_path(), 'r', encoding='utf-8') as f:
+            statements = list(iter_statements(f))
+
+        assert statements
+        assert all(not s.endswith(';') for s in statements)
+        assert any('CREATE TABLE IF NOT EXISTS rate_limits' in s for s in statements)
+
+
+class TestExecuteStatements:
+    """Tests for execute_statements batched execution."""
+
+    def test_single_round_trip_per_batch(self):
+        """Test statements are joined into one execute per batch."""
+        cursor = Mock()
+
+        count = execute_statements(cursor, ["SELECT 1", "SELECT 2", "SELECT 3"], batch_size=2)
+
+        assert count == 3
+        assert cursor.execute.call_count == 2
+        cursor.execute.assert_any_call("SELECT 1\n;\nSELECT 2")
+        cursor.execute.assert_any_call("SELECT 3")
+
+    def test_no_statements(self):
+        """Test nothing is executed for an empty input."""
+        cursor = Mock()
+
+        assert execute_statements(cursor, []) == 0
+        cursor.execute.assert_not_called()
+
+    def test_failed_batch_replays_to_failing_statement(self):
+        """Test a failed batch is replayed in a rolled-back transaction so the failing statement raises."""
+        cursor = MagicMock()
+
+        def execute(sql):
+            if 'BAD' in sql:
+                raise psycopg2.ProgrammingError(sql)
+
+        cursor.execute.side_effect = execute
+
+        with pytest.raises(psycopg2.ProgrammingError) as exc_info:
+            execute_statements(cursor, ["SELECT 1", "BAD", "SELECT 3"])
+
+        assert str(exc_info.value) == "BAD"
+        executed = [c.args[0] for c in cursor.execute.call_args_list]
+        assert executed == ["SELECT 1\n;\nBAD\n;\nSELECT 3", "BEGIN", "SELECT 1", "BAD"]
+        assert "COMMIT" not in executed
+
+        # The replay transaction is rolled back, never committed
+        rollback_cursor = cursor.connection.cursor.return_value.__enter__.return_value
+        rollback_cursor.execute.assert_called_once_with('ROLLBACK')
+
+    def test_failed_batch_replay_commits_nothing(self, clean_db):
+        """Test statements before the failing one are not left applied on a real database."""
+        with clean_db._get_connection() as conn:
+            conn.autocommit = True
+            try:
+                with conn.cursor() as cursor:
+                    with pytest.raises(psycopg2.ProgrammingError):
+                        execute_statements(cursor, [
+                            "CREATE TABLE replay_probe (id integer)",
+                            "INSERT INTO replay_probe VALUES (1)",
+                            "SELECT * FROM no_such_table"
+                        ])
+
+                    assert "no_such_table" in cursor.query.decode()
+                    cursor.execute("SELECT to_regclass('replay_probe')")
+                    assert cursor.fetchone()[0] is None
+            finally:
+                conn.autocommit = False